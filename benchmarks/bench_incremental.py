@@ -0,0 +1,85 @@
+"""Benchmark: incremental (D* Lite) replanning vs fresh A* per replan
+
+A ghost follows its planner one tile per replan while the target either
+stays put (scatter) or random-walks one tile per replan (chase).
+
+Run with: python -m benchmarks.bench_incremental [--replans N] [--sizes 41 81]
+"""
+import argparse
+import random
+import time
+
+from pacman_game.ai.pathfinding import a_star
+from pacman_game.grid import NEIGHBOR_OFFSETS
+from pacman_game.ai.incremental import IncrementalPlanner
+from .mazes import generate_maze, make_level, walkable_tiles
+
+
+def random_step(pos, level, rng):
+    """Move one tile in a random open direction"""
+    options = [(pos[0] + dx, pos[1] + dy) for dx, dy in NEIGHBOR_OFFSETS if not level.is_wall(pos[0] + dx, pos[1] + dy)]
+    return rng.choice(options) if options else pos
+
+
+def bench_scenario(level, replans, seed, target_moves):
+    """
+    Chase a target and count nodes expanded per replan by both planners.
+
+    Returns:
+        dict: Mean expansions and microseconds per replan for each planner
+    """
+    rng = random.Random(seed)
+    tiles = walkable_tiles(level)
+    ghost = rng.choice(tiles)
+    target = rng.choice(tiles)
+    planner = IncrementalPlanner()
+
+    a_star_nodes = 0
+    a_star_time = 0.0
+    planner_time = 0.0
+    stats = {}
+
+    for _ in range(replans):
+        if ghost == target:
+            target = rng.choice(tiles)
+
+        start = time.perf_counter()
+        a_star(ghost, target, level, max_expansions=len(tiles), stats=stats)
+        a_star_time += time.perf_counter() - start
+        a_star_nodes += stats.get('expansions', 0)
+
+        start = time.perf_counter()
+        dx, dy = planner.get_next_direction(ghost, target, level)
+        planner_time += time.perf_counter() - start
+
+        ghost = (ghost[0] + dx, ghost[1] + dy)
+        if target_moves:
+            target = random_step(target, level, rng)
+
+    return {
+        'a_star_nodes': a_star_nodes / replans,
+        'a_star_us': a_star_time * 1e6 / replans,
+        'incremental_nodes': planner.total_expansions / replans,
+        'incremental_us': planner_time * 1e6 / replans,
+        'resets': planner.resets,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--replans', type=int, default=500, help='Replans per scenario')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[41, 81], help='Generated maze sizes')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'maze':<10}{'scenario':<10}{'A* nodes':>10}{'D* nodes':>10}{'A* us':>10}{'D* us':>10}{'resets':>8}")
+    for size in args.sizes:
+        level = make_level(generate_maze(size, size, args.seed))
+        for scenario, target_moves in (('scatter', False), ('chase', True)):
+            r = bench_scenario(level, args.replans, args.seed, target_moves)
+            print(f"{size}x{size:<7}{scenario:<10}{r['a_star_nodes']:>10.1f}{r['incremental_nodes']:>10.1f}"
+                  f"{r['a_star_us']:>10.1f}{r['incremental_us']:>10.1f}{r['resets']:>8}")
+
+
+if __name__ == '__main__':
+    main()
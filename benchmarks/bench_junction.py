@@ -0,0 +1,73 @@
+"""Benchmark: junction graph search vs tile-level A*
+
+Run with: python -m benchmarks.bench_junction [--queries N] [--sizes 41 81 121]
+"""
+import argparse
+import random
+import time
+
+from pacman_game.ai.pathfinding import a_star
+from pacman_game.ai.junction_graph import JunctionGraph
+from .mazes import generate_maze, make_level, walkable_tiles
+
+
+def bench_level(level, queries, seed):
+    """
+    Compare nodes expanded and time per query on random tile pairs.
+
+    Returns:
+        dict: Graph size, build time and per-query cost for both searches
+    """
+    rng = random.Random(seed)
+    tiles = walkable_tiles(level)
+    pairs = [(rng.choice(tiles), rng.choice(tiles)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    graph = JunctionGraph(level)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    stats = {}
+    a_star_nodes = 0
+    start = time.perf_counter()
+    for source, target in pairs:
+        a_star(source, target, level, max_expansions=len(tiles), stats=stats)
+        a_star_nodes += stats.get('expansions', 0)
+    a_star_us = (time.perf_counter() - start) * 1e6 / queries
+
+    graph_nodes = 0
+    start = time.perf_counter()
+    for source, target in pairs:
+        graph.get_next_direction(source, target)
+        graph_nodes += graph.expansions
+    graph_us = (time.perf_counter() - start) * 1e6 / queries
+
+    return {
+        'tiles': len(tiles),
+        'junctions': len(graph.junctions),
+        'build_ms': build_ms,
+        'a_star_nodes': a_star_nodes / queries,
+        'graph_nodes': graph_nodes / queries,
+        'a_star_us': a_star_us,
+        'graph_us': graph_us,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--queries', type=int, default=500, help='Queries per maze')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[41, 81, 121], help='Generated maze sizes')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    levels = [('standard', make_level())]
+    levels += [(f'{size}x{size}', make_level(generate_maze(size, size, args.seed))) for size in args.sizes]
+
+    print(f"{'maze':<10}{'tiles':>7}{'junctions':>11}{'build ms':>10}{'A* nodes':>10}{'graph nodes':>13}{'A* us':>9}{'graph us':>10}")
+    for name, level in levels:
+        r = bench_level(level, args.queries, args.seed)
+        print(f"{name:<10}{r['tiles']:>7}{r['junctions']:>11}{r['build_ms']:>10.1f}{r['a_star_nodes']:>10.1f}"
+              f"{r['graph_nodes']:>13.1f}{r['a_star_us']:>9.1f}{r['graph_us']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark: precomputed next-hop table vs per-call A*
+
+Run with: python -m benchmarks.bench_next_hop [--queries N] [--size N]
+"""
+import argparse
+import random
+import time
+
+from pacman_game.ai.pathfinding import a_star
+from pacman_game.ai.next_hop import NextHopTable
+from .mazes import generate_maze, make_level, walkable_tiles
+
+
+def first_step(start, goal, level):
+    """First step of an A* path, as get_next_direction computed it before the table"""
+    path = a_star(start, goal, level)
+    if path and len(path) > 1:
+        return (path[1][0] - start[0], path[1][1] - start[1])
+    return (0, 0)
+
+
+def bench_level(name, level, queries, seed):
+    """
+    Time table compilation and per-query lookups against A*.
+
+    Returns:
+        dict: Timings in microseconds per query and milliseconds to build
+    """
+    rng = random.Random(seed)
+    tiles = walkable_tiles(level)
+    pairs = [(rng.choice(tiles), rng.choice(tiles)) for _ in range(queries)]
+
+    start = time.perf_counter()
+    table = NextHopTable(level)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for source, target in pairs:
+        first_step(source, target, level)
+    a_star_us = (time.perf_counter() - start) * 1e6 / queries
+
+    start = time.perf_counter()
+    for source, target in pairs:
+        table.get_direction(source, target)
+    table_us = (time.perf_counter() - start) * 1e6 / queries
+
+    return {
+        'name': name,
+        'tiles': len(tiles),
+        'table_bytes': len(table.table),
+        'build_ms': build_ms,
+        'a_star_us': a_star_us,
+        'table_us': table_us,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--queries', type=int, default=2000, help='Lookups per level')
+    parser.add_argument('--size', type=int, default=41, help='Width/height of the generated maze')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    levels = [
+        ('standard', make_level()),
+        (f'generated {args.size}x{args.size}', make_level(generate_maze(args.size, args.size, args.seed))),
+    ]
+
+    print(f"{'level':<20}{'tiles':>7}{'table KB':>10}{'build ms':>10}{'A* us':>10}{'table us':>10}{'speedup':>9}")
+    for name, level in levels:
+        r = bench_level(name, level, args.queries, args.seed)
+        print(f"{r['name']:<20}{r['tiles']:>7}{r['table_bytes'] / 1024:>10.1f}{r['build_ms']:>10.1f}"
+              f"{r['a_star_us']:>10.1f}{r['table_us']:>10.2f}{r['a_star_us'] / r['table_us']:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Level fixtures for benchmarks"""
+import random
+from pacman_game.level import Level
+
+
+def generate_maze(cols, rows, seed=0, loop_fraction=0.1):
+    """
+    Generate a Pac-Man style maze grid (1 = wall, 0 = open).
+
+    Carves a perfect maze with a randomized depth-first search on odd
+    coordinates, then knocks out a fraction of the remaining inner walls so
+    the maze has loops like a real Pac-Man board.
+
+    Args:
+        cols: Grid width (forced odd)
+        rows: Grid height (forced odd)
+        seed: Random seed
+        loop_fraction: Fraction of removable walls to knock out
+
+    Returns:
+        list: Rows of wall flags
+    """
+    cols |= 1
+    rows |= 1
+    rng = random.Random(seed)
+    grid = [[1] * cols for _ in range(rows)]
+
+    stack = [(1, 1)]
+    grid[1][1] = 0
+    while stack:
+        x, y = stack[-1]
+        options = [(dx, dy) for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                   if 0 < x + dx < cols - 1 and 0 < y + dy < rows - 1 and grid[y + dy][x + dx] == 1]
+        if not options:
+            stack.pop()
+            continue
+        dx, dy = rng.choice(options)
+        grid[y + dy // 2][x + dx // 2] = 0
+        grid[y + dy][x + dx] = 0
+        stack.append((x + dx, y + dy))
+
+    # Walls between two open cells along one axis can be removed to make loops
+    removable = [(x, y) for y in range(1, rows - 1) for x in range(1, cols - 1)
+                 if grid[y][x] == 1 and ((x % 2 == 0 and y % 2 == 1) or (x % 2 == 1 and y % 2 == 0))]
+    for x, y in rng.sample(removable, int(len(removable) * loop_fraction)):
+        grid[y][x] = 0
+
+    return grid
+
+
+def make_level(grid=None):
+    """
+    Build a Level, optionally replacing its grid.
+
+    Args:
+        grid: Rows of wall flags, or None for the standard level
+
+    Returns:
+        Level instance
+    """
+    level = Level()
+    if grid is not None:
+        level.grid = grid
+    return level
+
+
+def walkable_tiles(level):
+    """List every open tile of a level as (grid_x, grid_y)"""
+    return [(x, y) for y, row in enumerate(level.grid) for x, cell in enumerate(row) if cell != 1]
@@ -0,0 +1,489 @@
+"""Benchmark suite: time the game's hot paths and compare against a baseline
+
+Every case reports the median and best time per operation over several
+repeats. Results are written as JSON with machine metadata. A saved run
+can be passed back as a baseline, and any case whose median grew by more
+than the threshold counts as a regression (exit status 1).
+
+Run with: python -m benchmarks.suite [--output FILE] [--baseline FILE] [--threshold 0.1] [--filter TEXT] [--quick]
+"""
+import argparse
+import datetime
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+# Rendering cases draw offscreen; Game needs a display but never shows it
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from pacman_game import config
+from pacman_game.ai.ghost_behaviors import GhostBehavior
+from pacman_game.ai.pathfinding import a_star, get_next_direction
+from pacman_game.digest import StateDigest
+from pacman_game.ghosts import Ghost
+from pacman_game.level import PelletManager
+from pacman_game.player import Player
+from pacman_game.simulation import Simulation
+from .mazes import generate_maze, make_level, walkable_tiles
+
+# Size of the generated maze used by the "large" cases
+LARGE_MAZE_SIZE = 81
+
+# Directions the simulated player cycles through
+DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+
+class SkipCase(Exception):
+    """Raised by a case whose requirements (e.g. pygame) are missing"""
+
+
+# (name, setup) in run order; setup(scale) returns (run, ops)
+CASES = []
+
+
+def case(name):
+    """Register a benchmark case under a name"""
+    def register(setup):
+        CASES.append((name, setup))
+        return setup
+    return register
+
+
+def scaled(count, scale):
+    """Operation count of a case at a given scale (at least one)"""
+    return max(1, int(count * scale))
+
+
+def random_pairs(level, count, seed):
+    """Random (start, goal) pairs of open tiles"""
+    rng = random.Random(seed)
+    tiles = walkable_tiles(level)
+    return [(rng.choice(tiles), rng.choice(tiles)) for _ in range(count)]
+
+
+def large_level():
+    """Generated maze for the "large" cases"""
+    return make_level(generate_maze(LARGE_MAZE_SIZE, LARGE_MAZE_SIZE, seed=0))
+
+
+def a_star_case(level, queries):
+    """Uncapped A* over random tile pairs"""
+    pairs = random_pairs(level, queries, seed=1)
+    budget = len(walkable_tiles(level))
+
+    def run():
+        for start, goal in pairs:
+            a_star(start, goal, level, max_expansions=budget)
+    return run, queries
+
+
+def next_direction_case(level, queries):
+    """get_next_direction with the configured strategy over random tile pairs"""
+    # Fresh pairs every repeat so the shared path cache cannot serve them all
+    pairs = itertools.cycle(random_pairs(level, queries * 64, seed=2))
+
+    def run():
+        for _ in range(queries):
+            start, goal = next(pairs)
+            get_next_direction(start, goal, level)
+    return run, queries
+
+
+@case('a_star/small')
+def bench_a_star_small(scale):
+    return a_star_case(make_level(), scaled(200, scale))
+
+
+@case('a_star/large')
+def bench_a_star_large(scale):
+    return a_star_case(large_level(), scaled(20, scale))
+
+
+@case('get_next_direction/small')
+def bench_next_direction_small(scale):
+    level = make_level()
+    # Build any per-level tables outside the timed region
+    get_next_direction((1, 1), (1, 1), level)
+    return next_direction_case(level, scaled(500, scale))
+
+
+@case('get_next_direction/large')
+def bench_next_direction_large(scale):
+    level = large_level()
+    get_next_direction((1, 1), (1, 1), level)
+    return next_direction_case(level, scaled(50, scale))
+
+
+@case('level/is_wall')
+def bench_is_wall(scale):
+    level = make_level()
+    rng = random.Random(3)
+    tiles = [(rng.randrange(-1, config.GRID_COLS + 1), rng.randrange(-1, config.GRID_ROWS + 1))
+             for _ in range(scaled(10000, scale))]
+    is_wall = level.is_wall
+
+    def run():
+        for x, y in tiles:
+            is_wall(x, y)
+    return run, len(tiles)
+
+
+@case('level/can_move_to')
+def bench_can_move_to(scale):
+    level = make_level()
+    rng = random.Random(4)
+    width = config.GRID_COLS * config.TILE_SIZE
+    height = config.GRID_ROWS * config.TILE_SIZE
+    points = [(rng.uniform(0, width), rng.uniform(0, height)) for _ in range(scaled(10000, scale))]
+    radius = config.TILE_SIZE // 2 - config.PLAYER_RADIUS_OFFSET
+    can_move_to = level.can_move_to
+
+    def run():
+        for x, y in points:
+            can_move_to(x, y, radius)
+    return run, len(points)
+
+
+@case('player/update')
+def bench_player_update(scale):
+    level = make_level()
+    player = Player(config.TILE_SIZE, config.TILE_SIZE)
+    frames = scaled(2000, scale)
+    # Turn every 16 frames so both straight runs and turns are covered
+    inputs = [DIRECTIONS[(frame // 16) % len(DIRECTIONS)] for frame in range(frames)]
+
+    def run():
+        for direction in inputs:
+            player.set_next_direction(direction)
+            player.update(level)
+    return run, frames
+
+
+@case('ghost/update')
+def bench_ghost_update(scale):
+    level = make_level()
+    player = Player(config.TILE_SIZE, config.TILE_SIZE)
+    colors = (config.RED, config.PINK, config.CYAN, config.ORANGE)
+    ghosts = [Ghost(config.TILE_SIZE * (9 + i % 2), config.TILE_SIZE * (9 + i // 2), color, ghost_type)
+              for i, (color, ghost_type) in enumerate(zip(colors, ('BLINKY', 'PINKY', 'INKY', 'CLYDE')))]
+    for ghost in ghosts:
+        ghost.behavior = GhostBehavior.SCATTER
+    blinky = ghosts[0]
+    frames = scaled(500, scale)
+
+    def run():
+        for _ in range(frames):
+            for ghost in ghosts:
+                ghost.update(level, player, blinky)
+    # Reported per ghost update
+    return run, frames * len(ghosts)
+
+
+@case('sim/state_digest')
+def bench_state_digest(scale):
+    sim = Simulation()
+    digest = StateDigest()
+    frames = scaled(5000, scale)
+
+    def run():
+        for _ in range(frames):
+            digest(sim)
+    return run, frames
+
+
+def running_simulation():
+    """Simulation a few hundred frames in, with ghosts out and pellets eaten"""
+    sim = Simulation()
+    rng = random.Random(7)
+    for _ in range(600):
+        sim.step(rng.choice(DIRECTIONS))
+    return sim
+
+
+@case('sim/snapshot')
+def bench_snapshot(scale):
+    sim = running_simulation()
+    frames = scaled(5000, scale)
+
+    def run():
+        for _ in range(frames):
+            sim.snapshot()
+    return run, frames
+
+
+@case('sim/restore')
+def bench_restore(scale):
+    sim = running_simulation()
+    snapshot = sim.snapshot()
+    frames = scaled(5000, scale)
+
+    def run():
+        for _ in range(frames):
+            sim.restore(snapshot)
+    return run, frames
+
+
+@case('batch/step')
+def bench_batch_step(scale):
+    try:
+        import numpy as np
+    except ImportError:
+        raise SkipCase("numpy is not installed")
+    from pacman_game.batch import BatchSimulation
+    games = 1024
+    batch = BatchSimulation(games)
+    rng = np.random.default_rng(6)
+    frames = scaled(50, scale)
+    inputs = [rng.integers(0, 5, games, dtype=np.int8) for _ in range(frames)]
+
+    def run():
+        for directions in inputs:
+            batch.step(directions)
+    # Reported per game frame
+    return run, frames * games
+
+
+def require_pygame():
+    """Import the real pygame, or skip the case"""
+    try:
+        import pygame
+    except ImportError:
+        raise SkipCase("pygame is not installed")
+    return pygame
+
+
+@case('game/update')
+def bench_game_update(scale):
+    require_pygame()
+    from pacman_game.game import Game
+    game = Game()
+    sim = game.simulation
+    rng = random.Random(5)
+    frames = scaled(1000, scale)
+    inputs = [rng.choice(DIRECTIONS) for _ in range(frames)]
+
+    def run():
+        for direction in inputs:
+            game.direction_input = direction
+            game.update()
+            if sim.state_machine.is_game_over():
+                game.reset()
+    return run, frames
+
+
+@case('render/level_draw')
+def bench_level_draw(scale):
+    pygame = require_pygame()
+    level = make_level()
+    surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    frames = scaled(20, scale)
+
+    def run():
+        for _ in range(frames):
+            level.draw(surface)
+    return run, frames
+
+
+@case('render/pellet_draw')
+def bench_pellet_draw(scale):
+    pygame = require_pygame()
+    pellets = PelletManager()
+    surface = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    frames = scaled(20, scale)
+
+    def run():
+        for _ in range(frames):
+            pellets.draw(surface)
+    return run, frames
+
+
+def time_case(run, ops, repeat):
+    """
+    Time a case's run function.
+
+    Args:
+        run: Callable performing ops operations
+        ops: Operations per call
+        repeat: Number of timed calls (after one warm-up call)
+
+    Returns:
+        dict: Median/best microseconds per operation and throughput
+    """
+    run()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1e6 / ops)
+
+    median = statistics.median(samples)
+    return {
+        'ops': ops,
+        'repeat': repeat,
+        'median_us': median,
+        'min_us': min(samples),
+        'ops_per_sec': 1e6 / median if median > 0 else None,
+    }
+
+
+def git_revision():
+    """Current commit hash of the working tree, or None"""
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def machine_info():
+    """Metadata describing where and on what code the suite ran"""
+    try:
+        import pygame
+        pygame_version = pygame.version.ver
+    except ImportError:
+        pygame_version = None
+
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'pygame': pygame_version,
+        'pathfinding_strategy': config.PATHFINDING_STRATEGY,
+    }
+
+
+def run_suite(names=None, scale=1, repeat=5, log=None):
+    """
+    Run the registered cases.
+
+    Args:
+        names: Substring filters; a case runs if its name contains any of them
+        scale: Multiplier on each case's operation count
+        repeat: Timed repeats per case
+        log: Optional callable receiving one progress line per case
+
+    Returns:
+        dict: {'machine': metadata, 'results': {case name: timing or skip reason}}
+    """
+    results = {}
+    for name, setup in CASES:
+        if names and not any(text in name for text in names):
+            continue
+        try:
+            run, ops = setup(scale)
+        except SkipCase as reason:
+            results[name] = {'skipped': str(reason)}
+        else:
+            results[name] = time_case(run, ops, repeat)
+        if log:
+            log(format_result(name, results[name]))
+    return {'machine': machine_info(), 'results': results}
+
+
+def format_result(name, result):
+    """One table row for a case result"""
+    if 'skipped' in result:
+        return f"{name:<28}{'skipped: ' + result['skipped']:>40}"
+    return (f"{name:<28}{result['median_us']:>12.3f}{result['min_us']:>12.3f}"
+            f"{result['ops_per_sec']:>16,.0f}")
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare case medians against a baseline run.
+
+    Args:
+        results: Output of run_suite
+        baseline: Earlier output of run_suite (e.g. loaded from JSON)
+        threshold: Allowed relative slowdown (0.1 = 10%)
+
+    Returns:
+        list: (name, baseline_us, current_us, ratio, status) per case,
+            status being 'ok', 'regressed', 'improved', 'new' or 'skipped'
+    """
+    rows = []
+    old_results = baseline.get('results', {})
+    for name, result in results['results'].items():
+        old = old_results.get(name)
+        if 'skipped' in result:
+            rows.append((name, None, None, None, 'skipped'))
+            continue
+        if not old or 'median_us' not in old:
+            rows.append((name, None, result['median_us'], None, 'new'))
+            continue
+
+        ratio = result['median_us'] / old['median_us'] if old['median_us'] > 0 else 1.0
+        if ratio > 1 + threshold:
+            status = 'regressed'
+        elif ratio < 1 / (1 + threshold):
+            status = 'improved'
+        else:
+            status = 'ok'
+        rows.append((name, old['median_us'], result['median_us'], ratio, status))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Relative slowdown of a median that counts as a regression')
+    parser.add_argument('--filter', nargs='+', help='Only run cases whose name contains one of these')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed repeats per case')
+    parser.add_argument('--quick', action='store_true', help='Fewer operations per case (noisier)')
+    parser.add_argument('--list', action='store_true', help='List case names and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, _ in CASES:
+            print(name)
+        return 0
+
+    print(f"{'case':<28}{'median us':>12}{'best us':>12}{'ops/s':>16}")
+    results = run_suite(args.filter, scale=1 if not args.quick else 0.2, repeat=args.repeat, log=print)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline, args.threshold)
+
+    old_machine = baseline.get('machine', {})
+    print(f"\nBaseline: {old_machine.get('git_revision') or 'unknown revision'} "
+          f"({old_machine.get('timestamp', 'unknown time')}, {old_machine.get('platform', 'unknown platform')})")
+    print(f"{'case':<28}{'baseline us':>12}{'current us':>12}{'ratio':>8}  status")
+    for name, old_us, new_us, ratio, status in rows:
+        old_text = f"{old_us:>12.3f}" if old_us is not None else f"{'-':>12}"
+        new_text = f"{new_us:>12.3f}" if new_us is not None else f"{'-':>12}"
+        ratio_text = f"{ratio:>8.2f}" if ratio is not None else f"{'-':>8}"
+        print(f"{name:<28}{old_text}{new_text}{ratio_text}  {status}")
+
+    regressed = [row[0] for row in rows if row[4] == 'regressed']
+    if regressed:
+        print(f"\n{len(regressed)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,13 @@
 """AI module for ghost behaviors and pathfinding"""
-from .pathfinding import a_star, get_next_direction
-from .ghost_behaviors import GhostBehavior, get_target_tile
+from .pathfinding import a_star, get_next_direction, PathCache, path_cache
+from .next_hop import NextHopTable, get_next_hop_table
+from .flow_field import FlowField, FlowFieldCache, flow_fields
+from .incremental import IncrementalPlanner
+from .junction_graph import JunctionGraph, get_junction_graph
+from .ghost_behaviors import GhostBehavior, ModeController, get_target_tile
 
-__all__ = ['a_star', 'get_next_direction', 'GhostBehavior', 'get_target_tile']
+__all__ = ['a_star', 'get_next_direction', 'PathCache', 'path_cache',
+           'NextHopTable', 'get_next_hop_table',
+           'FlowField', 'FlowFieldCache', 'flow_fields', 'IncrementalPlanner',
+           'JunctionGraph', 'get_junction_graph',
+           'GhostBehavior', 'ModeController', 'get_target_tile']
@@ -0,0 +1,158 @@
+"""Shared flow fields (distance maps) so ghosts with the same target share one search"""
+import weakref
+from array import array
+from collections import deque
+from typing import Tuple, Optional
+from ..grid import EXITS, NEIGHBOR_OFFSETS
+
+
+class FlowField:
+    """
+    BFS distance from every tile to a single target tile.
+
+    A ghost anywhere on the level reaches the target by repeatedly stepping
+    to a neighbor whose distance is one lower.
+    """
+
+    def __init__(self, level, target: Tuple[int, int]):
+        """
+        Run one BFS outward from the target.
+
+        Args:
+            level: Level instance for collision detection
+            target: Target tile (grid_x, grid_y), must not be a wall
+        """
+        self.target = target
+        self.revision = level.revision
+        self.rows = len(level.grid)
+        self.cols = len(level.grid[0]) if self.rows else 0
+        self.distances = array('i', [-1]) * (self.rows * self.cols)
+
+        cols = self.cols
+        distances = self.distances
+        exit_mask = level.exit_mask
+
+        distances[target[1] * cols + target[0]] = 0
+        queue = deque([target])
+        while queue:
+            x, y = queue.popleft()
+            next_distance = distances[y * cols + x] + 1
+            mask = exit_mask(x, y)
+            for bit, dx, dy in EXITS:
+                if not mask & bit:
+                    continue
+                nx, ny = x + dx, y + dy
+                index = ny * cols + nx
+                if distances[index] < 0:
+                    distances[index] = next_distance
+                    queue.append((nx, ny))
+
+    def distance(self, pos: Tuple[int, int]) -> int:
+        """
+        Get the path distance from a tile to the target.
+
+        Returns:
+            int: Number of steps, or -1 if unreachable or a wall
+        """
+        x, y = pos
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return self.distances[y * self.cols + x]
+        return -1
+
+    def get_direction(self, current_pos: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Get the downhill step from a tile towards the target.
+
+        Args:
+            current_pos: Current position (grid_x, grid_y)
+
+        Returns:
+            Direction tuple (dx, dy) or (0, 0) if at the target or unreachable
+        """
+        current = self.distance(current_pos)
+        if current <= 0:
+            return (0, 0)
+
+        x, y = current_pos
+        for dx, dy in NEIGHBOR_OFFSETS:
+            if self.distance((x + dx, y + dy)) == current - 1:
+                return (dx, dy)
+        return (0, 0)
+
+
+class FlowFieldCache:
+    """
+    Flow fields per (level, target), shared by every ghost in a replan cycle.
+
+    Call begin_cycle() once per simulation tick. Fields that were not used
+    during the previous cycle are dropped, so the cache only holds the
+    handful of targets the ghosts are currently heading for.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache"""
+        self._fields = weakref.WeakKeyDictionary()
+        self._used = weakref.WeakKeyDictionary()
+        self.builds = 0
+        self.lookups = 0
+
+    def begin_cycle(self):
+        """Start a replan cycle, evicting fields unused in the last one"""
+        for level, fields in self._fields.items():
+            used = self._used.get(level, set())
+            for target in [t for t in fields if t not in used]:
+                del fields[target]
+        self._used.clear()
+
+    def get_field(self, level, target: Tuple[int, int]) -> Optional[FlowField]:
+        """
+        Get the flow field towards a target, building it on first use.
+
+        Args:
+            level: Level instance
+            target: Target tile (grid_x, grid_y)
+
+        Returns:
+            FlowField, or None if the target is a wall or out of bounds
+        """
+        if level.is_wall(target[0], target[1]):
+            return None
+
+        self.lookups += 1
+        fields = self._fields.setdefault(level, {})
+        self._used.setdefault(level, set()).add(target)
+
+        field = fields.get(target)
+        if field is None or field.revision != level.revision:
+            field = FlowField(level, target)
+            fields[target] = field
+            self.builds += 1
+        return field
+
+    def get_direction(self, current_pos: Tuple[int, int], target_pos: Tuple[int, int], level) -> Tuple[int, int]:
+        """
+        Get the next direction towards a target via its shared flow field.
+
+        Args:
+            current_pos: Current position (grid_x, grid_y)
+            target_pos: Target position (grid_x, grid_y)
+            level: Level instance for collision detection
+
+        Returns:
+            Direction tuple (dx, dy) or (0, 0) if no path
+        """
+        field = self.get_field(level, target_pos)
+        if field is None:
+            return (0, 0)
+        return field.get_direction(current_pos)
+
+    def clear(self):
+        """Drop every cached field and reset counters"""
+        self._fields.clear()
+        self._used.clear()
+        self.builds = 0
+        self.lookups = 0
+
+
+# Shared cache used by get_next_direction when PATHFINDING_STRATEGY is "flow_field"
+flow_fields = FlowFieldCache()
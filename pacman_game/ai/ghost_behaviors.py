@@ -1,4 +1,4 @@
-"""Ghost behavior states and targeting logic"""
+"""Ghost behavior states, targeting logic and the global mode schedule"""
 from enum import Enum, auto
 from typing import Tuple
 from .. import config
@@ -100,3 +100,108 @@ def get_target_tile(ghost_type: str, behavior: GhostBehavior, ghost_pos: Tuple[i
     
     # Default fallback
     return player_pos
+
+
+def mode_schedule(level_number, schedules=None):
+    """
+    Get the scatter/chase phase lengths for a level.
+    
+    Args:
+        level_number: Current level
+        schedules: Phase lengths per starting level number (defaults to
+            config.GHOST_MODE_SCHEDULES)
+        
+    Returns:
+        tuple: Durations in frames from the entry with the highest
+        starting level not above level_number, or the current
+        (config.SCATTER_DURATION, config.CHASE_DURATION) if there is none
+    """
+    if schedules is None:
+        schedules = config.GHOST_MODE_SCHEDULES
+    first_levels = [first for first in schedules if first <= level_number]
+    if not first_levels:
+        return (config.SCATTER_DURATION, config.CHASE_DURATION)
+    return schedules[max(first_levels)]
+
+
+class ModeController:
+    """
+    Global scatter/chase schedule shared by all ghosts.
+    
+    One timer event per phase change replaces a per-ghost frame counter,
+    and every active ghost switches on the same frame, so ghosts released
+    at different times stay in phase. Ghosts are told about a change
+    through enter_mode(), which also flags them to replan.
+    """
+    
+    def __init__(self, timers, schedules=None):
+        """
+        Initialize the controller.
+        
+        Args:
+            timers: TimerWheel the phase changes are scheduled on
+            schedules: Phase lengths per starting level number (defaults to
+                config.GHOST_MODE_SCHEDULES)
+        """
+        self.timers = timers
+        self.schedules = schedules if schedules is not None else config.GHOST_MODE_SCHEDULES
+        self.schedule = ()
+        self.level_number = 1
+        self.phase = GhostBehavior.SCATTER
+        self.phase_index = 0
+        self.event = None
+        self.ghosts = []
+        self.phase_changes = 0
+    
+    def schedule_for_level(self, level_number):
+        """Get the phase lengths for a level (see mode_schedule)"""
+        return mode_schedule(level_number, self.schedules)
+    
+    def start(self, level_number, ghosts):
+        """
+        Restart the schedule from its first scatter phase.
+        
+        Args:
+            level_number: Current level (selects the schedule)
+            ghosts: Ghosts that follow the schedule
+        """
+        self.timers.cancel(self.event)
+        self.ghosts = ghosts
+        self.level_number = level_number
+        self.schedule = self.schedule_for_level(level_number)
+        self.phase_index = 0
+        self.phase = GhostBehavior.SCATTER
+        self.broadcast()
+        self.schedule_phase_end()
+    
+    def stop(self):
+        """Cancel the pending phase change"""
+        self.timers.cancel(self.event)
+        self.event = None
+    
+    def schedule_phase_end(self):
+        """Schedule the end of the current phase (none if it lasts forever)"""
+        self.event = None
+        if not self.schedule:
+            return
+        duration = self.schedule[self.phase_index % len(self.schedule)]
+        if duration is not None:
+            self.event = self.timers.schedule(duration, self.on_phase_end)
+    
+    def on_phase_end(self):
+        """Timer callback: move to the next phase and tell the ghosts"""
+        self.phase_index += 1
+        self.phase = GhostBehavior.CHASE if self.phase == GhostBehavior.SCATTER else GhostBehavior.SCATTER
+        self.phase_changes += 1
+        self.broadcast()
+        self.schedule_phase_end()
+    
+    def broadcast(self):
+        """Put every ghost that is scattering or chasing into the current phase"""
+        for ghost in self.ghosts:
+            ghost.enter_mode(self.phase)
+    
+    def release(self, ghost):
+        """Let a ghost out of the house in the current phase"""
+        ghost.behavior = self.phase
+        ghost.enter_mode(self.phase)
@@ -0,0 +1,198 @@
+"""Incremental replanning (D* Lite) for ghosts chasing a moving target"""
+import heapq
+from typing import Tuple, Optional
+from .. import config
+from ..grid import EXITS
+
+INF = float('inf')
+
+
+class IncrementalPlanner:
+    """
+    D* Lite planner that repairs its previous search instead of starting over.
+
+    The search runs backward from the goal, so when the ghost (start) moves
+    only the key modifier km changes and most g-values stay valid. A goal
+    move is treated as an edge-cost change: the old goal loses its zero
+    rhs, the new goal gains one, and only the affected region is
+    re-expanded. Goal jumps larger than config.INCREMENTAL_MAX_GOAL_SHIFT
+    tiles (or a changed level) restart the search from scratch.
+
+    One planner should be owned per ghost (or per target).
+    """
+
+    def __init__(self, max_goal_shift: Optional[int] = None):
+        """
+        Initialize an empty planner.
+
+        Args:
+            max_goal_shift: Largest goal move (Manhattan tiles) that is
+                repaired rather than replanned. Defaults to
+                config.INCREMENTAL_MAX_GOAL_SHIFT.
+        """
+        if max_goal_shift is None:
+            max_goal_shift = config.INCREMENTAL_MAX_GOAL_SHIFT
+        self.max_goal_shift = max_goal_shift
+
+        self.level = None
+        self.revision = None
+        self._neighbors = {}
+        self.start = None
+        self.goal = None
+
+        # Expansions of the last replan and running totals
+        self.expansions = 0
+        self.total_expansions = 0
+        self.replans = 0
+        self.resets = 0
+
+    def reset(self, level, start: Tuple[int, int], goal: Tuple[int, int]):
+        """Throw away all search state and seed a fresh search"""
+        if self.level is not level or self.revision != level.revision:
+            self._neighbors = {}
+        self.level = level
+        self.revision = level.revision
+        self.start = start
+        self.goal = goal
+        self.km = 0
+        self.g = {}
+        self.rhs = {goal: 0}
+        self.open_keys = {}
+        self.open_heap = []
+        self._push(goal, (self._h(goal), 0))
+        self.resets += 1
+
+    def _get_neighbors(self, node: Tuple[int, int]):
+        """Open neighbors of a node, cached for the lifetime of the level revision"""
+        neighbors = self._neighbors.get(node)
+        if neighbors is None:
+            x, y = node
+            mask = self.level.exit_mask(x, y)
+            neighbors = tuple((x + dx, y + dy) for bit, dx, dy in EXITS if mask & bit)
+            self._neighbors[node] = neighbors
+        return neighbors
+
+    def _h(self, node: Tuple[int, int]) -> int:
+        """Manhattan distance from the current start"""
+        return abs(node[0] - self.start[0]) + abs(node[1] - self.start[1])
+
+    def _key(self, node: Tuple[int, int]):
+        """D* Lite priority key of a node"""
+        best = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        return (best + self._h(node) + self.km, best)
+
+    def _push(self, node: Tuple[int, int], key):
+        """Insert or re-key a node in the open list (stale heap entries are skipped)"""
+        self.open_keys[node] = key
+        heapq.heappush(self.open_heap, (key, node))
+        # Rebuild the heap once stale entries dominate it
+        if len(self.open_heap) > 4 * len(self.open_keys) + 64:
+            self.open_heap = [(k, n) for n, k in self.open_keys.items()]
+            heapq.heapify(self.open_heap)
+
+    def _top_key(self):
+        """Smallest valid key in the open list, discarding stale heap entries"""
+        heap = self.open_heap
+        while heap:
+            key, node = heap[0]
+            if self.open_keys.get(node) == key:
+                return key
+            heapq.heappop(heap)
+        return (INF, INF)
+
+    def _update_vertex(self, node: Tuple[int, int]):
+        """Recompute a node's rhs and its membership in the open list"""
+        g = self.g
+        if node != self.goal:
+            best = INF
+            for neighbor in self._get_neighbors(node):
+                cost = g.get(neighbor, INF) + 1
+                if cost < best:
+                    best = cost
+            self.rhs[node] = best
+
+        self.open_keys.pop(node, None)
+        if g.get(node, INF) != self.rhs.get(node, INF):
+            self._push(node, self._key(node))
+
+    def _compute_shortest_path(self):
+        """Expand inconsistent nodes until the start is consistent"""
+        g = self.g
+        rhs = self.rhs
+        expansions = 0
+
+        while True:
+            top = self._top_key()
+            start_key = self._key(self.start)
+            if not (top < start_key or rhs.get(self.start, INF) != g.get(self.start, INF)):
+                break
+            if top[0] == INF:
+                break
+
+            _, node = heapq.heappop(self.open_heap)
+            del self.open_keys[node]
+
+            new_key = self._key(node)
+            if top < new_key:
+                self._push(node, new_key)
+                continue
+
+            expansions += 1
+
+            neighbors = self._get_neighbors(node)
+            if g.get(node, INF) > rhs.get(node, INF):
+                g[node] = rhs[node]
+            else:
+                g[node] = INF
+                self._update_vertex(node)
+            for neighbor in neighbors:
+                self._update_vertex(neighbor)
+
+        self.expansions = expansions
+        self.total_expansions += expansions
+        self.replans += 1
+
+    def get_next_direction(self, current_pos: Tuple[int, int], target_pos: Tuple[int, int], level) -> Tuple[int, int]:
+        """
+        Get the next direction towards target, repairing the previous search.
+
+        Args:
+            current_pos: Current position (grid_x, grid_y)
+            target_pos: Target position (grid_x, grid_y)
+            level: Level instance for collision detection
+
+        Returns:
+            Direction tuple (dx, dy) or (0, 0) if no path
+        """
+        if level.is_wall(current_pos[0], current_pos[1]) or level.is_wall(target_pos[0], target_pos[1]):
+            return (0, 0)
+
+        if (self.level is not level or self.revision != level.revision or
+                abs(target_pos[0] - self.goal[0]) + abs(target_pos[1] - self.goal[1]) > self.max_goal_shift):
+            self.reset(level, current_pos, target_pos)
+        else:
+            if current_pos != self.start:
+                # Start moved: bump km instead of re-keying the open list
+                self.km += self._h(current_pos)
+                self.start = current_pos
+            if target_pos != self.goal:
+                # Goal moved: the old goal loses its zero rhs, the new one gains it
+                old_goal = self.goal
+                self.goal = target_pos
+                self.rhs[target_pos] = 0
+                self._update_vertex(old_goal)
+                self._update_vertex(target_pos)
+
+        self._compute_shortest_path()
+
+        if current_pos == target_pos or self.g.get(current_pos, INF) == INF:
+            return (0, 0)
+
+        # Step to the neighbor with the lowest cost-to-goal
+        best_neighbor = current_pos
+        best_cost = INF
+        for neighbor in self._get_neighbors(current_pos):
+            cost = self.g.get(neighbor, INF)
+            if cost < best_cost:
+                best_neighbor, best_cost = neighbor, cost
+        return (best_neighbor[0] - current_pos[0], best_neighbor[1] - current_pos[1])
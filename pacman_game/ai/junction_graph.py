@@ -0,0 +1,232 @@
+"""Junction graph compilation of a Level for corridor-level pathfinding"""
+import heapq
+import weakref
+from typing import Tuple
+from ..grid import NEIGHBOR_OFFSETS
+
+# Compiled graph per Level, rebuilt when the level revision changes
+_graphs = weakref.WeakKeyDictionary()
+
+
+class Segment:
+    """A corridor of two-exit tiles between two junctions"""
+
+    def __init__(self, start_junction, tiles, end_junction):
+        """
+        Args:
+            start_junction: Junction tile at the start of the corridor
+            tiles: Corridor tiles in order from start_junction to end_junction
+            end_junction: Junction tile at the end of the corridor
+        """
+        self.start_junction = start_junction
+        self.tiles = tiles
+        self.end_junction = end_junction
+        self.length = len(tiles) + 1  # Steps from one junction to the other
+
+    def step_towards_start(self, index: int) -> Tuple[int, int]:
+        """Direction from tiles[index] one step towards start_junction"""
+        tile = self.tiles[index]
+        previous = self.tiles[index - 1] if index > 0 else self.start_junction
+        return (previous[0] - tile[0], previous[1] - tile[1])
+
+    def step_towards_end(self, index: int) -> Tuple[int, int]:
+        """Direction from tiles[index] one step towards end_junction"""
+        tile = self.tiles[index]
+        following = self.tiles[index + 1] if index + 1 < len(self.tiles) else self.end_junction
+        return (following[0] - tile[0], following[1] - tile[1])
+
+
+class JunctionGraph:
+    """
+    Level reduced to a weighted graph of junctions and corridor segments.
+
+    Junctions are walkable tiles with other than two exits (dead ends,
+    T-junctions, crossings); everything else is a corridor tile belonging
+    to exactly one segment. Searches run over junctions only, so their size
+    depends on the number of decision points rather than on tile count.
+    """
+
+    def __init__(self, level):
+        """
+        Compile the graph for a level.
+
+        Args:
+            level: Level instance providing grid and is_wall
+        """
+        self.revision = level.revision
+        self.exits = {}
+        for y, row in enumerate(level.grid):
+            for x in range(len(row)):
+                if not level.is_wall(x, y):
+                    self.exits[(x, y)] = tuple((dx, dy) for dx, dy in NEIGHBOR_OFFSETS
+                                               if not level.is_wall(x + dx, y + dy))
+
+        self.junctions = {tile for tile, exits in self.exits.items() if len(exits) != 2}
+        # Junction -> list of (neighbor junction, cost, direction leaving the junction)
+        self.edges = {}
+        # Corridor tile -> (segment, index along segment)
+        self.corridor = {}
+        self.segments = []
+
+        self._trace_segments()
+
+        # Loops made only of two-exit tiles have no junction; promote one tile
+        for tile in self.exits:
+            if tile not in self.junctions and tile not in self.corridor:
+                self.junctions.add(tile)
+                self._trace_segments()
+
+        # Last search statistics
+        self.expansions = 0
+
+    def _trace_segments(self):
+        """Walk every untraced corridor leaving a junction"""
+        for junction in list(self.junctions):
+            self.edges.setdefault(junction, [])
+            for direction in self.exits[junction]:
+                if any(edge[2] == direction for edge in self.edges[junction]):
+                    continue
+                self._trace(junction, direction)
+
+    def _trace(self, junction, direction):
+        """Follow a corridor from a junction until the next junction"""
+        tiles = []
+        previous = junction
+        current = (junction[0] + direction[0], junction[1] + direction[1])
+        while current not in self.junctions:
+            tiles.append(current)
+            # Leave through the exit that does not lead back
+            for dx, dy in self.exits[current]:
+                following = (current[0] + dx, current[1] + dy)
+                if following != previous:
+                    break
+            previous, current = current, following
+
+        segment = Segment(junction, tiles, current)
+        self.segments.append(segment)
+        for index, tile in enumerate(tiles):
+            self.corridor[tile] = (segment, index)
+
+        back_direction = (previous[0] - current[0], previous[1] - current[1])
+        self.edges[junction].append((current, segment.length, direction))
+        if current != junction or back_direction != direction:
+            self.edges.setdefault(current, []).append((junction, segment.length, back_direction))
+
+    def is_junction(self, pos: Tuple[int, int]) -> bool:
+        """Check if a tile is a decision point"""
+        return pos in self.junctions
+
+    def _anchors(self, pos):
+        """
+        Junctions reachable from a tile without passing another junction.
+
+        Returns:
+            list: (junction, cost, first direction from pos) tuples
+        """
+        if pos in self.junctions:
+            return [(pos, 0, None)]
+        segment, index = self.corridor[pos]
+        return [
+            (segment.start_junction, index + 1, segment.step_towards_start(index)),
+            (segment.end_junction, segment.length - index - 1, segment.step_towards_end(index)),
+        ]
+
+    def get_next_direction(self, current_pos: Tuple[int, int], target_pos: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Get the first step of a shortest path, searching over junctions only.
+
+        Args:
+            current_pos: Current position (grid_x, grid_y)
+            target_pos: Target position (grid_x, grid_y)
+
+        Returns:
+            Direction tuple (dx, dy) or (0, 0) if no path
+        """
+        self.expansions = 0
+        if current_pos not in self.exits or target_pos not in self.exits or current_pos == target_pos:
+            return (0, 0)
+
+        best_cost = float('inf')
+        best_direction = (0, 0)
+
+        # Start and goal on the same corridor: walking straight there is a candidate
+        if current_pos in self.corridor and target_pos in self.corridor:
+            segment, index = self.corridor[current_pos]
+            target_segment, target_index = self.corridor[target_pos]
+            if segment is target_segment:
+                best_cost = abs(target_index - index)
+                if target_index < index:
+                    best_direction = segment.step_towards_start(index)
+                else:
+                    best_direction = segment.step_towards_end(index)
+
+        # Cost from each junction next to the goal to the goal itself
+        goal_costs = {}
+        for junction, cost, _ in self._anchors(target_pos):
+            goal_costs[junction] = min(cost, goal_costs.get(junction, cost))
+
+        goal_x, goal_y = target_pos
+        g_scores = {}
+        counter = 0
+        open_set = []
+        for junction, cost, direction in self._anchors(current_pos):
+            if cost < g_scores.get(junction, float('inf')):
+                g_scores[junction] = cost
+                h = abs(junction[0] - goal_x) + abs(junction[1] - goal_y)
+                counter += 1
+                heapq.heappush(open_set, (cost + h, counter, cost, junction, direction))
+
+        while open_set:
+            f_score, _, g_score, junction, first_direction = heapq.heappop(open_set)
+            if f_score >= best_cost:
+                break
+            if g_score > g_scores[junction]:
+                continue
+            self.expansions += 1
+
+            if junction in goal_costs and g_score + goal_costs[junction] < best_cost:
+                best_cost = g_score + goal_costs[junction]
+                best_direction = first_direction
+                if best_direction is None:
+                    # Goal is on a corridor leaving the start junction
+                    segment, index = self.corridor[target_pos]
+                    if segment.start_junction == junction and index + 1 == goal_costs[junction]:
+                        best_direction = self._leaving_direction(junction, segment.tiles[0])
+                    else:
+                        best_direction = self._leaving_direction(junction, segment.tiles[-1])
+
+            for neighbor, cost, direction in self.edges[junction]:
+                neighbor_g = g_score + cost
+                if neighbor_g < g_scores.get(neighbor, float('inf')):
+                    g_scores[neighbor] = neighbor_g
+                    h = abs(neighbor[0] - goal_x) + abs(neighbor[1] - goal_y)
+                    counter += 1
+                    heapq.heappush(open_set, (neighbor_g + h, counter, neighbor_g, neighbor,
+                                              first_direction or direction))
+
+        return best_direction
+
+    @staticmethod
+    def _leaving_direction(junction, tile):
+        """Direction from a junction to an adjacent tile"""
+        return (tile[0] - junction[0], tile[1] - junction[1])
+
+
+def get_junction_graph(level) -> JunctionGraph:
+    """
+    Get the junction graph for a level, compiling it on first use.
+
+    The graph is rebuilt whenever level.revision changes (see
+    Level.invalidate).
+
+    Args:
+        level: Level instance
+
+    Returns:
+        JunctionGraph
+    """
+    graph = _graphs.get(level)
+    if graph is None or graph.revision != level.revision:
+        graph = JunctionGraph(level)
+        _graphs[level] = graph
+    return graph
@@ -0,0 +1,131 @@
+"""Precomputed all-pairs next-hop table for O(1) ghost navigation"""
+import weakref
+from array import array
+from collections import deque
+from typing import Tuple, Optional
+from .. import config
+
+# Direction codes stored in the table (0 = no move / unreachable)
+DIRECTIONS = [(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)]
+# Code of the step that undoes each direction code
+REVERSE_CODES = [0, 2, 1, 4, 3]
+
+# (revision, table) per Level, compiled once and dropped with the level
+_tables = weakref.WeakKeyDictionary()
+
+
+class NextHopTable:
+    """
+    First step of a shortest path between every pair of walkable tiles.
+
+    Built with one BFS per walkable tile. Each BFS runs outward from a
+    target, so the tile a node was discovered from is its next hop towards
+    that target. Codes are stored in a flat bytearray indexed by
+    target * tile_count + source.
+    """
+
+    def __init__(self, level):
+        """
+        Compile the table for a level.
+
+        Args:
+            level: Level instance providing grid and is_wall
+        """
+        self.revision = level.revision
+        self.rows = len(level.grid)
+        self.cols = len(level.grid[0]) if self.rows else 0
+
+        # Map every tile to a compact walkable index (-1 for walls)
+        self.index = array('i', [-1]) * (self.rows * self.cols)
+        self.tiles = []
+        for y in range(self.rows):
+            for x in range(self.cols):
+                if not level.is_wall(x, y):
+                    self.index[y * self.cols + x] = len(self.tiles)
+                    self.tiles.append((x, y))
+
+        self.tile_count = len(self.tiles)
+        self.table = bytearray(self.tile_count * self.tile_count)
+        self._build()
+
+    def _build(self):
+        """Run a BFS from every walkable tile and record next hops"""
+        count = self.tile_count
+        cols = self.cols
+        index = self.index
+        table = self.table
+
+        # Neighbor indices per walkable tile, paired with the code of the step back
+        neighbors = []
+        for x, y in self.tiles:
+            adjacent = []
+            for code in range(1, 5):
+                dx, dy = DIRECTIONS[code]
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < cols and 0 <= ny < self.rows:
+                    n = index[ny * cols + nx]
+                    if n >= 0:
+                        adjacent.append((n, REVERSE_CODES[code]))
+            neighbors.append(adjacent)
+
+        for target in range(count):
+            base = target * count
+            visited = bytearray(count)
+            visited[target] = 1
+            queue = deque([target])
+            while queue:
+                current = queue.popleft()
+                for neighbor, step_back in neighbors[current]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        # From the neighbor, step back towards current
+                        table[base + neighbor] = step_back
+                        queue.append(neighbor)
+
+    def _tile_index(self, pos: Tuple[int, int]) -> int:
+        """Compact index of a tile, or -1 if it is a wall or out of bounds"""
+        x, y = pos
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return self.index[y * self.cols + x]
+        return -1
+
+    def get_direction(self, current_pos: Tuple[int, int], target_pos: Tuple[int, int]) -> Tuple[int, int]:
+        """
+        Get the first step of a shortest path from current_pos to target_pos.
+
+        Args:
+            current_pos: Current position (grid_x, grid_y)
+            target_pos: Target position (grid_x, grid_y)
+
+        Returns:
+            Direction tuple (dx, dy) or (0, 0) if no path
+        """
+        source = self._tile_index(current_pos)
+        target = self._tile_index(target_pos)
+        if source < 0 or target < 0:
+            return (0, 0)
+        return DIRECTIONS[self.table[target * self.tile_count + source]]
+
+
+def get_next_hop_table(level) -> Optional[NextHopTable]:
+    """
+    Get the next-hop table for a level, compiling it on first use.
+
+    The table is rebuilt whenever level.revision changes (see
+    Level.invalidate).
+
+    Args:
+        level: Level instance
+
+    Returns:
+        NextHopTable, or None if the level has more than
+        config.NEXT_HOP_MAX_TILES walkable tiles
+    """
+    cached = _tables.get(level)
+    if cached is not None and cached[0] == level.revision:
+        return cached[1]
+
+    walkable = sum(1 for row in level.grid for cell in row if cell != 1)
+    table = NextHopTable(level) if walkable <= config.NEXT_HOP_MAX_TILES else None
+    _tables[level] = (level.revision, table)
+    return table
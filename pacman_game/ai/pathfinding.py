@@ -1,6 +1,12 @@
 """A* pathfinding algorithm for ghost navigation"""
 import heapq
+from collections import OrderedDict
 from typing import Tuple, List, Optional
+from .. import config
+from ..grid import EXITS
+from .next_hop import get_next_hop_table
+from .flow_field import flow_fields
+from .junction_graph import get_junction_graph
 
 
 def heuristic(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
@@ -29,81 +35,229 @@ def get_neighbors(pos: Tuple[int, int], level) -> List[Tuple[int, int]]:
         List of valid neighbor positions
     """
     x, y = pos
-    neighbors = []
-    
-    # Check all four directions
-    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-        new_x, new_y = x + dx, y + dy
-        if not level.is_wall(new_x, new_y):
-            neighbors.append((new_x, new_y))
+    mask = level.exit_mask(x, y)
+    return [(x + dx, y + dy) for bit, dx, dy in EXITS if mask & bit]
+
+
+def reconstruct_path(parents: dict, node: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """
+    Walk parent pointers back from node to the search start.
     
-    return neighbors
+    Args:
+        parents: Map of position -> parent position (start maps to None)
+        node: Final position of the path
+        
+    Returns:
+        List of positions from start to node
+    """
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
 
 
-def a_star(start: Tuple[int, int], goal: Tuple[int, int], level) -> Optional[List[Tuple[int, int]]]:
+def a_star(start: Tuple[int, int], goal: Tuple[int, int], level,
+           max_expansions: Optional[int] = None, partial: bool = False,
+           stats: Optional[dict] = None) -> Optional[List[Tuple[int, int]]]:
     """
     A* pathfinding algorithm.
     
+    Keeps one parent pointer and best-known g-score per node, skips stale
+    heap entries, and only builds the path once the goal is reached.
+    
     Args:
         start: Starting position (grid_x, grid_y)
         goal: Goal position (grid_x, grid_y)
         level: Level instance for collision detection
+        max_expansions: Node expansion budget. Defaults to
+            config.PATHFINDING_MAX_EXPANSIONS; None there means unlimited.
+        partial: If the budget runs out, return the path to the discovered
+            node closest to the goal instead of None
+        stats: Optional dict; receives the node count under 'expansions'
         
     Returns:
         List of positions from start to goal, or None if no path exists
+        (or the budget ran out and partial is False)
     """
     # If start or goal is a wall, return None
     if level.is_wall(start[0], start[1]) or level.is_wall(goal[0], goal[1]):
         return None
     
-    # Priority queue: (f_score, counter, position, path)
+    if max_expansions is None:
+        max_expansions = config.PATHFINDING_MAX_EXPANSIONS
+    
+    exit_mask = level.exit_mask
+    goal_x, goal_y = goal
+    
+    g_scores = {start: 0}
+    parents = {start: None}
+    best_node = start
+    best_h = heuristic(start, goal)
+    
+    # Priority queue: (f_score, counter, g_score, position)
     counter = 0
-    open_set = [(0, counter, start, [start])]
-    closed_set = set()
+    open_set = [(best_h, counter, 0, start)]
+    expansions = 0
     
     while open_set:
-        f_score, _, current, path = heapq.heappop(open_set)
+        _, _, g_score, current = heapq.heappop(open_set)
         
         # Goal reached
         if current == goal:
-            return path
+            if stats is not None:
+                stats['expansions'] = expansions
+            return reconstruct_path(parents, current)
         
-        # Skip if already visited
-        if current in closed_set:
+        # Skip stale entries superseded by a cheaper route
+        if g_score > g_scores[current]:
             continue
         
-        closed_set.add(current)
+        if max_expansions is not None and expansions >= max_expansions:
+            if stats is not None:
+                stats['expansions'] = expansions
+            return reconstruct_path(parents, best_node) if partial else None
+        expansions += 1
         
         # Explore neighbors
-        for neighbor in get_neighbors(current, level):
-            if neighbor in closed_set:
+        x, y = current
+        neighbor_g = g_score + 1
+        mask = exit_mask(x, y)
+        for bit, dx, dy in EXITS:
+            if not mask & bit:
                 continue
             
-            new_path = path + [neighbor]
-            g_score = len(new_path) - 1  # Cost from start
-            h_score = heuristic(neighbor, goal)  # Estimated cost to goal
-            f_score = g_score + h_score
-            
-            counter += 1
-            heapq.heappush(open_set, (f_score, counter, neighbor, new_path))
+            nx, ny = x + dx, y + dy
+            neighbor = (nx, ny)
+            if neighbor_g < g_scores.get(neighbor, neighbor_g + 1):
+                g_scores[neighbor] = neighbor_g
+                parents[neighbor] = current
+                h_score = abs(nx - goal_x) + abs(ny - goal_y)
+                if h_score < best_h:
+                    best_node, best_h = neighbor, h_score
+                
+                counter += 1
+                heapq.heappush(open_set, (neighbor_g + h_score, counter, neighbor_g, neighbor))
     
     # No path found
+    if stats is not None:
+        stats['expansions'] = expansions
     return None
 
 
-def get_next_direction(current_pos: Tuple[int, int], target_pos: Tuple[int, int], level) -> Tuple[int, int]:
+class PathCache:
     """
-    Get the next direction to move towards target using A*.
+    Bounded LRU cache of A* results keyed on (start, goal, level revision).
+    
+    Level revisions are unique across levels and change whenever a grid is
+    edited, so stale paths are never returned after Level.invalidate().
+    """
+    
+    # Returned by get() when the key is not cached (None is a valid "no path")
+    MISS = object()
+    
+    def __init__(self, max_size: Optional[int] = None):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_size: Maximum number of cached paths (None = follow
+                config.PATH_CACHE_SIZE, read on every insert)
+        """
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @property
+    def max_size(self) -> int:
+        """Current size limit"""
+        return self._max_size if self._max_size is not None else config.PATH_CACHE_SIZE
+    
+    def get(self, start: Tuple[int, int], goal: Tuple[int, int], revision: int):
+        """
+        Look up a cached path.
+        
+        Returns:
+            Cached path (tuple of positions or None), or PathCache.MISS
+        """
+        key = (start, goal, revision)
+        path = self._entries.get(key, self.MISS)
+        if path is self.MISS:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return path
+    
+    def put(self, start: Tuple[int, int], goal: Tuple[int, int], revision: int, path):
+        """Store a path, evicting the least recently used entry if full"""
+        max_size = self.max_size
+        if max_size <= 0:
+            return
+        key = (start, goal, revision)
+        self._entries[key] = tuple(path) if path is not None else None
+        self._entries.move_to_end(key)
+        # A loop, since the configured size may have shrunk since the last insert
+        while len(self._entries) > max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        """Drop all entries and reset counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared cache consulted by get_next_direction before running A*
+path_cache = PathCache()
+
+
+def get_next_direction(current_pos: Tuple[int, int], target_pos: Tuple[int, int], level,
+                       planner=None) -> Tuple[int, int]:
+    """
+    Get the next direction to move towards target.
+    
+    The search depends on config.PATHFINDING_STRATEGY:
+    "next_hop" looks up the level's precomputed next-hop table (if the level
+    is small enough for one), "flow_field" walks downhill on a flow field
+    shared by every ghost with the same target, "junction" searches the
+    level's junction graph, and anything else runs A*
+    through the shared LRU path cache. A caller-owned planner (e.g. an
+    IncrementalPlanner) takes precedence over all of these.
     
     Args:
         current_pos: Current position (grid_x, grid_y)
         target_pos: Target position (grid_x, grid_y)
         level: Level instance for collision detection
+        planner: Optional planner object with a get_next_direction method
         
     Returns:
         Direction tuple (dx, dy) or (0, 0) if no path
     """
-    path = a_star(current_pos, target_pos, level)
+    if planner is not None:
+        return planner.get_next_direction(current_pos, target_pos, level)
+    
+    if config.PATHFINDING_STRATEGY == "next_hop":
+        table = get_next_hop_table(level)
+        if table is not None:
+            return table.get_direction(current_pos, target_pos)
+    elif config.PATHFINDING_STRATEGY == "flow_field":
+        return flow_fields.get_direction(current_pos, target_pos, level)
+    elif config.PATHFINDING_STRATEGY == "junction":
+        return get_junction_graph(level).get_next_direction(current_pos, target_pos)
+    
+    path = path_cache.get(current_pos, target_pos, level.revision)
+    if path is PathCache.MISS:
+        path = a_star(current_pos, target_pos, level, partial=True)
+        path_cache.put(current_pos, target_pos, level.revision, path)
     
     if path and len(path) > 1:
         # Get next position in path
@@ -113,3 +267,25 @@ def get_next_direction(current_pos: Tuple[int, int], target_pos: Tuple[int, int]
         return (dx, dy)
     
     return (0, 0)
+
+
+def prepare_level(level):
+    """
+    Build the tables the configured strategy uses for a level up front.
+    
+    Compiling a next-hop table or junction graph can take a noticeable
+    fraction of a second on large levels; doing it here keeps that cost
+    out of the first ghost replan during play. Tables are cached on the
+    level, so preparing a shared level again is cheap.
+    
+    Args:
+        level: Level instance
+        
+    Returns:
+        The same level
+    """
+    if config.PATHFINDING_STRATEGY == "next_hop":
+        get_next_hop_table(level)
+    if config.PATHFINDING_STRATEGY == "junction" or config.GHOST_JUNCTION_DECISIONS:
+        get_junction_graph(level)
+    return level
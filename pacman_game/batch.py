@@ -0,0 +1,435 @@
+"""Vectorized engine that steps many independent headless games at once
+
+Requires NumPy (optional; only this module uses it).
+"""
+import numpy as np
+
+from . import config
+from .ai.ghost_behaviors import GhostBehavior, SCATTER_TARGETS, mode_schedule
+from .ai.next_hop import DIRECTIONS, REVERSE_CODES, get_next_hop_table
+from .grid import EXIT_BITS
+from .simulation import Simulation
+from .state_machine import GameState
+
+# Direction codes (0 = none, then left, right, up, down) as used by next-hop tables
+DX = np.array([dx for dx, _ in DIRECTIONS], dtype=np.int64)
+DY = np.array([dy for _, dy in DIRECTIONS], dtype=np.int64)
+REVERSE = np.array(REVERSE_CODES, dtype=np.int8)
+EXIT_BIT = np.array([EXIT_BITS.get(direction, 0) for direction in DIRECTIONS], dtype=np.uint8)
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+# State and behavior codes stored in the arrays
+PLAYING = GameState.PLAYING.value
+LEVEL_COMPLETE = GameState.LEVEL_COMPLETE.value
+LIFE_LOST = GameState.LIFE_LOST.value
+GAME_OVER = GameState.GAME_OVER.value
+SCATTER = GhostBehavior.SCATTER.value
+CHASE = GhostBehavior.CHASE.value
+FRIGHTENED = GhostBehavior.FRIGHTENED.value
+IDLE = GhostBehavior.IDLE.value
+
+# Marks a timer that is not pending
+NEVER = -1
+
+
+def direction_codes(directions):
+    """
+    Convert (dx, dy) tuples to direction codes.
+
+    Args:
+        directions: Iterable of direction tuples
+
+    Returns:
+        numpy.ndarray: int8 codes (see next_hop.DIRECTIONS)
+    """
+    return np.array([DIRECTION_CODES[direction] for direction in directions], dtype=np.int8)
+
+
+class BatchSimulation:
+    """
+    N independent games kept in NumPy arrays and stepped together.
+
+    Follows the rules of Simulation.step for every game: Player.update
+    (without an input handler), PelletManager.collect_pellet,
+    Ghost.update in pixel mode with the global scatter/chase schedule,
+    collisions and the GameStateMachine transitions. Frame-based timers
+    become per-game due frames checked each step.
+
+    Ghosts always steer with the level's next-hop table, so games match
+    Simulation exactly when config.PATHFINDING_STRATEGY is "next_hop"
+    (the default). Other strategies can break shortest-path ties
+    differently.
+
+    Per-game state is public: positions are float64 pixel arrays,
+    directions are int8 codes, ghost arrays are (games, ghosts), pellets
+    is a (games, tiles) bool mask, state and ghost_behavior hold
+    GameState / GhostBehavior values.
+    """
+
+    def __init__(self, games):
+        """
+        Initialize all games at their starting state.
+
+        Args:
+            games: Number of independent games
+        """
+        if config.GHOST_JUNCTION_DECISIONS:
+            raise ValueError("BatchSimulation does not support GHOST_JUNCTION_DECISIONS")
+
+        # A scalar game supplies the level, spawn points and entity constants
+        template = Simulation()
+        level = template.level
+        table = get_next_hop_table(level)
+        if table is None:
+            raise ValueError("BatchSimulation needs a level small enough for a next-hop table")
+
+        self.games = games
+        self.level = level
+        self.tile_size = config.TILE_SIZE
+        self.rows = level.grid.rows
+        self.cols = level.grid.cols
+
+        # Padded wall/exit arrays: [grid_y + 1, grid_x + 1] is valid for the sentinel border
+        grid = level.grid
+        padded = (grid.rows + 2, grid.stride)
+        self.walls = np.frombuffer(bytes(grid.cells), dtype=np.uint8).reshape(padded) == 1
+        self.exits = np.frombuffer(bytes(grid.exits), dtype=np.uint8).reshape(padded)
+
+        self.tile_index = np.frombuffer(table.index.tobytes(), dtype=np.int32).astype(np.int64)
+        self.tile_count = table.tile_count
+        self.next_hop = np.frombuffer(bytes(table.table), dtype=np.uint8).astype(np.int8)
+
+        pellet_grid = template.pellet_manager.pellet_grid
+        self.initial_pellets = np.array([cell == 1 for row in pellet_grid for cell in row], dtype=bool)
+        self.total_pellets = template.pellet_manager.total_pellets
+
+        player = template.player
+        self.player_start = (player.x, player.y)
+        self.player_speed = player.speed
+        self.player_radius = player.radius
+        self.uses_exit_masks = player.uses_exit_masks
+
+        ghosts = template.ghosts
+        self.ghost_types = [ghost.ghost_type for ghost in ghosts]
+        self.ghost_start_x = np.array([ghost.x for ghost in ghosts])
+        self.ghost_start_y = np.array([ghost.y for ghost in ghosts])
+        self.ghost_start_behavior = np.array([ghost.behavior.value for ghost in ghosts], dtype=np.int8)
+        self.ghost_radius = np.array([ghost.radius for ghost in ghosts], dtype=np.float64)
+        self.release_delays = [max(int(frames), 1) for frames in config.GHOST_RELEASE_FRAMES]
+        self.starting_lives = template.state_machine.lives
+
+        shape = (games, len(ghosts))
+        self.frame = 0
+        self.score = np.zeros(games, dtype=np.int64)
+        self.lives = np.full(games, self.starting_lives, dtype=np.int64)
+        self.level_number = np.ones(games, dtype=np.int64)
+        self.state = np.full(games, PLAYING, dtype=np.int8)
+        self.transition_due = np.full(games, NEVER, dtype=np.int64)
+        self.pellets = np.tile(self.initial_pellets, (games, 1))
+        self.pellets_remaining = np.full(games, self.total_pellets, dtype=np.int64)
+
+        self.player_x = np.zeros(games)
+        self.player_y = np.zeros(games)
+        self.player_dir = np.zeros(games, dtype=np.int8)
+        self.player_desired = np.zeros(games, dtype=np.int8)
+
+        self.ghost_x = np.zeros(shape)
+        self.ghost_y = np.zeros(shape)
+        self.ghost_dir = np.zeros(shape, dtype=np.int8)
+        self.ghost_behavior = np.zeros(shape, dtype=np.int8)
+        self.ghost_counter = np.zeros(shape, dtype=np.int64)
+        self.ghost_replan = np.zeros(shape, dtype=bool)
+        self.ghost_speed = np.zeros(games)
+        self.release_due = np.full(shape, NEVER, dtype=np.int64)
+
+        # Global scatter/chase phase per game (see ModeController)
+        self.phase = np.full(games, SCATTER, dtype=np.int8)
+        self.phase_index = np.zeros(games, dtype=np.int64)
+        self.phase_due = np.full(games, NEVER, dtype=np.int64)
+        self.schedules = [()] * games
+
+        self.respawn(np.arange(games))
+
+    def respawn(self, games):
+        """
+        Put player and ghosts of some games back at their starting positions.
+
+        Args:
+            games: Index array of games
+        """
+        frame = self.frame
+        self.player_x[games], self.player_y[games] = self.player_start
+        self.player_dir[games] = 0
+        self.player_desired[games] = 0
+
+        self.ghost_x[games] = self.ghost_start_x
+        self.ghost_y[games] = self.ghost_start_y
+        self.ghost_dir[games] = 0
+        self.ghost_behavior[games] = self.ghost_start_behavior
+        self.ghost_counter[games] = 0
+        self.ghost_replan[games] = False
+
+        for game in games:
+            self.ghost_speed[game] = Simulation.ghost_speed_for_level(int(self.level_number[game]))
+            self.schedules[game] = mode_schedule(int(self.level_number[game]))
+
+        self.release_due[games] = NEVER
+        for ghost, delay in enumerate(self.release_delays[:len(self.ghost_types)]):
+            if self.ghost_start_behavior[ghost] == IDLE:
+                self.release_due[games, ghost] = frame + delay
+
+        # Restart the phase schedule; active ghosts take the first phase and replan
+        self.phase[games] = SCATTER
+        self.phase_index[games] = 0
+        self.enter_mode(games, SCATTER)
+        for game in games:
+            self.schedule_phase_end(game)
+
+    def schedule_phase_end(self, game):
+        """Set when the current phase of a game ends (NEVER if it lasts forever)"""
+        schedule = self.schedules[game]
+        duration = schedule[self.phase_index[game] % len(schedule)] if schedule else None
+        self.phase_due[game] = NEVER if duration is None else self.frame + max(int(duration), 1)
+
+    def enter_mode(self, games, phase):
+        """Put scattering/chasing ghosts of some games into a phase and flag a replan"""
+        behavior = self.ghost_behavior[games]
+        active = (behavior == SCATTER) | (behavior == CHASE)
+        self.ghost_behavior[games] = np.where(active, phase, behavior)
+        self.ghost_replan[games] |= active
+
+    def step(self, directions=None):
+        """
+        Advance every game by one frame.
+
+        Args:
+            directions: Direction code per game (0 = no input), or None
+        """
+        self.frame += 1
+        self.fire_timers()
+
+        playing = np.flatnonzero(self.state == PLAYING)
+        if not playing.size:
+            return
+
+        if directions is not None:
+            codes = np.asarray(directions, dtype=np.int8)[playing]
+            self.player_desired[playing] = np.where(codes != 0, codes, self.player_desired[playing])
+
+        self.update_players(playing)
+        self.collect_pellets(playing)
+        for ghost in range(len(self.ghost_types)):
+            self.update_ghosts(playing, ghost)
+
+    def fire_timers(self):
+        """Apply ghost releases, phase changes and transitions due this frame"""
+        frame = self.frame
+
+        released = self.release_due == frame
+        if released.any():
+            games, ghosts = np.nonzero(released)
+            self.release_due[games, ghosts] = NEVER
+            idle = self.ghost_behavior[games, ghosts] == IDLE
+            games, ghosts = games[idle], ghosts[idle]
+            self.ghost_behavior[games, ghosts] = self.phase[games]
+            self.ghost_replan[games, ghosts] = True
+
+        for game in np.flatnonzero(self.phase_due == frame):
+            self.phase_index[game] += 1
+            phase = CHASE if self.phase[game] == SCATTER else SCATTER
+            self.phase[game] = phase
+            self.enter_mode(game, phase)
+            self.schedule_phase_end(game)
+
+        finished = np.flatnonzero(self.transition_due == frame)
+        if finished.size:
+            self.transition_due[finished] = NEVER
+            completed = finished[self.state[finished] == LEVEL_COMPLETE]
+            self.level_number[completed] += 1
+            self.state[finished] = PLAYING
+            self.pellets[completed] = self.initial_pellets
+            self.pellets_remaining[completed] = self.total_pellets
+            self.respawn(finished)
+
+    def can_move_to(self, x, y, radius):
+        """Vectorized Grid.can_move_to over arrays of pixel positions"""
+        tile_size = self.tile_size
+        left = np.trunc((x - radius) / tile_size).astype(np.int64)
+        right = np.trunc((x + radius) / tile_size).astype(np.int64)
+        top = np.trunc((y - radius) / tile_size).astype(np.int64)
+        bottom = np.trunc((y + radius) / tile_size).astype(np.int64)
+        return ~(self.is_wall(left, top) | self.is_wall(right, top) |
+                 self.is_wall(left, bottom) | self.is_wall(right, bottom))
+
+    def is_wall(self, grid_x, grid_y):
+        """Vectorized Grid.is_wall (out of bounds counts as wall)"""
+        inside = (grid_x >= -1) & (grid_x <= self.cols) & (grid_y >= -1) & (grid_y <= self.rows)
+        walls = self.walls[np.clip(grid_y + 1, 0, self.rows + 1), np.clip(grid_x + 1, 0, self.cols + 1)]
+        return walls | ~inside
+
+    def at_tile_center(self, x, y):
+        """Vectorized Player.is_at_tile_center"""
+        center = self.tile_size / 2
+        tolerance = config.TILE_CENTER_TOLERANCE
+        return ((np.abs(x % self.tile_size - center) <= tolerance) &
+                (np.abs(y % self.tile_size - center) <= tolerance))
+
+    def player_can_move(self, x, y, codes, centered):
+        """Vectorized Player.can_move for direction codes"""
+        speed = self.player_speed
+        by_pixels = self.can_move_to(x + DX[codes] * speed, y + DY[codes] * speed, self.player_radius)
+        if self.uses_exit_masks:
+            grid_x = np.trunc(x / self.tile_size).astype(np.int64)
+            grid_y = np.trunc(y / self.tile_size).astype(np.int64)
+            exits = self.exits[np.clip(grid_y + 1, 0, self.rows + 1), np.clip(grid_x + 1, 0, self.cols + 1)]
+            by_mask = (exits & EXIT_BIT[codes]) != 0
+            by_pixels = np.where(centered, by_mask, by_pixels)
+        return (codes == 0) | by_pixels
+
+    def update_players(self, games):
+        """Player.update for the given games"""
+        tile_size = self.tile_size
+        speed = self.player_speed
+        radius = self.player_radius
+        x = self.player_x[games]
+        y = self.player_y[games]
+        direction = self.player_dir[games]
+        desired = self.player_desired[games]
+        wants = desired != 0
+
+        # Immediate reverse (allowed anywhere)
+        reverse = wants & (direction != 0) & (desired == REVERSE[direction])
+        direction = np.where(reverse, desired, direction)
+
+        # Standard turn at a tile center
+        centered = self.at_tile_center(x, y)
+        turn = wants & centered & self.player_can_move(x, y, desired, centered)
+        direction = np.where(turn, desired, direction)
+
+        # Cornering: blocked off center, snap onto the lane of the desired direction
+        blocked = ~self.can_move_to(x + DX[direction] * speed, y + DY[direction] * speed, radius)
+        corner = wants & ~centered & blocked
+        if corner.any():
+            offset = tile_size / 2
+            horizontal = DX[desired] != 0
+            vertical = ~horizontal & (DY[desired] != 0)
+            snap_x = np.where(vertical, np.round((x - offset) / tile_size) * tile_size + offset, x)
+            snap_y = np.where(horizontal, np.round((y - offset) / tile_size) * tile_size + offset, y)
+            valid = corner & self.can_move_to(snap_x + DX[desired] * speed, snap_y + DY[desired] * speed, radius)
+            x = np.where(valid, snap_x, x)
+            y = np.where(valid, snap_y, y)
+            direction = np.where(valid, desired, direction)
+
+        # Move, or align to the tile center against a wall
+        centered = self.at_tile_center(x, y)
+        moves = self.player_can_move(x, y, direction, centered)
+        x = np.where(moves, x + DX[direction] * speed, x)
+        y = np.where(moves, y + DY[direction] * speed, y)
+        if config.WALL_SLIDE_ENABLED:
+            align = ~moves & centered
+            x = np.where(align, np.trunc(x / tile_size) * tile_size + tile_size / 2, x)
+            y = np.where(align, np.trunc(y / tile_size) * tile_size + tile_size / 2, y)
+
+        self.player_x[games] = x
+        self.player_y[games] = y
+        self.player_dir[games] = direction
+
+    def collect_pellets(self, games):
+        """PelletManager.collect_pellet and GameStateMachine.check_level_complete"""
+        grid_x = np.trunc(self.player_x[games] / self.tile_size).astype(np.int64)
+        grid_y = np.trunc(self.player_y[games] / self.tile_size).astype(np.int64)
+        inside = (grid_x >= 0) & (grid_x < self.cols) & (grid_y >= 0) & (grid_y < self.rows)
+        tiles = np.where(inside, grid_y * self.cols + grid_x, 0)
+        eaten = inside & self.pellets[games, tiles]
+
+        games, tiles = games[eaten], tiles[eaten]
+        self.pellets[games, tiles] = False
+        self.pellets_remaining[games] -= 1
+        self.score[games] += config.POINTS_PER_PELLET
+
+        complete = games[self.pellets_remaining[games] == 0]
+        self.state[complete] = LEVEL_COMPLETE
+        self.transition_due[complete] = self.frame + max(int(config.LEVEL_COMPLETE_DELAY), 1)
+
+    def update_ghosts(self, games, ghost):
+        """Ghost.update for one ghost slot of the given games, then its collision check"""
+        active = games[self.ghost_behavior[games, ghost] != IDLE]
+        if active.size:
+            self.ghost_counter[active, ghost] += 1
+            replan = self.ghost_replan[active, ghost] | (self.ghost_counter[active, ghost] >= config.PATHFINDING_UPDATE_INTERVAL)
+            self.ghost_counter[active[replan], ghost] = 0
+            self.update_targets(active[replan], ghost)
+
+            speed = self.ghost_speed[active]
+            direction = self.ghost_dir[active, ghost]
+            new_x = self.ghost_x[active, ghost] + DX[direction] * speed
+            new_y = self.ghost_y[active, ghost] + DY[direction] * speed
+            moves = self.can_move_to(new_x, new_y, self.ghost_radius[ghost])
+            self.ghost_x[active[moves], ghost] = new_x[moves]
+            self.ghost_y[active[moves], ghost] = new_y[moves]
+            # Hit a wall: recalculate immediately
+            self.update_targets(active[~moves], ghost)
+
+        # Collision with the player (idle ghosts included, as in Simulation.step)
+        dx = self.ghost_x[games, ghost] - self.player_x[games]
+        dy = self.ghost_y[games, ghost] - self.player_y[games]
+        hit = games[(np.sqrt(dx * dx + dy * dy) < self.ghost_radius[ghost] + self.player_radius) &
+                    (self.state[games] == PLAYING)]
+        if hit.size:
+            self.lives[hit] -= 1
+            over = self.lives[hit] <= 0
+            self.state[hit] = np.where(over, GAME_OVER, LIFE_LOST)
+            self.transition_due[hit[~over]] = self.frame + max(int(config.LEVEL_COMPLETE_DELAY), 1)
+
+    def update_targets(self, games, ghost):
+        """Ghost.update_target: pick target tiles and steer by the next-hop table"""
+        if not games.size:
+            return
+        tile_size = self.tile_size
+        ghost_type = self.ghost_types[ghost]
+        grid_x = np.trunc(self.ghost_x[games, ghost] / tile_size).astype(np.int64)
+        grid_y = np.trunc(self.ghost_y[games, ghost] / tile_size).astype(np.int64)
+        player_x = np.trunc(self.player_x[games] / tile_size).astype(np.int64)
+        player_y = np.trunc(self.player_y[games] / tile_size).astype(np.int64)
+        player_dir = self.player_dir[games]
+        corner_x, corner_y = SCATTER_TARGETS.get(ghost_type, (1, 1))
+        max_x, max_y = config.GRID_COLS - 1, config.GRID_ROWS - 1
+
+        # Chase targets (see get_target_tile)
+        if ghost_type == "PINKY":
+            chase_x = np.clip(player_x + DX[player_dir] * 4, 0, max_x)
+            chase_y = np.clip(player_y + DY[player_dir] * 4, 0, max_y)
+        elif ghost_type == "INKY":
+            blinky_x = np.trunc(self.ghost_x[games, 0] / tile_size).astype(np.int64)
+            blinky_y = np.trunc(self.ghost_y[games, 0] / tile_size).astype(np.int64)
+            pivot_x = player_x + DX[player_dir] * 2
+            pivot_y = player_y + DY[player_dir] * 2
+            chase_x = np.clip(blinky_x + (pivot_x - blinky_x) * 2, 0, max_x)
+            chase_y = np.clip(blinky_y + (pivot_y - blinky_y) * 2, 0, max_y)
+        elif ghost_type == "CLYDE":
+            far = np.abs(grid_x - player_x) + np.abs(grid_y - player_y) > 8
+            chase_x = np.where(far, player_x, corner_x)
+            chase_y = np.where(far, player_y, corner_y)
+        else:
+            chase_x, chase_y = player_x, player_y
+
+        behavior = self.ghost_behavior[games, ghost]
+        scatter = behavior == SCATTER
+        chase = behavior == CHASE
+        frightened = behavior == FRIGHTENED
+        target_x = np.where(scatter, corner_x, np.where(chase, chase_x, np.where(frightened, grid_x, player_x)))
+        target_y = np.where(scatter, corner_y, np.where(chase, chase_y, np.where(frightened, grid_y, player_y)))
+
+        source = self.walkable_index(grid_x, grid_y)
+        target = self.walkable_index(target_x, target_y)
+        found = (source >= 0) & (target >= 0)
+        codes = np.where(found, self.next_hop[np.where(found, target * self.tile_count + source, 0)], 0)
+
+        self.ghost_dir[games, ghost] = np.where(codes != 0, codes, self.ghost_dir[games, ghost])
+        self.ghost_replan[games, ghost] = False
+
+    def walkable_index(self, grid_x, grid_y):
+        """Compact next-hop index of tiles (-1 for walls and out of bounds)"""
+        inside = (grid_x >= 0) & (grid_x < self.cols) & (grid_y >= 0) & (grid_y < self.rows)
+        index = self.tile_index[np.where(inside, grid_y * self.cols + grid_x, 0)]
+        return np.where(inside, index, -1)
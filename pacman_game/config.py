@@ -4,7 +4,13 @@
 # Display Settings
 SCREEN_WIDTH = 600
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = 60  # Simulation steps per second (frame-based durations below use it too)
+MAX_CATCH_UP_STEPS = 5  # Simulation steps run per rendered frame before the game slows down
+TURBO_STEPS_PER_FRAME = 32  # Simulation steps per loop iteration in turbo mode (F4)
+TURBO_DRAW_EVERY = 0  # Turbo redraws the screen every N steps (0 = never)
+DIRTY_RECT_RENDERING = True  # Push only changed regions instead of flipping the full screen
+HUD_TEXT_CACHE_SIZE = 64  # Rendered HUD strings kept in the LRU text cache
+SPRITE_ATLAS_ENABLED = True  # Blit pre-rendered entity sprites (False = draw shapes every frame)
 
 # Tile/Grid Settings
 TILE_SIZE = 30
@@ -17,6 +23,7 @@ WHITE = (255, 255, 255)
 YELLOW = (255, 255, 0)
 BLUE = (0, 0, 255)
 RED = (255, 0, 0)
+GREEN = (0, 255, 0)
 PINK = (255, 184, 255)
 CYAN = (0, 255, 255)
 ORANGE = (255, 165, 0)
@@ -36,7 +43,19 @@ STARTING_LIVES = 3
 GHOST_DIRECTION_CHANGE_INTERVAL = 60  # frames
 SCATTER_DURATION = 7 * FPS  # 7 seconds in frames
 CHASE_DURATION = 20 * FPS  # 20 seconds in frames
+# Global scatter/chase phase lengths in frames, alternating from scatter, keyed
+# by the first level number they apply to. A trailing None holds the last phase
+# forever; otherwise the schedule repeats. Levels before the first entry use
+# (SCATTER_DURATION, CHASE_DURATION), read when the schedule starts.
+GHOST_MODE_SCHEDULES = {}
 PATHFINDING_UPDATE_INTERVAL = 10  # frames
+PATHFINDING_STRATEGY = "next_hop"  # "next_hop", "flow_field", "incremental", "junction" or "a_star"
+PATHFINDING_MAX_EXPANSIONS = 5000  # A* node budget per search (None = unlimited)
+PATH_CACHE_SIZE = 256  # A* results kept in the LRU path cache
+INCREMENTAL_MAX_GOAL_SHIFT = 4  # Goal moves (tiles) repaired by the incremental planner
+NEXT_HOP_MAX_TILES = 2500  # Larger levels fall back to A* (table is tiles^2 bytes)
+GHOST_JUNCTION_DECISIONS = False  # Ghosts follow corridors and only replan at junctions
+GHOST_RELEASE_FRAMES = [0, 5 * FPS, 10 * FPS, 15 * FPS]  # BLINKY, PINKY, INKY, CLYDE
 
 # Movement Parameters (for future use)
 INPUT_BUFFER_DURATION = 200  # milliseconds
@@ -49,6 +68,17 @@ DEBUG_SHOW_GRID = True
 DEBUG_SHOW_TARGETS = True
 DEBUG_SHOW_COLLISION = True
 DEBUG_SHOW_PATHS = True
+DEBUG_SHOW_INFO_PANEL = True
+DEBUG_PANEL_REFRESH_HZ = 4  # Info panel text re-renders per second
+DEBUG_SHOW_PROFILER = True  # Stacked frame-time graph with p50/p99
+
+# Profiler Settings
+PROFILER_ENABLED = True  # Time frame phases (events, update, draw) with perf_counter_ns
+PROFILER_FRAMES = 240  # Frames kept in the profiler ring buffer
+PROFILER_DUMP_FILE = "frame_profile.csv"  # Written when F5 is pressed
+
+# Verification Settings
+STATE_DIGEST_ENABLED = False  # Log a checksum of the game state every simulation step
 
 # Level Complete Settings
 LEVEL_COMPLETE_DELAY = 2 * FPS  # 2 seconds in frames
@@ -1,22 +1,74 @@
 """Debug overlay for visualizing game state"""
+import time
 import pygame
 from .. import config
+from ..rendering.text_cache import TextCache
+
+# Info panel geometry
+PANEL_X = 10
+PANEL_Y = 10
+PANEL_WIDTH = 250
+PANEL_HEIGHT = 180  # Fits five player lines and four ghost lines
+LINE_HEIGHT = 18
+
+# Frame-time graph geometry (bottom right, one pixel column per frame)
+GRAPH_WIDTH = 240
+GRAPH_HEIGHT = 100
+GRAPH_X = config.SCREEN_WIDTH - GRAPH_WIDTH - 10
+GRAPH_Y = config.SCREEN_HEIGHT - GRAPH_HEIGHT - 90
+
+# Stack colors per profiler phase group
+GROUP_COLORS = {'events': (0, 200, 255), 'update': (255, 165, 0), 'draw': (0, 255, 0)}
 
 
 class DebugOverlay:
-    """Debug visualization overlay for development"""
+    """
+    Debug visualization overlay for development.
+    
+    Everything that does not change per frame is cached: the tile grid is
+    baked into one transparent layer, the panel background is allocated
+    once, and the info panel text is re-rendered at
+    config.DEBUG_PANEL_REFRESH_HZ rather than every frame. Fonts are only
+    loaded the first time the overlay is enabled.
+    """
     
-    def __init__(self):
-        """Initialize debug overlay"""
+    def __init__(self, clock=time.perf_counter):
+        """
+        Initialize debug overlay.
+        
+        Args:
+            clock: Function returning the current time in seconds
+        """
+        self.clock = clock
         self.enabled = config.DEBUG_ENABLED_BY_DEFAULT
-        self.font = pygame.font.Font(None, 20)
-        self.small_font = pygame.font.Font(None, 16)
+        self.font = None
+        self.small_font = None
+        self.text_cache = TextCache(config.HUD_TEXT_CACHE_SIZE)
+        
+        # Cached layers, built on first use
+        self.grid_layer = None
+        self.panel_background = None
+        self.panel_text = None
+        self.graph_layer = None
+        
+        # Clock time the info panel text / graph was last rendered (None = stale)
+        self.panel_refreshed_at = None
+        self.graph_refreshed_at = None
     
     def toggle(self):
         """Toggle debug overlay on/off"""
         self.enabled = not self.enabled
+        # Show fresh values as soon as the overlay comes back
+        self.panel_refreshed_at = None
+        self.graph_refreshed_at = None
     
-    def draw(self, screen, level, player, ghosts, state_machine, fps=60):
+    def load_fonts(self):
+        """Load the overlay fonts if they have not been loaded yet"""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 20)
+            self.small_font = pygame.font.Font(None, 16)
+    
+    def draw(self, screen, level, player, ghosts, state_machine, fps=60, sim_fps=None, profiler=None):
         """
         Draw debug overlay.
         
@@ -27,9 +79,12 @@ class DebugOverlay:
             ghosts: List of Ghost instances
             state_machine: GameStateMachine instance
             fps: Current FPS
+            sim_fps: Measured simulation steps per second (optional)
+            profiler: FrameProfiler to graph (optional)
         """
         if not self.enabled:
             return
+        self.load_fonts()
         
         # Draw tile grid
         if config.DEBUG_SHOW_GRID:
@@ -44,23 +99,38 @@ class DebugOverlay:
             self.draw_ghost_targets(screen, ghosts)
         
         # Draw debug info panel
-        self.draw_info_panel(screen, player, ghosts, state_machine, fps)
+        if config.DEBUG_SHOW_INFO_PANEL:
+            self.draw_info_panel(screen, player, ghosts, state_machine, fps, sim_fps)
+        
+        # Draw frame-time graph
+        if config.DEBUG_SHOW_PROFILER and profiler is not None:
+            self.draw_profile_graph(screen, profiler)
     
     def draw_grid(self, screen, level):
-        """Draw tile grid overlay"""
+        """Draw tile grid overlay from its cached layer"""
+        if self.grid_layer is None:
+            self.grid_layer = self.bake_grid()
+        screen.blit(self.grid_layer, (0, 0))
+    
+    def bake_grid(self):
+        """Draw grid lines and tile centers once onto a transparent layer"""
+        layer = pygame.Surface((config.GRID_COLS * config.TILE_SIZE, config.GRID_ROWS * config.TILE_SIZE),
+                               pygame.SRCALPHA)
+        layer.fill((0, 0, 0, 0))
         for row in range(config.GRID_ROWS):
             for col in range(config.GRID_COLS):
                 x = col * config.TILE_SIZE
                 y = row * config.TILE_SIZE
                 
                 # Draw grid lines
-                pygame.draw.rect(screen, (50, 50, 50), 
+                pygame.draw.rect(layer, (50, 50, 50), 
                                (x, y, config.TILE_SIZE, config.TILE_SIZE), 1)
                 
                 # Mark tile centers
                 center_x = x + config.TILE_SIZE // 2
                 center_y = y + config.TILE_SIZE // 2
-                pygame.draw.circle(screen, (70, 70, 70), (center_x, center_y), 1)
+                pygame.draw.circle(layer, (70, 70, 70), (center_x, center_y), 1)
+        return layer
     
     def draw_collision_boxes(self, screen, player, ghosts):
         """Draw collision circles around entities"""
@@ -96,50 +166,62 @@ class DebugOverlay:
                 
                 # Draw behavior text
                 behavior_text = ghost.behavior.name
-                text_surface = self.small_font.render(behavior_text, True, color)
+                text_surface = self.text_cache.render(self.small_font, behavior_text, color)
                 screen.blit(text_surface, (int(ghost.x) - 20, int(ghost.y) - 25))
     
-    def draw_info_panel(self, screen, player, ghosts, state_machine, fps):
-        """Draw debug information panel"""
-        panel_x = 10
-        panel_y = 10
-        line_height = 18
-        
-        # Semi-transparent background
-        panel_width = 250
-        panel_height = 150
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(180)
-        panel_surface.fill((0, 0, 0))
-        screen.blit(panel_surface, (panel_x - 5, panel_y - 5))
+    def draw_info_panel(self, screen, player, ghosts, state_machine, fps, sim_fps=None):
+        """Draw debug information panel, re-rendering its text at the refresh rate"""
+        if self.panel_background is None:
+            # Semi-transparent background, allocated once
+            self.panel_background = pygame.Surface((PANEL_WIDTH, PANEL_HEIGHT))
+            self.panel_background.set_alpha(180)
+            self.panel_background.fill((0, 0, 0))
+            self.panel_text = pygame.Surface((PANEL_WIDTH, PANEL_HEIGHT), pygame.SRCALPHA)
+        
+        now = self.clock()
+        if self.refresh_due(self.panel_refreshed_at, now):
+            self.render_panel_text(player, ghosts, state_machine, fps, sim_fps)
+            self.panel_refreshed_at = now
+        
+        screen.blit(self.panel_background, (PANEL_X - 5, PANEL_Y - 5))
+        screen.blit(self.panel_text, (PANEL_X - 5, PANEL_Y - 5))
+    
+    def render_panel_text(self, player, ghosts, state_machine, fps, sim_fps=None):
+        """Render the info panel lines onto the cached text layer"""
+        self.panel_text.fill((0, 0, 0, 0))
+        # Text positions are relative to the panel layer
+        panel_x = 5
+        panel_y = 5
         
         # FPS
         fps_text = f"FPS: {int(fps)}"
-        self.draw_text(screen, fps_text, panel_x, panel_y, config.WHITE)
-        panel_y += line_height
+        if sim_fps is not None:
+            fps_text += f"  Sim: {int(sim_fps)}"
+        self.draw_text(self.panel_text, fps_text, panel_x, panel_y, config.WHITE)
+        panel_y += LINE_HEIGHT
         
         # Game state
         state_text = f"State: {state_machine.get_state().name}"
-        self.draw_text(screen, state_text, panel_x, panel_y, config.YELLOW)
-        panel_y += line_height
+        self.draw_text(self.panel_text, state_text, panel_x, panel_y, config.YELLOW)
+        panel_y += LINE_HEIGHT
         
         # Player position
         player_grid_x = int(player.x / config.TILE_SIZE)
         player_grid_y = int(player.y / config.TILE_SIZE)
         player_text = f"Player: ({player_grid_x}, {player_grid_y})"
-        self.draw_text(screen, player_text, panel_x, panel_y, config.GREEN)
-        panel_y += line_height
+        self.draw_text(self.panel_text, player_text, panel_x, panel_y, config.GREEN)
+        panel_y += LINE_HEIGHT
         
         # Player direction
         dir_text = f"Direction: {player.direction}"
-        self.draw_text(screen, dir_text, panel_x, panel_y, config.GREEN)
-        panel_y += line_height
+        self.draw_text(self.panel_text, dir_text, panel_x, panel_y, config.GREEN)
+        panel_y += LINE_HEIGHT
         
         # At tile center
         centered = "Yes" if player.is_at_tile_center() else "No"
         center_text = f"At Center: {centered}"
-        self.draw_text(screen, center_text, panel_x, panel_y, config.GREEN)
-        panel_y += line_height
+        self.draw_text(self.panel_text, center_text, panel_x, panel_y, config.GREEN)
+        panel_y += LINE_HEIGHT
         
         # Ghost info
         panel_y += 5
@@ -147,10 +229,69 @@ class DebugOverlay:
             ghost_grid_x = int(ghost.x / config.TILE_SIZE)
             ghost_grid_y = int(ghost.y / config.TILE_SIZE)
             ghost_text = f"{ghost.ghost_type[:3]}: ({ghost_grid_x},{ghost_grid_y}) {ghost.behavior.name[:3]}"
-            self.draw_text(screen, ghost_text, panel_x, panel_y, ghost.color)
-            panel_y += line_height
+            self.draw_text(self.panel_text, ghost_text, panel_x, panel_y, ghost.color)
+            panel_y += LINE_HEIGHT
+    
+    def refresh_due(self, refreshed_at, now):
+        """
+        Check whether a throttled panel should be re-rendered.
+        
+        Timed with the clock rather than counted in draw calls, so panels
+        keep refreshing at DEBUG_PANEL_REFRESH_HZ when the frame rate drops.
+        
+        Args:
+            refreshed_at: Clock time of the last render, or None if stale
+            now: Current clock time
+            
+        Returns:
+            bool: True if the panel should be rendered now
+        """
+        return refreshed_at is None or now - refreshed_at >= 1.0 / config.DEBUG_PANEL_REFRESH_HZ
+    
+    def draw_profile_graph(self, screen, profiler):
+        """Draw the stacked frame-time graph, re-rendering it at the refresh rate"""
+        if self.graph_layer is None:
+            self.graph_layer = pygame.Surface((GRAPH_WIDTH, GRAPH_HEIGHT), pygame.SRCALPHA)
+        
+        now = self.clock()
+        if self.refresh_due(self.graph_refreshed_at, now):
+            self.render_profile_graph(profiler)
+            self.graph_refreshed_at = now
+        
+        screen.blit(self.graph_layer, (GRAPH_X, GRAPH_Y))
+    
+    def render_profile_graph(self, profiler):
+        """Render stacked per-group frame times and p50/p99 onto the graph layer"""
+        layer = self.graph_layer
+        layer.fill((0, 0, 0, 180))
+        
+        # Full height is two frame budgets; the line marks one
+        budget_ns = 1_000_000_000 / config.FPS
+        scale = (GRAPH_HEIGHT - 20) / (2 * budget_ns)
+        bottom = GRAPH_HEIGHT - 1
+        budget_y = bottom - int(budget_ns * scale)
+        pygame.draw.line(layer, (120, 120, 120), (0, budget_y), (GRAPH_WIDTH - 1, budget_y), 1)
+        
+        frames = profiler.frames()[-GRAPH_WIDTH:]
+        for x, frame in enumerate(frames, start=GRAPH_WIDTH - len(frames)):
+            y = bottom
+            for group, nanoseconds in profiler.group_totals(frame).items():
+                height = int(nanoseconds * scale)
+                if height <= 0:
+                    continue
+                top = max(y - height, 0)
+                pygame.draw.line(layer, GROUP_COLORS[group], (x, y), (x, top), 1)
+                y = top
+        
+        stats = f"p50 {profiler.percentile(50):.1f} ms  p99 {profiler.percentile(99):.1f} ms"
+        self.draw_text(layer, stats, 4, 2, config.WHITE)
+        legend_x = GRAPH_WIDTH - 4
+        for group in reversed(list(GROUP_COLORS)):
+            surface = self.text_cache.render(self.small_font, group, GROUP_COLORS[group])
+            legend_x -= surface.get_width() + 4
+            layer.blit(surface, (legend_x, 16))
     
     def draw_text(self, screen, text, x, y, color):
         """Helper to draw text"""
-        text_surface = self.small_font.render(text, True, color)
+        text_surface = self.text_cache.render(self.small_font, text, color)
         screen.blit(text_surface, (x, y))
@@ -0,0 +1,238 @@
+"""Per-frame state digests and an engine comparison tool
+
+A digest is a 32-bit checksum of everything that defines gameplay:
+player and ghost positions and directions, ghost behaviours, the pellet
+grid, score, lives, level and game state. Two engine configurations that
+play the same replay should produce the same digest every frame; the
+first frame where they differ is where behaviour changed.
+
+Run with: python -m pacman_game.digest [REPLAY] --a KEY=VALUE ... --b KEY=VALUE ...
+"""
+import argparse
+import ast
+import struct
+import sys
+import zlib
+from array import array
+from contextlib import contextmanager
+
+from . import config
+from .replay import Replay, ReplayRecorder, play_headless
+from .state_machine import GameState
+from .ai.ghost_behaviors import GhostBehavior
+
+# Player: x, y, dx, dy; then score, lives, level, state
+PLAYER = "ddbb"
+TOTALS = "qiiB"
+# Per ghost: x, y, dx, dy, behavior
+GHOST = "ddbbB"
+# Enum codes by dict lookup, which is cheaper than Enum.value
+BEHAVIOR_CODES = {behavior: code for code, behavior in enumerate(GhostBehavior)}
+STATE_CODES = {state: code for code, state in enumerate(GameState)}
+
+
+class StateDigest:
+    """
+    Computes state digests for a simulation.
+
+    The pellet grid only changes when a pellet is collected or the level
+    resets, so its checksum is cached against the PelletManager revision
+    and a typical frame only packs a few dozen numbers.
+    """
+
+    def __init__(self):
+        self.structs = {}
+        self.pellet_key = None
+        self.pellet_crc = 0
+
+    def pellet_checksum(self, pellet_manager):
+        """CRC of the pellet grid, recomputed only when it changed"""
+        key = (pellet_manager, pellet_manager.revision)
+        if key != self.pellet_key:
+            self.pellet_crc = zlib.crc32(b''.join(map(bytes, pellet_manager.pellet_grid)))
+            self.pellet_key = key
+        return self.pellet_crc
+
+    def __call__(self, sim):
+        """
+        Digest the current state of a simulation.
+
+        Returns:
+            int: 32-bit digest
+        """
+        ghosts = sim.ghosts
+        packer = self.structs.get(len(ghosts))
+        if packer is None:
+            packer = self.structs[len(ghosts)] = struct.Struct("<" + PLAYER + GHOST * len(ghosts) + TOTALS)
+
+        player = sim.player
+        values = [player.x, player.y, *player.direction]
+        behavior_codes = BEHAVIOR_CODES
+        for ghost in ghosts:
+            values += (ghost.x, ghost.y, *ghost.direction, behavior_codes[ghost.behavior])
+        state_machine = sim.state_machine
+        values += (sim.score, state_machine.lives, state_machine.level_number,
+                   STATE_CODES[state_machine.current_state])
+        return zlib.crc32(packer.pack(*values), self.pellet_checksum(sim.pellet_manager))
+
+
+def state_components(sim):
+    """
+    Readable breakdown of the digested state, for reporting divergences.
+
+    Returns:
+        dict: Component name to value
+    """
+    state_machine = sim.state_machine
+    components = {
+        'player': (sim.player.x, sim.player.y, sim.player.direction),
+        'pellets': sim.pellet_manager.pellets_remaining(),
+        'pellet_grid': zlib.crc32(b''.join(map(bytes, sim.pellet_manager.pellet_grid))),
+        'score': sim.score,
+        'lives': state_machine.lives,
+        'level': state_machine.level_number,
+        'state': state_machine.current_state.name,
+    }
+    for ghost in sim.ghosts:
+        components[ghost.ghost_type.lower()] = (ghost.x, ghost.y, ghost.direction, ghost.behavior.name)
+    return components
+
+
+def parse_override(text):
+    """
+    Parse a KEY=VALUE config override.
+
+    Values are Python literals; anything else is taken as a string.
+
+    Returns:
+        tuple: (key, value)
+    """
+    key, sep, raw = text.partition('=')
+    key = key.strip().upper()
+    if not sep or not hasattr(config, key):
+        raise ValueError(f"bad override {text!r} (expected an existing config setting, e.g. PLAYER_SPEED=2)")
+    try:
+        value = ast.literal_eval(raw)
+    except (ValueError, SyntaxError):
+        value = raw
+    return key, value
+
+
+@contextmanager
+def config_overrides(overrides):
+    """Temporarily apply {key: value} to config, restoring it afterwards"""
+    saved = {key: getattr(config, key) for key in overrides}
+    try:
+        for key, value in overrides.items():
+            setattr(config, key, value)
+        yield
+    finally:
+        for key, value in saved.items():
+            setattr(config, key, value)
+
+
+def run_digests(replay, overrides=None):
+    """
+    Play a replay headless under a configuration, digesting every frame.
+
+    Args:
+        replay: Replay to play
+        overrides: Optional {config key: value}
+
+    Returns:
+        array: One digest per frame
+    """
+    digest = StateDigest()
+    digests = array('L')
+    with config_overrides(overrides or {}):
+        play_headless(replay, on_step=lambda sim: digests.append(digest(sim)))
+    return digests
+
+
+def first_divergence(digests_a, digests_b):
+    """
+    Find the first frame whose digests differ.
+
+    Returns:
+        int: 1-based frame number, or None if the runs match
+    """
+    for index, (a, b) in enumerate(zip(digests_a, digests_b)):
+        if a != b:
+            return index + 1
+    if len(digests_a) != len(digests_b):
+        return min(len(digests_a), len(digests_b)) + 1
+    return None
+
+
+def components_at(replay, frame, overrides=None):
+    """State components after the given frame of a replay under a configuration"""
+    steps = Replay(replay.seed, replay.config_digest, replay.directions[:frame],
+                   [event for event in replay.events if event[0] < frame])
+    with config_overrides(overrides or {}):
+        return state_components(play_headless(steps))
+
+
+def compare(replay, overrides_a, overrides_b):
+    """
+    Run a replay under two configurations and locate the first divergence.
+
+    Returns:
+        dict: frames played, the first divergent frame (None if identical)
+            and, on divergence, the differing components as {name: (a, b)}
+    """
+    digests_a = run_digests(replay, overrides_a)
+    digests_b = run_digests(replay, overrides_b)
+    frame = first_divergence(digests_a, digests_b)
+    result = {'frames': len(digests_a), 'divergence': frame, 'differences': {}}
+    if frame is not None:
+        a = components_at(replay, frame, overrides_a)
+        b = components_at(replay, frame, overrides_b)
+        result['differences'] = {name: (a.get(name), b.get(name))
+                                 for name in a.keys() | b.keys() if a.get(name) != b.get(name)}
+    return result
+
+
+def record_policy_replay(policy, seed, frames):
+    """Record a replay of a farm policy playing under the current configuration"""
+    from .farm import make_policy
+    from .simulation import Simulation
+    sim = Simulation()
+    recorder = ReplayRecorder(seed)
+    choose = make_policy(policy, seed)
+    for _ in range(frames):
+        direction = choose(sim)
+        recorder.record_step(direction)
+        sim.step(direction)
+    return recorder.replay
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('replay', nargs='?', help='Replay file (default: record one with --policy)')
+    parser.add_argument('--a', nargs='*', default=[], metavar='KEY=VALUE', help='Config overrides of run A')
+    parser.add_argument('--b', nargs='*', default=[], metavar='KEY=VALUE', help='Config overrides of run B')
+    parser.add_argument('--policy', default='random', help='Farm policy used when no replay is given')
+    parser.add_argument('--frames', type=int, default=3600, help='Frames to record when no replay is given')
+    parser.add_argument('--seed', type=int, default=0, help='Seed used when no replay is given')
+    args = parser.parse_args(argv)
+
+    try:
+        overrides_a = dict(parse_override(text) for text in args.a)
+        overrides_b = dict(parse_override(text) for text in args.b)
+    except ValueError as e:
+        parser.error(str(e))
+    replay = Replay.load(args.replay) if args.replay else record_policy_replay(args.policy, args.seed, args.frames)
+
+    result = compare(replay, overrides_a, overrides_b)
+    if result['divergence'] is None:
+        print(f"Identical for all {result['frames']} frames")
+        return 0
+    print(f"First divergence at frame {result['divergence']} of {result['frames']}")
+    for name, (a, b) in sorted(result['differences'].items()):
+        print(f"  {name:<8} A: {a}")
+        print(f"  {'':<8} B: {b}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
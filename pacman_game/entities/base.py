@@ -1,5 +1,4 @@
 """Base entity class for all game entities"""
-import pygame
 
 
 class Entity:
@@ -18,14 +17,59 @@ class Entity:
         """
         self.x = x
         self.y = y
+        # Position before the last simulation step (for render interpolation)
+        self.prev_x = x
+        self.prev_y = y
         self.speed = speed
         self.radius = radius
         self.color = color
         self.direction = (0, 0)
     
+    def store_previous_position(self):
+        """Remember the current position as the start of the next step"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
+    def interpolated_position(self, alpha):
+        """
+        Get the position between the last two simulation steps.
+        
+        Args:
+            alpha: 0 for the previous position, 1 for the current one
+            
+        Returns:
+            tuple: (x, y) pixel position
+        """
+        return (self.prev_x + (self.x - self.prev_x) * alpha,
+                self.prev_y + (self.y - self.prev_y) * alpha)
+    
     def draw(self, screen):
         """Draw the entity as a circle"""
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+        self.draw_at(screen, int(self.x), int(self.y))
+    
+    def draw_at(self, surface, center_x, center_y):
+        """
+        Draw the entity's shape centered on a pixel position.
+        
+        Used both for drawing in place and for rasterising sprites.
+        
+        Args:
+            surface: Target pygame surface
+            center_x: Pixel X coordinate of the center
+            center_y: Pixel Y coordinate of the center
+        """
+        # Imported on first draw so the simulation core runs without pygame
+        import pygame
+        pygame.draw.circle(surface, self.color, (center_x, center_y), self.radius)
+    
+    def sprite_key(self):
+        """
+        Get the key identifying this entity's appearance in a sprite atlas.
+        
+        Returns:
+            tuple: Everything draw_at depends on besides the position
+        """
+        return (type(self).__name__, self.color, self.radius)
     
     def collides_with(self, other):
         """
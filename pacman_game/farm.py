@@ -0,0 +1,316 @@
+"""Simulation farm: run seeded headless games across worker processes
+
+Each game is a Simulation driven by an input policy until game over or a
+frame limit. Results stream back as games finish and are merged into
+aggregate statistics. Workers build their Level (and the pathfinding
+tables cached on it) once and reuse it for every game they run.
+
+Run with: python -m pacman_game.farm [--games K] [--policy random|scripted|bot] [--workers N] [--jsonl FILE]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from . import config
+from .level import Level
+from .simulation import Simulation
+from .ai.ghost_behaviors import GhostBehavior
+from .ai.pathfinding import prepare_level
+from .grid import EXITS, NEIGHBOR_OFFSETS
+
+# Letters accepted in scripts
+SCRIPT_DIRECTIONS = {'L': (-1, 0), 'R': (1, 0), 'U': (0, -1), 'D': (0, 1), '.': (0, 0)}
+DEFAULT_SCRIPT = "R:60,D:60,L:60,U:60"
+
+# Worker-local level, built once per process by prepare_worker
+_level = None
+
+
+class RandomPolicy:
+    """Hold a random direction, switching with a fixed chance each frame"""
+
+    def __init__(self, rng, turn_chance=0.05):
+        self.rng = rng
+        self.turn_chance = turn_chance
+        self.direction = rng.choice(NEIGHBOR_OFFSETS)
+
+    def __call__(self, sim):
+        if self.rng.random() < self.turn_chance:
+            self.direction = self.rng.choice(NEIGHBOR_OFFSETS)
+        return self.direction
+
+
+class ScriptedPolicy:
+    """Replay a cyclic script of (direction, frames) steps, e.g. "R:60,D:30" """
+
+    def __init__(self, script=DEFAULT_SCRIPT):
+        self.steps = parse_script(script)
+        self.frame = 0
+        self.period = sum(frames for _, frames in self.steps)
+
+    def __call__(self, sim):
+        position = self.frame % self.period
+        self.frame += 1
+        for direction, frames in self.steps:
+            if position < frames:
+                return direction
+            position -= frames
+        return (0, 0)
+
+
+class BotPolicy:
+    """
+    Greedy pellet collector.
+
+    At each tile center it runs a BFS over the level's exit masks to the
+    nearest pellet, treating tiles near an active ghost as blocked. With
+    no safe route it steps away from the nearest ghost.
+    """
+
+    def __init__(self, rng, danger_radius=2):
+        self.rng = rng
+        self.danger_radius = danger_radius
+        self.direction = (0, 0)
+
+    def __call__(self, sim):
+        player = sim.player
+        if self.direction != (0, 0) and not player.is_at_tile_center():
+            return self.direction
+
+        tile = (int(player.x / config.TILE_SIZE), int(player.y / config.TILE_SIZE))
+        ghosts = [(int(g.x / config.TILE_SIZE), int(g.y / config.TILE_SIZE))
+                  for g in sim.ghosts if g.behavior != GhostBehavior.IDLE]
+        direction = self.route_to_pellet(sim, tile, ghosts)
+        if direction is None:
+            direction = self.flee(sim.level, tile, ghosts)
+        self.direction = direction
+        return direction
+
+    def is_dangerous(self, tile, ghosts):
+        """True if a ghost is within danger_radius tiles (Manhattan)"""
+        return any(abs(tile[0] - gx) + abs(tile[1] - gy) <= self.danger_radius for gx, gy in ghosts)
+
+    def route_to_pellet(self, sim, start, ghosts):
+        """First step of a safe shortest route to the nearest pellet, or None"""
+        level = sim.level
+        pellets = sim.pellet_manager.pellet_grid
+        first_steps = {start: None}
+        queue = deque([start])
+        while queue:
+            x, y = queue.popleft()
+            mask = level.exit_mask(x, y)
+            for bit, dx, dy in EXITS:
+                neighbor = (x + dx, y + dy)
+                if not mask & bit or neighbor in first_steps or self.is_dangerous(neighbor, ghosts):
+                    continue
+                first_step = first_steps[(x, y)] or (dx, dy)
+                if pellets[neighbor[1]][neighbor[0]] == 1:
+                    return first_step
+                first_steps[neighbor] = first_step
+                queue.append(neighbor)
+        return None
+
+    def flee(self, level, tile, ghosts):
+        """Open direction that ends furthest from the nearest ghost"""
+        x, y = tile
+        mask = level.exit_mask(x, y)
+        options = [(dx, dy) for bit, dx, dy in EXITS if mask & bit]
+        if not options:
+            return (0, 0)
+        if not ghosts:
+            return self.rng.choice(options)
+
+        def distance_to_ghosts(direction):
+            nx, ny = x + direction[0], y + direction[1]
+            return min(abs(nx - gx) + abs(ny - gy) for gx, gy in ghosts)
+        return max(options, key=distance_to_ghosts)
+
+
+POLICIES = ('random', 'scripted', 'bot')
+
+
+def parse_script(script):
+    """
+    Parse a policy script.
+
+    Args:
+        script: Comma-separated LETTER:FRAMES steps, letters from
+            SCRIPT_DIRECTIONS (e.g. "R:60,D:30,.:10")
+
+    Returns:
+        list: (direction, frames) tuples
+    """
+    steps = []
+    for part in script.split(','):
+        letter, _, frames = part.strip().partition(':')
+        if letter.upper() not in SCRIPT_DIRECTIONS or not frames.isdigit() or int(frames) <= 0:
+            raise ValueError(f"bad script step {part!r} (expected e.g. R:60)")
+        steps.append((SCRIPT_DIRECTIONS[letter.upper()], int(frames)))
+    if not steps:
+        raise ValueError("empty script")
+    return steps
+
+
+def make_policy(name, seed, script=DEFAULT_SCRIPT):
+    """Create an input policy by name, seeded for reproducibility"""
+    rng = random.Random(seed)
+    if name == 'random':
+        return RandomPolicy(rng)
+    if name == 'scripted':
+        return ScriptedPolicy(script)
+    if name == 'bot':
+        return BotPolicy(rng)
+    raise ValueError(f"unknown policy {name!r} (choose from {', '.join(POLICIES)})")
+
+
+def prepare_worker():
+    """Process initializer: build this worker's level and tables once"""
+    global _level
+    _level = prepare_level(Level())
+
+
+def run_game(seed, policy='random', max_frames=None, script=DEFAULT_SCRIPT):
+    """
+    Play one seeded headless game.
+
+    Args:
+        seed: Seed for the policy
+        policy: Policy name (see POLICIES)
+        max_frames: Frame limit (defaults to 10 minutes of game time)
+        script: Script for the scripted policy
+
+    Returns:
+        dict: seed, policy, score, frames survived, level reached,
+            lives left, whether the game ended, ghost AI time and wall time
+    """
+    if _level is None:
+        prepare_worker()
+    if max_frames is None:
+        max_frames = 10 * 60 * config.FPS
+
+    started = time.perf_counter()
+    sim = Simulation(level=_level)
+    choose = make_policy(policy, seed, script)
+    state_machine = sim.state_machine
+
+    # Ghosts are replaced on respawn, so bank their AI time when that happens
+    ghosts = sim.ghosts
+    ai_time_ns = 0
+    while sim.frame < max_frames and not state_machine.is_game_over():
+        sim.step(choose(sim))
+        if sim.ghosts is not ghosts:
+            ai_time_ns += sum(ghost.ai_time_ns for ghost in ghosts)
+            ghosts = sim.ghosts
+    ai_time_ns += sum(ghost.ai_time_ns for ghost in ghosts)
+
+    return {
+        'seed': seed,
+        'policy': policy,
+        'score': sim.score,
+        'frames': sim.frame,
+        'level': state_machine.level_number,
+        'lives': state_machine.lives,
+        'game_over': state_machine.is_game_over(),
+        'ai_ms': ai_time_ns / 1e6,
+        'wall_ms': (time.perf_counter() - started) * 1000,
+    }
+
+
+def run_farm(seeds, policy='random', max_frames=None, workers=None, script=DEFAULT_SCRIPT):
+    """
+    Run games for the given seeds, yielding results as they finish.
+
+    Args:
+        seeds: Iterable of seeds, one game each
+        policy: Policy name
+        max_frames: Frame limit per game
+        workers: Worker processes (defaults to the CPU count); 1 or less
+            runs the games in this process
+        script: Script for the scripted policy
+
+    Yields:
+        dict: run_game result per game, in completion order
+    """
+    workers = workers if workers is not None else os.cpu_count() or 1
+    if workers <= 1:
+        for seed in seeds:
+            yield run_game(seed, policy, max_frames, script)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=prepare_worker) as executor:
+        futures = [executor.submit(run_game, seed, policy, max_frames, script) for seed in seeds]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def summarize(results):
+    """
+    Merge per-game results into aggregate statistics.
+
+    Returns:
+        dict: Game count, total frames and mean/median/min/max of score,
+            frames, level and ghost AI time
+    """
+    summary = {'games': len(results), 'total_frames': sum(r['frames'] for r in results),
+               'game_overs': sum(1 for r in results if r['game_over'])}
+    for key in ('score', 'frames', 'level', 'ai_ms'):
+        values = [r[key] for r in results]
+        summary[key] = {
+            'mean': statistics.fmean(values) if values else 0,
+            'median': statistics.median(values) if values else 0,
+            'min': min(values, default=0),
+            'max': max(values, default=0),
+        }
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=32, help='Number of games (K)')
+    parser.add_argument('--policy', choices=POLICIES, default='random', help='Input policy')
+    parser.add_argument('--script', default=DEFAULT_SCRIPT, help='Script for the scripted policy, e.g. R:60,D:30')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the first game (others follow)')
+    parser.add_argument('--max-frames', type=int, default=None, help='Frame limit per game')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: one per core)')
+    parser.add_argument('--jsonl', help='Also write one JSON result per line to this file')
+    parser.add_argument('--quiet', action='store_true', help='Only print the summary')
+    args = parser.parse_args(argv)
+
+    seeds = range(args.seed, args.seed + args.games)
+    out = open(args.jsonl, 'w') if args.jsonl else None
+    results = []
+    started = time.perf_counter()
+    try:
+        if not args.quiet:
+            print(f"{'seed':>6}{'score':>8}{'frames':>8}{'level':>7}{'lives':>7}{'ai ms':>9}{'wall ms':>10}")
+        for result in run_farm(seeds, args.policy, args.max_frames, args.workers, args.script):
+            results.append(result)
+            if out:
+                out.write(json.dumps(result) + '\n')
+            if not args.quiet:
+                print(f"{result['seed']:>6}{result['score']:>8}{result['frames']:>8}{result['level']:>7}"
+                      f"{result['lives']:>7}{result['ai_ms']:>9.1f}{result['wall_ms']:>10.1f}")
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - started
+
+    summary = summarize(results)
+    print(f"\n{summary['games']} games ({args.policy}), {summary['game_overs']} ended, "
+          f"{summary['total_frames']} frames in {elapsed:.2f} s "
+          f"({summary['total_frames'] / elapsed if elapsed > 0 else 0:,.0f} frames/s)")
+    for key in ('score', 'frames', 'level', 'ai_ms'):
+        stats = summary[key]
+        print(f"{key:<8} mean {stats['mean']:>10.1f}  median {stats['median']:>10.1f}  "
+              f"min {stats['min']:>10.1f}  max {stats['max']:>10.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,22 +1,37 @@
 """Main game orchestration"""
 import pygame
 import sys
+import time
 from . import config
 
-from .level import Level, PelletManager
-from .player import Player
-from .ghosts import Ghost
+from .simulation import Simulation
+from .replay import ReplayRecorder, ReplayPlayer
 from .utils import HighScoreManager
-from .state_machine import GameStateMachine, GameState
 from .input_handler import InputHandler
 from .debug.overlay import DebugOverlay
+from .timing import FixedTimestep, RateMeter
+from .profiler import FrameProfiler, NULL_PROFILER
+from .rendering import PlayfieldRenderer, DirtyRectTracker, HUD, SpriteAtlas, entity_rect
 
 
 class Game:
     """Main game class - orchestrates game loop and components"""
     
-    def __init__(self):
-        """Initialize game and all components"""
+    def __init__(self, turbo=False, turbo_steps=None, turbo_draw_every=None,
+                 record_path=None, replay=None, seed=0):
+        """
+        Initialize game and all components.
+        
+        Args:
+            turbo: Start in turbo (fast-forward) mode
+            turbo_steps: Simulation steps per loop iteration in turbo mode
+                (defaults to config.TURBO_STEPS_PER_FRAME)
+            turbo_draw_every: Redraw every N turbo steps, 0 for never
+                (defaults to config.TURBO_DRAW_EVERY)
+            record_path: Record the session's inputs to this replay file
+            replay: Replay to play back instead of reading the keyboard
+            seed: Seed for a recorded session
+        """
         pygame.init()
         self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
         pygame.display.set_caption("Pac-Man Retro")
@@ -25,228 +40,251 @@ class Game:
         self.font = pygame.font.Font(None, 36)
         
         # Initialize components
-        self.level = Level()
-        self.pellet_manager = PelletManager()
-        self.state_machine = GameStateMachine()
+        self.simulation = Simulation()
+        self.simulation.on_game_over = self.on_game_over
         self.input_handler = InputHandler()
         self.high_score_manager = HighScoreManager()
         self.debug_overlay = DebugOverlay()
-        
-        # Initialize entities
-        self.player = Player(config.TILE_SIZE, config.TILE_SIZE)
-        self.ghosts = [
-            Ghost(config.TILE_SIZE * 9, config.TILE_SIZE * 9, config.RED, "BLINKY"),
-            Ghost(config.TILE_SIZE * 10, config.TILE_SIZE * 9, config.PINK, "PINKY"),
-            Ghost(config.TILE_SIZE * 9, config.TILE_SIZE * 10, config.CYAN, "INKY"),
-            Ghost(config.TILE_SIZE * 10, config.TILE_SIZE * 10, config.ORANGE, "CLYDE"),
-        ]
-        
-        self.score = 0
+        self.playfield = PlayfieldRenderer(self.simulation.level, self.simulation.pellet_manager)
+        self.dirty_rects = DirtyRectTracker()
+        self.hud = HUD(self.font, dirty_rects=self.dirty_rects)
+        self.sprites = SpriteAtlas()
+        self.sprites.preload([self.simulation.player, *self.simulation.ghosts])
+        self.last_state = None
+        self.debug_was_enabled = False
+        
+        self.direction_input = (0, 0)
         self.new_high_score = False
         self.fps = 60  # FPS tracking for debug
+        self.timestep = FixedTimestep()
+        
+        # Turbo mode: many simulation steps per loop, no frame limiter
+        self.turbo = turbo
+        self.turbo_used = turbo
+        self.turbo_steps = turbo_steps if turbo_steps is not None else config.TURBO_STEPS_PER_FRAME
+        self.turbo_draw_every = turbo_draw_every if turbo_draw_every is not None else config.TURBO_DRAW_EVERY
+        self.steps_since_draw = 0
+        self.sim_rate = RateMeter()
+        self.sim_fps = 0.0
+        
+        # Per-phase frame timing, shared with the simulation
+        self.profiler = FrameProfiler() if config.PROFILER_ENABLED else NULL_PROFILER
+        self.simulation.profiler = self.profiler
+        
+        # Input recording / playback
+        self.record_path = record_path
+        self.recorder = ReplayRecorder(seed) if record_path else None
+        self.replay_player = ReplayPlayer(replay) if replay is not None else None
 
     def run(self):
-        """Main game loop"""
+        """
+        Main game loop.
+        
+        Runs 0..MAX_CATCH_UP_STEPS fixed simulation steps per rendered frame,
+        so game speed follows wall-clock time even when drawing is slow.
+        """
+        previous = time.perf_counter()
         while self.running:
+            now = time.perf_counter()
+            elapsed = now - previous
+            previous = now
+            
+            started = self.profiler.mark()
             self.handle_events()
-            self.update()
-            self.draw()
+            self.profiler.lap('events', started)
+            if self.turbo:
+                self.run_turbo_frame()
+                self.profiler.end_frame()
+                continue
+            
+            for _ in range(self.timestep.advance(elapsed)):
+                self.update()
+            self.draw(self.timestep.alpha)
+            self.profiler.end_frame()
             self.clock.tick(config.FPS)
         
+        if self.turbo_used:
+            print(f"Simulated {self.sim_rate.total} frames at {self.sim_rate.average():.0f} frames/s")
+        if self.recorder:
+            self.recorder.save(self.record_path)
+            print(f"Replay of {self.recorder.replay.steps} frames written to {self.record_path}")
         pygame.quit()
         sys.exit()
+    
+    def run_turbo_frame(self):
+        """Run turbo_steps simulation steps without frame limiting, drawing every turbo_draw_every steps"""
+        for _ in range(self.turbo_steps):
+            self.update()
+            self.steps_since_draw += 1
+            if self.turbo_draw_every and self.steps_since_draw >= self.turbo_draw_every:
+                self.draw()
+                self.steps_since_draw = 0
+        # Unlimited tick keeps the clock's frame timing meaningful
+        self.clock.tick()
+    
+    def toggle_turbo(self):
+        """Switch turbo mode on or off"""
+        self.turbo = not self.turbo
+        self.turbo_used = self.turbo_used or self.turbo
+        self.steps_since_draw = 0
+        # Do not make up for the time spent in turbo once it is switched off
+        self.timestep.reset()
+        if not self.turbo:
+            pygame.display.set_caption("Pac-Man Retro")
+            self.dirty_rects.request_full()
 
     def handle_events(self):
         """Process input events"""
+        state_machine = self.simulation.state_machine
         events = self.input_handler.process_events(
-            game_over=self.state_machine.is_game_over()
+            game_over=state_machine.is_game_over()
         )
         
         if events['quit']:
             self.running = False
-        elif events['restart'] and self.state_machine.is_game_over():
+            self.record_event('quit')
+        elif events['restart'] and state_machine.is_game_over() and not self.replay_player:
+            # During playback restarts come from the replay
             self.reset()
+            self.record_event('restart')
         elif events['debug_toggle']:
             self.debug_overlay.toggle()
-        
-        # Get directional input and pass to player
-        if self.state_machine.is_playing():
-            direction = self.input_handler.get_direction_input()
-            self.player.set_next_direction(direction)
+            self.record_event('debug_toggle')
+        elif events['turbo_toggle']:
+            self.toggle_turbo()
+            self.record_event('turbo_toggle')
+        elif events['profile_dump'] and self.profiler is not NULL_PROFILER:
+            print(f"Frame profile written to {self.profiler.dump()}")
+            self.record_event('profile_dump')
+        
+        # Get directional input for the next simulation step
+        self.direction_input = (0, 0)
+        if state_machine.is_playing() and not self.replay_player:
+            self.direction_input = self.input_handler.get_direction_input()
+
+    def record_event(self, name):
+        """Log a control event the game acted on, if recording"""
+        if self.recorder:
+            self.recorder.record_event(name)
 
     def update(self):
         """Update game state"""
-        # Check for state transitions
-        action = self.state_machine.update_transition()
-        if action == 'reload_level':
-            self.reload_level()
-        elif action == 'respawn':
-            self.respawn_entities()
-        
-        # Only update entities during active gameplay
-        if not self.state_machine.is_playing():
+        if self.replay_player:
+            self.update_from_replay()
+        elif self.recorder:
+            # Resolve the input buffer here so the replay holds the exact
+            # direction the player acted on and plays back without a handler
+            buffered = self.input_handler.get_buffered_direction()
+            direction = buffered if buffered != (0, 0) else self.direction_input
+            self.recorder.record_step(direction)
+            self.simulation.step(direction, self.input_handler)
+        else:
+            self.simulation.step(self.direction_input, self.input_handler)
+        if self.sim_rate.add():
+            self.sim_fps = self.sim_rate.rate
+            if self.turbo:
+                pygame.display.set_caption(
+                    f"Pac-Man Retro [TURBO x{self.turbo_steps}] {self.sim_fps:.0f} sim fps")
+
+    def update_from_replay(self):
+        """Run the next recorded step, ending the session when the replay runs out"""
+        player = self.replay_player
+        if player.finished:
+            self.running = False
             return
-        
-        # Update player with input handler for buffering
-        self.player.update(self.level, self.input_handler)
-        
-        # Collect pellets
-        points = self.pellet_manager.collect_pellet(self.player.x, self.player.y)
-        self.score += points
-        
-        # Check level completion
-        self.state_machine.check_level_complete(self.pellet_manager.pellets_remaining())
-        
-        # Update ghosts (pass player and blinky for AI targeting)
-        blinky = self.ghosts[0] if len(self.ghosts) > 0 else None
-        
-        # Ghost Release Logic
-        # Frame-based timer for release
-        current_time = pygame.time.get_ticks()
-        
-        # Simple staggered release: 0s, 5s, 10s, 15s
-        # 0: BLINKY (Immediate)
-        # 1: PINKY (5s)
-        # 2: INKY (10s)
-        # 3: CLYDE (15s)
-        
-        # Note: In a real game this would use a dot counter, but user asked for a "trigger"
-        if len(self.ghosts) >= 4:
-            # BLINKY (0) is active by default (handled in init/respawn)
-            
-            # PINKY (1)
-            if self.ghosts[1].behavior == GhostBehavior.IDLE and current_time - self.state_machine.state_start_time > 5000:
-                self.ghosts[1].behavior = GhostBehavior.SCATTER
-            
-            # INKY (2)
-            if self.ghosts[2].behavior == GhostBehavior.IDLE and current_time - self.state_machine.state_start_time > 10000:
-                self.ghosts[2].behavior = GhostBehavior.SCATTER
-                
-            # CLYDE (3)
-            if self.ghosts[3].behavior == GhostBehavior.IDLE and current_time - self.state_machine.state_start_time > 15000:
-                self.ghosts[3].behavior = GhostBehavior.SCATTER
+        for event in player.pending_events():
+            if event == 'restart':
+                self.reset()
+        self.simulation.step(player.next_direction())
 
-        for ghost in self.ghosts:
-            ghost.update(self.level, self.player, blinky)
-            
-            # Check collision with player
-            if ghost.collides_with(self.player):
-                if self.state_machine.check_life_lost(True):
-                    # Update high score if game over
-                    if self.state_machine.is_game_over():
-                        self.new_high_score = self.high_score_manager.update_high_score(self.score)
+    def on_game_over(self, score):
+        """Update high score when the simulation reports game over"""
+        self.new_high_score = self.high_score_manager.update_high_score(score)
 
-    def draw(self):
-        """Render to the screen"""
+    def draw(self, alpha=1.0):
+        """
+        Render to the screen.
+        
+        Args:
+            alpha: Fraction of a simulation step since the last update;
+                entities are drawn between their previous and current position
+        """
+        sim = self.simulation
+        profiler = self.profiler
+        started = profiler.mark()
         self.screen.fill(config.BLACK)
         
-        # Draw level and pellets
-        self.level.draw(self.screen)
-        self.pellet_manager.draw(self.screen)
+        # Draw level and pellets from the cached layers
+        self.playfield.draw(self.screen)
+        started = profiler.lap('draw_playfield', started)
         
         # Draw entities
-        for ghost in self.ghosts:
-            ghost.draw(self.screen)
-        self.player.draw(self.screen)
+        for index, ghost in enumerate(sim.ghosts):
+            self.draw_entity(('ghost', index), ghost, alpha)
+        self.draw_entity('player', sim.player, alpha)
+        started = profiler.lap('draw_entities', started)
         
         # Draw UI
         self.draw_ui()
+        started = profiler.lap('draw_hud', started)
         
         # Draw debug overlay
-        self.debug_overlay.draw(self.screen, self.level, self.player, self.ghosts, 
-                               self.state_machine, self.fps)
+        self.debug_overlay.draw(self.screen, sim.level, sim.player, sim.ghosts, 
+                               sim.state_machine, self.fps, self.sim_fps,
+                               profiler if profiler is not NULL_PROFILER else None)
+        started = profiler.lap('draw_debug', started)
         
-        pygame.display.flip()
+        self.present()
+        profiler.lap('present', started)
         
         # Update FPS for debug
         self.fps = self.clock.get_fps() if self.clock.get_fps() > 0 else 60
     
-    def draw_ui(self):
-        """Draw UI elements (score, lives, messages)"""
-        # Draw score (Top Left)
-        score_text = self.font.render(f"Score: {self.score}", True, config.WHITE)
-        self.screen.blit(score_text, (10, 10))
-        
-        # Draw high score (Top Center)
-        high_score = self.high_score_manager.get_high_score()
-        high_score_text = self.font.render(f"High Score: {high_score}", True, config.YELLOW)
-        high_score_rect = high_score_text.get_rect(midtop=(config.SCREEN_WIDTH // 2, 10))
-        self.screen.blit(high_score_text, high_score_rect)
-        
-        # Draw lives (Bottom Left)
-        lives_text = self.font.render(f"Lives: {self.state_machine.lives}", True, config.WHITE)
-        self.screen.blit(lives_text, (10, config.SCREEN_HEIGHT - 40))
-        
-        # Draw level number (Bottom Right)
-        level_text = self.font.render(f"Level: {self.state_machine.level_number}", True, config.WHITE)
-        self.screen.blit(level_text, (config.SCREEN_WIDTH - 150, config.SCREEN_HEIGHT - 40))
-        
-        # Draw pellets remaining (debug-ish, kept on bottom left above lives)
-        pellets_remaining = self.pellet_manager.pellets_remaining()
-        pellets_text = self.font.render(f"Pellets: {pellets_remaining}", True, config.WHITE)
-        self.screen.blit(pellets_text, (10, config.SCREEN_HEIGHT - 80))
-        
-        # Draw state-specific messages
-        current_state = self.state_machine.get_state()
-        
-        if current_state == GameState.GAME_OVER:
-            game_over_text = self.font.render("GAME OVER!", True, config.RED)
-            text_rect = game_over_text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 - 40))
-            self.screen.blit(game_over_text, text_rect)
-            
-            if self.new_high_score:
-                new_high_text = self.font.render("NEW HIGH SCORE!", True, config.YELLOW)
-                new_high_rect = new_high_text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2))
-                self.screen.blit(new_high_text, new_high_rect)
-            
-            restart_text = self.font.render("Press R to Restart", True, config.WHITE)
-            restart_rect = restart_text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 + 40))
-            self.screen.blit(restart_text, restart_rect)
-        
-        elif current_state == GameState.LEVEL_COMPLETE:
-            complete_text = self.font.render("LEVEL COMPLETE!", True, config.YELLOW)
-            text_rect = complete_text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2))
-            self.screen.blit(complete_text, text_rect)
-        
-        elif current_state == GameState.LIFE_LOST:
-            life_lost_text = self.font.render("LIFE LOST!", True, config.RED)
-            text_rect = life_lost_text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2))
-            self.screen.blit(life_lost_text, text_rect)
+    def draw_entity(self, key, entity, alpha=1.0):
+        """
+        Draw an entity at its interpolated position and track its screen region.
+        
+        Uses the sprite atlas, or draws shapes if the atlas is off.
+        
+        Args:
+            key: Entity name used for dirty-rect tracking
+            entity: Entity instance
+            alpha: Interpolation factor between previous and current position
+        """
+        position = entity.interpolated_position(alpha)
+        if config.SPRITE_ATLAS_ENABLED:
+            self.sprites.draw(self.screen, entity, position)
+        else:
+            entity.draw_at(self.screen, int(position[0]), int(position[1]))
+        self.dirty_rects.track(key, entity_rect(entity, position))
     
-    def reload_level(self):
-        """Reload level (reset pellets and entities)"""
-        self.pellet_manager.reset()
-        self.respawn_entities()
-    
-    def respawn_entities(self):
-        """Respawn player and ghosts at starting positions"""
-        # Calculate ghost speed based on level (increases by 0.1 per level, capped at player speed)
-        level_modifier = (self.state_machine.level_number - 1) * 0.1
-        ghost_speed = min(config.GHOST_SPEED + level_modifier, config.PLAYER_SPEED - 0.2)
-        
-        self.player = Player(config.TILE_SIZE, config.TILE_SIZE)
-        
-        # Initialize ghosts
-        # Blinky starts active
-        g1 = Ghost(config.TILE_SIZE * 9, config.TILE_SIZE * 9, config.RED, "BLINKY", ghost_speed)
-        g1.behavior = GhostBehavior.SCATTER
-        
-        # Others start idle
-        g2 = Ghost(config.TILE_SIZE * 10, config.TILE_SIZE * 9, config.PINK, "PINKY", ghost_speed)
-        g2.behavior = GhostBehavior.IDLE
+    def present(self):
+        """Push the frame to the display (only changed regions in dirty-rect mode)"""
+        sim = self.simulation
+        erased = self.playfield.pop_erased()
+        if not config.DIRTY_RECT_RENDERING:
+            pygame.display.flip()
+            return
         
-        g3 = Ghost(config.TILE_SIZE * 9, config.TILE_SIZE * 10, config.CYAN, "INKY", ghost_speed)
-        g3.behavior = GhostBehavior.IDLE
+        # Full flip on state transitions and while (or right after) the overlay is shown
+        state = sim.state_machine.get_state()
+        debug_enabled = self.debug_overlay.enabled
+        if state != self.last_state or debug_enabled or self.debug_was_enabled:
+            self.dirty_rects.request_full()
+        self.last_state = state
+        self.debug_was_enabled = debug_enabled
         
-        g4 = Ghost(config.TILE_SIZE * 10, config.TILE_SIZE * 10, config.ORANGE, "CLYDE", ghost_speed)
-        g4.behavior = GhostBehavior.IDLE
+        for rect in erased:
+            self.dirty_rects.mark(rect)
         
-        self.ghosts = [g1, g2, g3, g4]
+        self.dirty_rects.present()
+    
+    def draw_ui(self):
+        """Draw UI elements (score, lives, messages)"""
+        high_score = self.high_score_manager.get_high_score()
+        self.hud.draw(self.screen, self.simulation, high_score, self.new_high_score)
     
     def reset(self):
         """Reset game to initial state"""
-        self.state_machine.reset()
-        self.pellet_manager.reset()
-        self.respawn_entities()
-        self.score = 0
+        self.simulation.reset()
         self.new_high_score = False
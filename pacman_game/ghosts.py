@@ -1,8 +1,10 @@
 """Ghost entities with AI"""
-import pygame
+from time import perf_counter_ns
 from .entities.base import Entity
 from . import config
 from .ai.pathfinding import get_next_direction
+from .ai.incremental import IncrementalPlanner
+from .ai.junction_graph import get_junction_graph
 from .ai.ghost_behaviors import GhostBehavior, get_target_tile
 
 
@@ -33,8 +35,20 @@ class Ghost(Entity):
         self.ghost_type = ghost_type
         self.behavior = GhostBehavior.SCATTER
         self.behavior_timer = 0
+        # Standalone fallback: a ghost outside a Simulation counts its own
+        # scatter/chase frames. Simulation clears this so its ModeController
+        # is the only source of mode timing.
+        self.owns_mode_timer = True
+        # Set on a mode change; the next update (or tile center) replans at once
+        self.replan_needed = False
         self.target_tile = None
         self.pathfinding_update_counter = 0
+        self.replan_count = 0
+        # Total time spent choosing targets and paths (for the frame profiler)
+        self.ai_time_ns = 0
+        
+        # Per-ghost search state for incremental replanning
+        self.planner = IncrementalPlanner() if config.PATHFINDING_STRATEGY == "incremental" else None
     
     def update(self, level, player, blinky=None):
         """
@@ -50,21 +64,24 @@ class Ghost(Entity):
             # Ghost is in house, do nothing (or bounce)
             return
 
-        self.behavior_timer += 1
+        if self.owns_mode_timer:
+            self.behavior_timer += 1
+            
+            # Behavior pattern: scatter for 7 seconds, chase for 20 seconds, repeat
+            if self.behavior == GhostBehavior.SCATTER:
+                if self.behavior_timer >= config.SCATTER_DURATION:
+                    self.switch_mode()
+            elif self.behavior == GhostBehavior.CHASE:
+                if self.behavior_timer >= config.CHASE_DURATION:
+                    self.switch_mode()
         
-        # Behavior pattern: scatter for 7 seconds, chase for 20 seconds, repeat
-        if self.behavior == GhostBehavior.SCATTER:
-            if self.behavior_timer >= config.SCATTER_DURATION:
-                self.behavior = GhostBehavior.CHASE
-                self.behavior_timer = 0
-        elif self.behavior == GhostBehavior.CHASE:
-            if self.behavior_timer >= config.CHASE_DURATION:
-                self.behavior = GhostBehavior.SCATTER
-                self.behavior_timer = 0
+        if config.GHOST_JUNCTION_DECISIONS:
+            self.move_between_junctions(level, player, blinky)
+            return
         
         # Update pathfinding periodically (not every frame for performance)
         self.pathfinding_update_counter += 1
-        if self.pathfinding_update_counter >= config.PATHFINDING_UPDATE_INTERVAL:
+        if self.replan_needed or self.pathfinding_update_counter >= config.PATHFINDING_UPDATE_INTERVAL:
             self.pathfinding_update_counter = 0
             self.update_target(level, player, blinky)
         
@@ -80,6 +97,105 @@ class Ghost(Entity):
             # Hit a wall, recalculate path immediately
             self.update_target(level, player, blinky)
     
+    def switch_mode(self):
+        """Flip between SCATTER and CHASE (other behaviors are left unchanged)"""
+        if self.behavior == GhostBehavior.SCATTER:
+            self.enter_mode(GhostBehavior.CHASE)
+        elif self.behavior == GhostBehavior.CHASE:
+            self.enter_mode(GhostBehavior.SCATTER)
+    
+    def enter_mode(self, behavior):
+        """
+        Switch to a scatter/chase phase and flag a replan.
+        
+        Ghosts in any other behavior (e.g. still in the house) ignore it.
+        
+        Args:
+            behavior: GhostBehavior.SCATTER or GhostBehavior.CHASE
+            
+        Returns:
+            bool: True if the ghost took the new phase
+        """
+        if self.behavior not in (GhostBehavior.SCATTER, GhostBehavior.CHASE):
+            return False
+        self.behavior = behavior
+        self.behavior_timer = 0
+        self.replan_needed = True
+        return True
+    
+    def move_between_junctions(self, level, player, blinky=None):
+        """
+        Move along corridors, only replanning at junction tile centers.
+        
+        Corridor tiles have a single way forward, so the ghost follows it
+        without consulting the AI. Movement is split at tile centers so a
+        turn never cuts a corner.
+        
+        Args:
+            level: Level instance for collision detection
+            player: Player instance for targeting
+            blinky: Blinky ghost instance (for Inky's targeting)
+        """
+        tile_size = config.TILE_SIZE
+        remaining = self.speed
+        
+        while remaining > 0:
+            grid_x = int(self.x // tile_size)
+            grid_y = int(self.y // tile_size)
+            center_x = grid_x * tile_size + tile_size / 2
+            center_y = grid_y * tile_size + tile_size / 2
+            dx, dy = self.direction
+            
+            # Distance along the current direction to this tile's center
+            to_center = (center_x - self.x) * dx + (center_y - self.y) * dy
+            if self.direction == (0, 0) or abs(to_center) < 1e-9:
+                self.x, self.y = center_x, center_y
+                self.choose_direction((grid_x, grid_y), level, player, blinky)
+                if self.direction == (0, 0):
+                    return
+                dx, dy = self.direction
+                to_center = tile_size
+            elif to_center < 0:
+                # Past this center, heading for the next tile's
+                to_center += tile_size
+            
+            step = min(remaining, to_center)
+            self.x += dx * step
+            self.y += dy * step
+            remaining -= step
+    
+    def choose_direction(self, tile, level, player, blinky=None):
+        """
+        Pick a direction at a tile center.
+        
+        Args:
+            tile: Current tile (grid_x, grid_y)
+            level: Level instance for collision detection
+            player: Player instance for targeting
+            blinky: Blinky ghost instance (for Inky's targeting)
+        """
+        graph = get_junction_graph(level)
+        exits = graph.exits.get(tile, ())
+        reverse = (-self.direction[0], -self.direction[1])
+        forward = [d for d in exits if d != reverse]
+        
+        if self.replan_needed or graph.is_junction(tile) or len(forward) != 1:
+            self.update_target(level, player, blinky)
+            if self.direction in exits:
+                return
+        elif forward:
+            # Corridor: follow the only way forward
+            self.direction = forward[0]
+            return
+        
+        # No usable plan: keep going, else take any exit, else stop
+        if forward:
+            self.direction = forward[0]
+        elif exits:
+            self.direction = exits[0]
+        else:
+            self.direction = (0, 0)
+    
     def update_target(self, level, player, blinky=None):
         """
         Update target tile and calculate path.
@@ -89,6 +205,10 @@ class Ghost(Entity):
             player: Player instance for targeting
             blinky: Blinky ghost instance (for Inky's targeting)
         """
+        self.replan_count += 1
+        self.replan_needed = False
+        started = perf_counter_ns()
+        
         # Convert positions to grid coordinates
         ghost_grid_pos = (int(self.x / config.TILE_SIZE), int(self.y / config.TILE_SIZE))
         player_grid_pos = (int(player.x / config.TILE_SIZE), int(player.y / config.TILE_SIZE))
@@ -111,28 +231,30 @@ class Ghost(Entity):
             blinky_grid_pos
         )
         
-        # Calculate next direction using A* pathfinding
-        next_direction = get_next_direction(ghost_grid_pos, self.target_tile, level)
+        # Calculate next direction (strategy set by config.PATHFINDING_STRATEGY)
+        next_direction = get_next_direction(ghost_grid_pos, self.target_tile, level, planner=self.planner)
         
         if next_direction != (0, 0):
             self.direction = next_direction
+        
+        self.ai_time_ns += perf_counter_ns() - started
     
-    def draw(self, screen):
-        """Draw the ghost with eyes"""
+    def draw_at(self, surface, center_x, center_y):
+        """Draw the ghost with eyes centered on a pixel position"""
+        import pygame
         # Draw body using parent class
-        super().draw(screen)
+        super().draw_at(surface, center_x, center_y)
         
         # Draw eyes
         eye_offset = 5
         eye_radius = 3
         # Left eye
-        pygame.draw.circle(screen, config.WHITE, 
-                         (int(self.x - eye_offset), int(self.y - 3)), eye_radius)
-        pygame.draw.circle(screen, config.BLACK, 
-                         (int(self.x - eye_offset), int(self.y - 3)), eye_radius // 2)
+        pygame.draw.circle(surface, config.WHITE, 
+                         (center_x - eye_offset, center_y - 3), eye_radius)
+        pygame.draw.circle(surface, config.BLACK, 
+                         (center_x - eye_offset, center_y - 3), eye_radius // 2)
         # Right eye
-        pygame.draw.circle(screen, config.WHITE, 
-                         (int(self.x + eye_offset), int(self.y - 3)), eye_radius)
-        pygame.draw.circle(screen, config.BLACK, 
-                         (int(self.x + eye_offset), int(self.y - 3)), eye_radius // 2)
-
+        pygame.draw.circle(surface, config.WHITE, 
+                         (center_x + eye_offset, center_y - 3), eye_radius)
+        pygame.draw.circle(surface, config.BLACK, 
+                         (center_x + eye_offset, center_y - 3), eye_radius // 2)
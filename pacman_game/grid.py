@@ -0,0 +1,203 @@
+"""Flat tile grid with a sentinel wall border, shared by Level and Maze"""
+from typing import Sequence
+
+# Cell value treated as a wall (also used for the sentinel border)
+WALL = 1
+
+# Exit mask bit per direction (left, right, up, down)
+EXIT_BITS = {(-1, 0): 1, (1, 0): 2, (0, -1): 4, (0, 1): 8}
+
+# (bit, dx, dy) in neighbor expansion order (left, right, up, down)
+EXITS = ((1, -1, 0), (2, 1, 0), (4, 0, -1), (8, 0, 1))
+
+# (dx, dy) in the same order, for code that checks neighbors without masks
+NEIGHBOR_OFFSETS = tuple((dx, dy) for _, dx, dy in EXITS)
+
+
+class Grid:
+    """
+    Tile grid stored in a flat bytearray with a one-tile border of walls.
+
+    Because every tile has a sentinel on each side, neighbor lookups and
+    entity corner checks from inside the grid never need a bounds check:
+    index = row_offsets[grid_y + 1] + grid_x works for grid_x in
+    [-1, cols] and grid_y in [-1, rows].
+
+    Each tile (sentinels included) also has a 4-bit mask of its open
+    neighbors (see EXIT_BITS), kept up to date when cells are written, so
+    turn checks and neighbor scans are one lookup instead of four.
+
+    Indexing a Grid (grid[y][x]) returns write-through row views, so code
+    written against the old list-of-lists grids keeps working.
+    """
+
+    def __init__(self, rows: Sequence[Sequence[int]], tile_size: int, on_change=None):
+        """
+        Initialize the grid from rows of cell values.
+
+        Args:
+            rows: Rows of cell values (1 = wall)
+            tile_size: Tile size in pixels for can_move_to
+            on_change: Optional callback invoked after any cell is written
+        """
+        self.rows = len(rows)
+        self.cols = len(rows[0]) if self.rows else 0
+        self.tile_size = tile_size
+        self.on_change = on_change
+
+        self.stride = self.cols + 2
+        self.cells = bytearray([WALL]) * (self.stride * (self.rows + 2))
+        # Offset of column 0 in each padded row; row_offsets[0] is the top sentinel row
+        self.row_offsets = [row * self.stride + 1 for row in range(self.rows + 2)]
+
+        for y, row in enumerate(rows):
+            start = self.row_offsets[y + 1]
+            self.cells[start:start + self.cols] = bytes(row)
+
+        self.exits = bytearray(len(self.cells))
+        for index in range(len(self.cells)):
+            self.exits[index] = self._compute_exits(index)
+
+    def _compute_exits(self, index: int) -> int:
+        """Exit mask of a flat cell index from its four neighbors"""
+        cells = self.cells
+        mask = 0
+        # Stepping off either side of a padded row lands on another sentinel
+        for bit, step in ((1, -1), (2, 1), (4, -self.stride), (8, self.stride)):
+            neighbor = index + step
+            if 0 <= neighbor < len(cells) and cells[neighbor] != WALL:
+                mask |= bit
+        return mask
+
+    def index(self, grid_x: int, grid_y: int) -> int:
+        """Flat cell index of a tile (valid for the sentinel border too)"""
+        return self.row_offsets[grid_y + 1] + grid_x
+
+    def get(self, grid_x: int, grid_y: int) -> int:
+        """Get the cell value of an in-bounds tile"""
+        return self.cells[self.row_offsets[grid_y + 1] + grid_x]
+
+    def set(self, grid_x: int, grid_y: int, value: int):
+        """Set the cell value of an in-bounds tile"""
+        index = self.row_offsets[grid_y + 1] + grid_x
+        was_wall = self.cells[index] == WALL
+        self.cells[index] = value
+        if was_wall != (value == WALL):
+            for neighbor in (index - 1, index + 1, index - self.stride, index + self.stride):
+                if 0 <= neighbor < len(self.cells):
+                    self.exits[neighbor] = self._compute_exits(neighbor)
+        if self.on_change:
+            self.on_change()
+
+    def is_wall(self, grid_x: int, grid_y: int) -> bool:
+        """
+        Check if a grid position is a wall.
+
+        Args:
+            grid_x: Grid X coordinate
+            grid_y: Grid Y coordinate
+
+        Returns:
+            bool: True if position is a wall or out of bounds
+        """
+        # AI targets can lie anywhere off the map, beyond the sentinel border
+        if -1 <= grid_x <= self.cols and -1 <= grid_y <= self.rows:
+            return self.cells[self.row_offsets[grid_y + 1] + grid_x] == WALL
+        return True
+
+    def exit_mask(self, grid_x: int, grid_y: int) -> int:
+        """
+        Get the open-neighbor mask of a tile.
+
+        Args:
+            grid_x: Grid X coordinate
+            grid_y: Grid Y coordinate
+
+        Returns:
+            int: OR of EXIT_BITS for each neighbor that is not a wall
+        """
+        # Same range check as is_wall: callers pass arbitrary tiles
+        if -1 <= grid_x <= self.cols and -1 <= grid_y <= self.rows:
+            return self.exits[self.row_offsets[grid_y + 1] + grid_x]
+        return 0
+
+    def can_move_to(self, x, y, radius) -> bool:
+        """
+        Check if a circular entity can move to pixel position (x, y).
+
+        Args:
+            x: Pixel X coordinate (center of entity)
+            y: Pixel Y coordinate (center of entity)
+            radius: Collision radius of entity
+
+        Returns:
+            bool: True if none of the bounding box corners is in a wall
+        """
+        tile_size = self.tile_size
+        grid_left = int((x - radius) / tile_size)
+        grid_right = int((x + radius) / tile_size)
+        grid_top = int((y - radius) / tile_size)
+        grid_bottom = int((y + radius) / tile_size)
+
+        if -1 <= grid_left and grid_right <= self.cols and -1 <= grid_top and grid_bottom <= self.rows:
+            # Fast path: all corners lie inside the padded grid
+            cells = self.cells
+            top = self.row_offsets[grid_top + 1]
+            bottom = self.row_offsets[grid_bottom + 1]
+            return not (cells[top + grid_left] == WALL or cells[top + grid_right] == WALL or
+                        cells[bottom + grid_left] == WALL or cells[bottom + grid_right] == WALL)
+
+        # Only entities already outside the padded border get here
+        is_wall = self.is_wall
+        return not (is_wall(grid_left, grid_top) or is_wall(grid_right, grid_top) or
+                    is_wall(grid_left, grid_bottom) or is_wall(grid_right, grid_bottom))
+
+    def to_lists(self):
+        """Copy the grid out as a list of row lists"""
+        return [list(self.cells[start:start + self.cols]) for start in self.row_offsets[1:-1]]
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, grid_y: int) -> 'GridRow':
+        if grid_y < 0:
+            grid_y += self.rows
+        if not 0 <= grid_y < self.rows:
+            raise IndexError("grid row out of range")
+        return GridRow(self, grid_y)
+
+    def __iter__(self):
+        for grid_y in range(self.rows):
+            yield GridRow(self, grid_y)
+
+
+class GridRow:
+    """Write-through view of one grid row, indexable like a list"""
+
+    def __init__(self, grid: Grid, grid_y: int):
+        self.grid = grid
+        self.grid_y = grid_y
+        self.start = grid.row_offsets[grid_y + 1]
+
+    def _column(self, grid_x: int) -> int:
+        if grid_x < 0:
+            grid_x += self.grid.cols
+        if not 0 <= grid_x < self.grid.cols:
+            raise IndexError("grid column out of range")
+        return grid_x
+
+    def __len__(self):
+        return self.grid.cols
+
+    def __getitem__(self, grid_x: int) -> int:
+        return self.grid.cells[self.start + self._column(grid_x)]
+
+    def __setitem__(self, grid_x: int, value: int):
+        self.grid.set(self._column(grid_x), self.grid_y, value)
+
+    def __iter__(self):
+        return iter(self.grid.cells[self.start:self.start + self.grid.cols])
+
+    def count(self, value: int) -> int:
+        """Count cells in the row equal to value"""
+        return self.grid.cells[self.start:self.start + self.grid.cols].count(value)
@@ -12,6 +12,8 @@ class InputHandler:
         self.quit_requested = False
         self.restart_requested = False
         self.debug_toggle_requested = False
+        self.turbo_toggle_requested = False
+        self.profile_dump_requested = False
         self.current_direction_input = (0, 0)
         
         # Input buffering
@@ -31,6 +33,8 @@ class InputHandler:
         self.quit_requested = False
         self.restart_requested = False
         self.debug_toggle_requested = False
+        self.turbo_toggle_requested = False
+        self.profile_dump_requested = False
         
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -40,11 +44,17 @@ class InputHandler:
                     self.restart_requested = True
                 elif event.key == pygame.K_F3:
                     self.debug_toggle_requested = True
+                elif event.key == pygame.K_F4:
+                    self.turbo_toggle_requested = True
+                elif event.key == pygame.K_F5:
+                    self.profile_dump_requested = True
         
         return {
             'quit': self.quit_requested,
             'restart': self.restart_requested,
-            'debug_toggle': self.debug_toggle_requested
+            'debug_toggle': self.debug_toggle_requested,
+            'turbo_toggle': self.turbo_toggle_requested,
+            'profile_dump': self.profile_dump_requested
         }
     
     def get_direction_input(self):
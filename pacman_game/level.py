@@ -1,6 +1,13 @@
 """Level management - static level data and collision detection"""
-import pygame
+import itertools
 from . import config
+from .grid import Grid, EXIT_BITS
+
+# Revisions are unique across all levels, so (revision, ...) keys never collide
+_revisions = itertools.count(1)
+
+# Maps pellet cells (0/1 bytes) to binary digits for building bitmasks
+MASK_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
 
 # Level map: 1 = Wall, 2 = Dot, 0 = Empty
 LEVEL_MAP = [
@@ -28,69 +35,66 @@ LEVEL_MAP = [
 
 
 class Level:
-    """Manages static level data and collision detection"""
+    """
+    Manages static level data and collision detection.
+    
+    Collision queries are the bound methods of the current Grid, rebound
+    whenever a new grid is assigned, so hot callers skip a delegation layer:
+    
+        is_wall(grid_x, grid_y): True if the tile is a wall or out of bounds
+        exit_mask(grid_x, grid_y): OR of grid.EXIT_BITS for open neighbors
+        can_move_to(x, y, radius): True if a circle at pixel (x, y) is clear
+    """
     
     def __init__(self):
         """Initialize the level with the static map"""
+        self.tile_size = config.TILE_SIZE
         # Store immutable level grid (walls only)
         self.grid = [[1 if cell == 1 else 0 for cell in row] for row in LEVEL_MAP]
-        self.tile_size = config.TILE_SIZE
     
-    def is_wall(self, grid_x, grid_y):
+    @property
+    def grid(self):
+        """Wall grid (1 = wall, 0 = open), indexable as grid[y][x]"""
+        return self._grid
+    
+    @grid.setter
+    def grid(self, grid):
+        self._grid = Grid(grid, self.tile_size, on_change=self.invalidate)
+        # Collision queries (see class docstring) go straight to the grid
+        self.is_wall = self._grid.is_wall
+        self.can_move_to = self._grid.can_move_to
+        self.exit_mask = self._grid.exit_mask
+        self.invalidate()
+    
+    def invalidate(self):
         """
-        Check if a grid position is a wall.
+        Mark the grid as changed.
         
-        Args:
-            grid_x: Grid X coordinate
-            grid_y: Grid Y coordinate
-            
-        Returns:
-            bool: True if position is a wall or out of bounds
+        Assigns a new revision so tables and caches derived from the grid
+        (next-hop table, flow fields, path cache) are rebuilt. Assigning a
+        new grid or writing a cell through grid[y][x] does this
+        automatically.
         """
-        if grid_y < 0 or grid_y >= len(self.grid):
-            return True
-        if grid_x < 0 or grid_x >= len(self.grid[0]):
-            return True
-        return self.grid[grid_y][grid_x] == 1
+        self.revision = next(_revisions)
     
-    def can_move_to(self, x, y, radius):
+    def has_exit(self, grid_x, grid_y, direction):
         """
-        Check if a circular entity can move to pixel position (x, y).
+        Check if a tile has an open neighbor in a direction.
         
         Args:
-            x: Pixel X coordinate (center of entity)
-            y: Pixel Y coordinate (center of entity)
-            radius: Collision radius of entity
+            grid_x: Grid X coordinate
+            grid_y: Grid Y coordinate
+            direction: Tuple (dx, dy) of a single step
             
         Returns:
-            bool: True if position is valid (not colliding with walls)
+            bool: True if the neighbor in that direction is not a wall
         """
-        # Check the four corners of the bounding box
-        left = x - radius
-        right = x + radius
-        top = y - radius
-        bottom = y + radius
-        
-        # Convert to grid coordinates
-        grid_left = int(left / self.tile_size)
-        grid_right = int(right / self.tile_size)
-        grid_top = int(top / self.tile_size)
-        grid_bottom = int(bottom / self.tile_size)
-        
-        # Check all four corners
-        if self.is_wall(grid_left, grid_top):
-            return False
-        if self.is_wall(grid_right, grid_top):
-            return False
-        if self.is_wall(grid_left, grid_bottom):
-            return False
-        if self.is_wall(grid_right, grid_bottom):
-            return False
-        
-        return True
+        return bool(self.exit_mask(grid_x, grid_y) & EXIT_BITS.get(direction, 0))
     
     def draw(self, screen):
         """Draw the level walls"""
+        # Drawing is the only pygame use, so headless runs never import it
+        import pygame
         for row_idx, row in enumerate(self.grid):
             for col_idx, tile in enumerate(row):
                 if tile == 1:
@@ -113,6 +117,13 @@ class PelletManager:
         self.tile_size = config.TILE_SIZE
         self.total_pellets = sum(row.count(1) for row in self.pellet_grid)
         self.collected_count = 0
+        # Bumped on every change so renderers can tell when their copy is stale
+        self.revision = 0
+        # Callback invoked with (grid_x, grid_y) after a pellet is collected
+        self.on_collect = None
+        # Pellet bitmask cached for the revision it was built at
+        self.mask = 0
+        self.mask_revision = None
     
     def collect_pellet(self, x, y):
         """
@@ -132,6 +143,9 @@ class PelletManager:
             if self.pellet_grid[grid_y][grid_x] == 1:
                 self.pellet_grid[grid_y][grid_x] = 0  # Remove the pellet
                 self.collected_count += 1
+                self.revision += 1
+                if self.on_collect:
+                    self.on_collect(grid_x, grid_y)
                 return config.POINTS_PER_PELLET
         return 0
     
@@ -144,13 +158,56 @@ class PelletManager:
         """
         return self.total_pellets - self.collected_count
     
+    def pellet_mask(self):
+        """
+        Get the remaining pellets as a bitmask.
+        
+        Bit row * columns + column is set for each uncollected pellet. The
+        mask is rebuilt only after the grid changed.
+        
+        Returns:
+            int: Pellet bitmask
+        """
+        if self.mask_revision != self.revision:
+            cells = b''.join(map(bytes, self.pellet_grid))
+            # One '0'/'1' digit per cell, reversed so cell 0 is the low bit
+            self.mask = int(cells.translate(MASK_DIGITS)[::-1], 2)
+            self.mask_revision = self.revision
+        return self.mask
+    
+    def restore_mask(self, mask):
+        """
+        Set the pellet grid from a bitmask made by pellet_mask.
+        
+        The grid is updated in place and only tiles that differ are touched.
+        
+        Args:
+            mask: Pellet bitmask
+        """
+        changed = self.pellet_mask() ^ mask
+        if not changed:
+            return
+        grid = self.pellet_grid
+        columns = len(grid[0])
+        while changed:
+            bit = changed & -changed
+            row, column = divmod(bit.bit_length() - 1, columns)
+            grid[row][column] = 1 if mask & bit else 0
+            changed ^= bit
+        self.collected_count = self.total_pellets - mask.bit_count()
+        self.revision += 1
+        self.mask = mask
+        self.mask_revision = self.revision
+    
     def reset(self):
         """Reset all pellets to initial state"""
         self.pellet_grid = [[1 if cell == 2 else 0 for cell in row] for row in LEVEL_MAP]
         self.collected_count = 0
+        self.revision += 1
     
     def draw(self, screen):
         """Draw all uncollected pellets"""
+        import pygame
         for row_idx, row in enumerate(self.pellet_grid):
             for col_idx, tile in enumerate(row):
                 if tile == 1:
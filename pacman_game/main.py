@@ -1,7 +1,62 @@
+import argparse
+import sys
+import time
+import warnings
+
 from pacman_game.game import Game
+from pacman_game.replay import Replay, play_headless
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Pac-Man Retro")
+    parser.add_argument("--turbo", action="store_true",
+                        help="start in turbo mode (toggle with F4): run many simulation steps per frame")
+    parser.add_argument("--turbo-steps", type=int, default=None, metavar="K",
+                        help="simulation steps per frame in turbo mode")
+    parser.add_argument("--draw-every", type=int, default=None, metavar="N",
+                        help="redraw every N steps in turbo mode (0 = never)")
+    parser.add_argument("--record", metavar="FILE",
+                        help="record the session's inputs to a replay file")
+    parser.add_argument("--replay", metavar="FILE",
+                        help="play back a replay file instead of reading the keyboard")
+    parser.add_argument("--headless", action="store_true",
+                        help="with --replay: run without a window at full CPU speed")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed stored in the recorded replay")
+    return parser.parse_args(argv)
+
+
+def load_replay(path):
+    """Load a replay, warning if it was recorded under a different configuration"""
+    replay = Replay.load(path)
+    if not replay.matches_config():
+        warnings.warn(f"{path} was recorded with a different configuration; playback may diverge")
+    return replay
+
+
+def run_headless(replay):
+    """Play a replay on a bare simulation and report the outcome"""
+    started = time.perf_counter()
+    sim = play_headless(replay)
+    elapsed = time.perf_counter() - started
+    print(f"Replayed {replay.steps} frames in {elapsed:.2f} s: "
+          f"score {sim.score}, level {sim.state_machine.level_number}, "
+          f"lives {sim.state_machine.lives}, state {sim.state_machine.get_state().name}")
+    return sim
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    replay = load_replay(args.replay) if args.replay else None
+    if args.headless:
+        if replay is None:
+            sys.exit("--headless needs --replay FILE")
+        run_headless(replay)
+        return
 
-def main():
-    game = Game()
+    game = Game(turbo=args.turbo, turbo_steps=args.turbo_steps, turbo_draw_every=args.draw_every,
+                record_path=args.record, replay=replay, seed=args.seed)
     game.run()
 
 if __name__ == "__main__":
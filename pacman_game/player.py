@@ -23,6 +23,10 @@ class Player(Entity):
         
         self.next_direction = (0, 0)
         self.desired_direction = (0, 0)
+        
+        # Near a tile center the body stays inside the tile's row/column, so
+        # the level's exit mask decides moves without pixel collision checks
+        self.uses_exit_masks = radius + config.TILE_CENTER_TOLERANCE < config.TILE_SIZE / 2
     
     def set_next_direction(self, direction):
         """
@@ -52,6 +56,30 @@ class Player(Entity):
         
         return x_centered and y_centered
     
+    def can_move(self, level, direction):
+        """
+        Check if the player can take one step in a direction.
+        
+        At a tile center this reads the level's exit mask; off center it
+        falls back to the pixel-level collision check.
+        
+        Args:
+            level: Level instance for collision detection
+            direction: Tuple (dx, dy) representing direction
+            
+        Returns:
+            bool: True if the step is not blocked by a wall
+        """
+        if direction == (0, 0):
+            return True
+        if self.uses_exit_masks and self.is_at_tile_center():
+            grid_x = int(self.x / config.TILE_SIZE)
+            grid_y = int(self.y / config.TILE_SIZE)
+            return level.has_exit(grid_x, grid_y, direction)
+        new_x = self.x + direction[0] * self.speed
+        new_y = self.y + direction[1] * self.speed
+        return level.can_move_to(new_x, new_y, self.radius)
+    
     def update(self, level, input_handler=None):
         """
         Update player position.
@@ -79,10 +107,7 @@ class Player(Entity):
         # 1. Check if at tile center (Standard turn)
         if self.desired_direction != (0, 0) and self.is_at_tile_center():
             # Try the desired direction
-            new_x = self.x + self.desired_direction[0] * self.speed
-            new_y = self.y + self.desired_direction[1] * self.speed
-            
-            if level.can_move_to(new_x, new_y, self.radius):
+            if self.can_move(level, self.desired_direction):
                 self.direction = self.desired_direction
                 # Clear buffer after successful turn
                 if input_handler:
@@ -123,14 +148,10 @@ class Player(Entity):
                     if input_handler:
                         input_handler.clear_buffer()
         
-        # Try to move in current direction
-        new_x = self.x + self.direction[0] * self.speed
-        new_y = self.y + self.direction[1] * self.speed
-        
-        # Only move if the new position is valid
-        if level.can_move_to(new_x, new_y, self.radius):
-            self.x = new_x
-            self.y = new_y
+        # Try to move in current direction (only if the new position is valid)
+        if self.can_move(level, self.direction):
+            self.x += self.direction[0] * self.speed
+            self.y += self.direction[1] * self.speed
         elif config.WALL_SLIDE_ENABLED and self.is_at_tile_center():
             # If hitting a wall at tile center, try to align perfectly
             grid_x = int(self.x / config.TILE_SIZE)
@@ -0,0 +1,169 @@
+"""Per-phase frame profiler with a fixed-size ring buffer"""
+import csv
+import math
+from array import array
+from time import perf_counter_ns
+from . import config
+
+# Ghost types in spawn order; each gets its own AI and movement phase
+GHOST_TYPES = ("BLINKY", "PINKY", "INKY", "CLYDE")
+
+# Timed phases in frame order, grouped for the stacked graph
+PHASE_GROUPS = {
+    'events': 'events',
+    'player': 'update',
+    'pellets': 'update',
+    **{f"{name.lower()}_{part}": 'update' for name in GHOST_TYPES for part in ('ai', 'move')},
+    'collisions': 'update',
+    'draw_playfield': 'draw',
+    'draw_entities': 'draw',
+    'draw_hud': 'draw',
+    'draw_debug': 'draw',
+    'present': 'draw',
+}
+PHASES = tuple(PHASE_GROUPS)
+
+# Ghost type -> (AI phase, movement phase)
+GHOST_PHASES = {name: (f"{name.lower()}_ai", f"{name.lower()}_move") for name in GHOST_TYPES}
+GROUPS = ('events', 'update', 'draw')
+
+
+class FrameProfiler:
+    """
+    Records nanoseconds spent per phase for the last N frames.
+    
+    Samples live in one preallocated array (frames x phases) used as a ring
+    buffer, so profiling allocates nothing per frame. Call lap() around each
+    phase and end_frame() once per rendered frame.
+    """
+    
+    def __init__(self, capacity=None):
+        """
+        Initialize the profiler.
+        
+        Args:
+            capacity: Frames kept in the ring buffer (defaults to
+                config.PROFILER_FRAMES)
+        """
+        self.capacity = capacity if capacity is not None else config.PROFILER_FRAMES
+        self.phase_index = {phase: index for index, phase in enumerate(PHASES)}
+        # One extra row holds the frame in progress
+        self._rows = self.capacity + 1
+        self.samples = array('q', [0]) * (self._rows * len(PHASES))
+        self.frame_count = 0
+        self._row = 0
+    
+    def mark(self):
+        """Current timestamp in nanoseconds"""
+        return perf_counter_ns()
+    
+    def lap(self, phase, start):
+        """
+        Charge the time since start to a phase.
+        
+        Args:
+            phase: Phase name from PHASES
+            start: Timestamp from mark() or a previous lap()
+            
+        Returns:
+            int: Current timestamp, to start the next phase from
+        """
+        now = perf_counter_ns()
+        self.samples[self._row + self.phase_index[phase]] += now - start
+        return now
+    
+    def add(self, phase, nanoseconds):
+        """Charge a measured duration to a phase"""
+        self.samples[self._row + self.phase_index[phase]] += nanoseconds
+    
+    def end_frame(self):
+        """Close the current frame and clear the next ring buffer row"""
+        self.frame_count += 1
+        self._row = (self.frame_count % self._rows) * len(PHASES)
+        for index in range(self._row, self._row + len(PHASES)):
+            self.samples[index] = 0
+    
+    def frames(self):
+        """
+        Get the recorded frames, oldest first.
+        
+        Returns:
+            list: One tuple of per-phase nanoseconds per frame
+        """
+        count = min(self.frame_count, self.capacity)
+        width = len(PHASES)
+        rows = []
+        for frame in range(self.frame_count - count, self.frame_count):
+            start = (frame % self._rows) * width
+            rows.append(tuple(self.samples[start:start + width]))
+        return rows
+    
+    def group_totals(self, frame):
+        """
+        Sum one frame's phases per group.
+        
+        Args:
+            frame: Per-phase tuple from frames()
+            
+        Returns:
+            dict: Group name -> nanoseconds
+        """
+        totals = dict.fromkeys(GROUPS, 0)
+        for phase, nanoseconds in zip(PHASES, frame):
+            totals[PHASE_GROUPS[phase]] += nanoseconds
+        return totals
+    
+    def percentile(self, percent):
+        """
+        Get a frame time percentile over the recorded frames.
+        
+        Args:
+            percent: Percentile (0-100), nearest-rank
+            
+        Returns:
+            float: Frame time in milliseconds (0 if nothing recorded)
+        """
+        totals = sorted(sum(frame) for frame in self.frames())
+        if not totals:
+            return 0.0
+        rank = min(max(1, math.ceil(len(totals) * percent / 100)), len(totals))
+        return totals[rank - 1] / 1_000_000
+    
+    def dump(self, path=None):
+        """
+        Write the recorded frames to a CSV file (one row per frame, in ns).
+        
+        Args:
+            path: Output file (defaults to config.PROFILER_DUMP_FILE)
+            
+        Returns:
+            str: Path written
+        """
+        path = path if path is not None else config.PROFILER_DUMP_FILE
+        first = self.frame_count - min(self.frame_count, self.capacity)
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('frame',) + PHASES)
+            for offset, frame in enumerate(self.frames()):
+                writer.writerow((first + offset,) + frame)
+        return path
+
+
+class NullProfiler:
+    """Stand-in with the FrameProfiler timing API that records nothing"""
+    
+    def mark(self):
+        return 0
+    
+    def lap(self, phase, start):
+        return 0
+    
+    def add(self, phase, nanoseconds):
+        pass
+    
+    def end_frame(self):
+        pass
+
+
+# Shared no-op instance used when profiling is off
+NULL_PROFILER = NullProfiler()
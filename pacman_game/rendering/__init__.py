@@ -0,0 +1,9 @@
+"""Rendering module for cached surfaces and layered drawing"""
+from .layers import PlayfieldRenderer
+from .dirty import DirtyRectTracker, entity_rect
+from .text_cache import TextCache
+from .hud import HUD
+from .sprites import SpriteAtlas
+
+__all__ = ['PlayfieldRenderer', 'DirtyRectTracker', 'entity_rect', 'TextCache', 'HUD',
+           'SpriteAtlas']
@@ -0,0 +1,76 @@
+"""Dirty-rectangle tracking so only changed screen regions are pushed to the display"""
+import pygame
+
+
+def entity_rect(entity, position=None):
+    """
+    Screen rect (x, y, w, h) covering an entity drawn as a circle.
+    
+    Args:
+        entity: Entity with x, y and radius
+        position: Optional (x, y) the entity is drawn at instead of its own
+        
+    Returns:
+        tuple: Bounding box with a one-pixel margin for rounding
+    """
+    x, y = position if position is not None else (entity.x, entity.y)
+    size = entity.radius * 2 + 3
+    return (int(x) - entity.radius - 1, int(y) - entity.radius - 1, size, size)
+
+
+class DirtyRectTracker:
+    """
+    Collects the screen regions that changed during a frame.
+    
+    Regions are registered per owner key (an entity, a HUD field); when an
+    owner moves or its content changes both the old and the new rect are
+    dirty. present() pushes only those rects with pygame.display.update,
+    or does a full flip when one was requested (first frame, state
+    transitions, debug overlay).
+    """
+    
+    def __init__(self):
+        """Initialize tracker; the first frame is always a full flip"""
+        self.rects = []
+        self.previous = {}
+        self.full = True
+        
+        # Frame statistics
+        self.full_flips = 0
+        self.partial_updates = 0
+    
+    def mark(self, rect):
+        """Mark a screen rect (x, y, w, h) as changed this frame"""
+        self.rects.append(rect)
+    
+    def track(self, key, rect, content=None):
+        """
+        Register the region an owner drew this frame.
+        
+        Args:
+            key: Hashable owner identifier
+            rect: Screen rect (x, y, w, h) drawn this frame
+            content: Optional value that changes whenever the owner's pixels
+                change without moving (e.g. the text of a HUD field)
+        """
+        old = self.previous.get(key)
+        if old != (rect, content):
+            if old is not None:
+                self.rects.append(old[0])
+            self.rects.append(rect)
+            self.previous[key] = (rect, content)
+    
+    def request_full(self):
+        """Push the whole screen on the next present()"""
+        self.full = True
+    
+    def present(self):
+        """Push this frame's changes to the display and start a new frame"""
+        if self.full:
+            pygame.display.flip()
+            self.full_flips += 1
+        elif self.rects:
+            pygame.display.update(self.rects)
+            self.partial_updates += 1
+        self.rects = []
+        self.full = False
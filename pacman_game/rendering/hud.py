@@ -0,0 +1,104 @@
+"""Heads-up display (score, lives, level, state banners)"""
+from .. import config
+from ..state_machine import GameState
+from .text_cache import TextCache
+
+
+class HUD:
+    """
+    Draws the HUD fields, re-rendering a field only when its value changes.
+    
+    Each field remembers its last text, color, placement and surface, so an
+    unchanged field is a single blit. New strings go through a shared
+    TextCache, so values seen before (banners, a score that goes back to 0)
+    are not rasterised again either.
+    """
+    
+    def __init__(self, font, text_cache=None, dirty_rects=None):
+        """
+        Initialize the HUD.
+        
+        Args:
+            font: pygame Font for all HUD text
+            text_cache: Optional TextCache to share (a new one of
+                config.HUD_TEXT_CACHE_SIZE entries by default)
+            dirty_rects: Optional DirtyRectTracker that receives field regions
+        """
+        self.font = font
+        self.text_cache = text_cache if text_cache is not None else TextCache(config.HUD_TEXT_CACHE_SIZE)
+        self.dirty_rects = dirty_rects
+        # Field key -> (text, color, position, surface, rect)
+        self.fields = {}
+    
+    def draw_field(self, screen, key, text, color, **position):
+        """
+        Draw one HUD field, rendering only if its text, color or place changed.
+        
+        Args:
+            screen: Pygame screen surface
+            key: Field name
+            text: String to show
+            color: RGB color tuple
+            **position: Rect anchor for placement, e.g. topleft=(10, 10)
+        """
+        field = self.fields.get(key)
+        if field is None or field[0] != text or field[1] != color or field[2] != position:
+            surface = self.text_cache.render(self.font, text, color)
+            field = (text, color, position, surface, surface.get_rect(**position))
+            self.fields[key] = field
+        
+        rect = field[4]
+        screen.blit(field[3], rect)
+        if self.dirty_rects is not None:
+            self.dirty_rects.track(key, tuple(rect), text)
+    
+    def draw(self, screen, sim, high_score, new_high_score=False):
+        """
+        Draw UI elements (score, lives, messages).
+        
+        Args:
+            screen: Pygame screen surface
+            sim: Simulation providing score, lives, level and state
+            high_score: Stored high score
+            new_high_score: Whether the finished game set a new high score
+        """
+        # Draw score (Top Left)
+        self.draw_field(screen, 'score', f"Score: {sim.score}", config.WHITE, topleft=(10, 10))
+        
+        # Draw high score (Top Center)
+        self.draw_field(screen, 'high_score', f"High Score: {high_score}", config.YELLOW,
+                        midtop=(config.SCREEN_WIDTH // 2, 10))
+        
+        # Draw lives (Bottom Left)
+        self.draw_field(screen, 'lives', f"Lives: {sim.state_machine.lives}", config.WHITE,
+                        topleft=(10, config.SCREEN_HEIGHT - 40))
+        
+        # Draw level number (Bottom Right)
+        self.draw_field(screen, 'level', f"Level: {sim.state_machine.level_number}", config.WHITE,
+                        topleft=(config.SCREEN_WIDTH - 150, config.SCREEN_HEIGHT - 40))
+        
+        # Draw pellets remaining (debug-ish, kept on bottom left above lives)
+        pellets_remaining = sim.pellet_manager.pellets_remaining()
+        self.draw_field(screen, 'pellets', f"Pellets: {pellets_remaining}", config.WHITE,
+                        topleft=(10, config.SCREEN_HEIGHT - 80))
+        
+        # Draw state-specific messages
+        current_state = sim.state_machine.get_state()
+        center_x = config.SCREEN_WIDTH // 2
+        center_y = config.SCREEN_HEIGHT // 2
+        
+        if current_state == GameState.GAME_OVER:
+            self.draw_field(screen, 'banner', "GAME OVER!", config.RED, center=(center_x, center_y - 40))
+            
+            if new_high_score:
+                self.draw_field(screen, 'new_high_score', "NEW HIGH SCORE!", config.YELLOW,
+                                center=(center_x, center_y))
+            
+            self.draw_field(screen, 'restart', "Press R to Restart", config.WHITE,
+                            center=(center_x, center_y + 40))
+        
+        elif current_state == GameState.LEVEL_COMPLETE:
+            self.draw_field(screen, 'banner', "LEVEL COMPLETE!", config.YELLOW, center=(center_x, center_y))
+        
+        elif current_state == GameState.LIFE_LOST:
+            self.draw_field(screen, 'banner', "LIFE LOST!", config.RED, center=(center_x, center_y))
@@ -0,0 +1,115 @@
+"""Layered playfield rendering: baked walls, incremental pellets, one composite blit"""
+import pygame
+from .. import config
+
+
+def new_layer(size):
+    """
+    Create a black layer surface, converted to the display format if possible.
+    
+    Args:
+        size: (width, height) in pixels
+        
+    Returns:
+        pygame.Surface with BLACK as its colorkey
+    """
+    surface = pygame.Surface(size)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    surface.fill(config.BLACK)
+    surface.set_colorkey(config.BLACK)
+    return surface
+
+
+class PlayfieldRenderer:
+    """
+    Draws the level walls and pellets from cached surfaces.
+    
+    Walls are baked once per level revision. Pellets live on their own
+    layer and collecting one erases just that tile (via
+    PelletManager.on_collect) instead of redrawing every pellet. Both layers
+    are merged into a composite, so a frame costs a single blit.
+    """
+    
+    def __init__(self, level, pellet_manager):
+        """
+        Initialize the renderer (layers are baked on the first draw).
+        
+        Args:
+            level: Level instance providing walls
+            pellet_manager: PelletManager instance providing pellets
+        """
+        self.level = level
+        self.pellet_manager = pellet_manager
+        self.pellet_manager.on_collect = self.erase_pellet
+        
+        self.walls = None
+        self.pellets = None
+        self.composite = None
+        
+        # Revisions the current layers were built from
+        self.level_revision = None
+        self.pellet_revision = None
+        self.bakes = 0
+        
+        # Tile rects erased since the last pop_erased() (for dirty-rect updates)
+        self.erased = []
+    
+    def bake(self):
+        """Rebuild every layer from the level and pellet state"""
+        tile_size = self.level.tile_size
+        size = (self.level.grid.cols * tile_size, self.level.grid.rows * tile_size)
+        
+        self.walls = new_layer(size)
+        self.level.draw(self.walls)
+        
+        self.pellets = new_layer(size)
+        self.pellet_manager.draw(self.pellets)
+        
+        self.composite = new_layer(size)
+        self.composite.blit(self.walls, (0, 0))
+        self.composite.blit(self.pellets, (0, 0))
+        
+        self.level_revision = self.level.revision
+        self.pellet_revision = self.pellet_manager.revision
+        self.bakes += 1
+    
+    def tile_rect(self, grid_x, grid_y):
+        """Pixel rect (x, y, w, h) of a tile"""
+        tile_size = self.level.tile_size
+        return (grid_x * tile_size, grid_y * tile_size, tile_size, tile_size)
+    
+    def erase_pellet(self, grid_x, grid_y):
+        """
+        Remove one collected pellet from the cached layers.
+        
+        If the layers missed any other pellet change they are left stale
+        and the next draw rebakes them.
+        
+        Args:
+            grid_x: Grid X coordinate of the collected pellet
+            grid_y: Grid Y coordinate of the collected pellet
+        """
+        if self.pellet_revision != self.pellet_manager.revision - 1:
+            return
+        
+        rect = self.tile_rect(grid_x, grid_y)
+        self.pellets.fill(config.BLACK, rect)
+        self.composite.fill(config.BLACK, rect)
+        self.composite.blit(self.walls, rect, rect)
+        self.composite.blit(self.pellets, rect, rect)
+        self.pellet_revision = self.pellet_manager.revision
+        self.erased.append(rect)
+    
+    def pop_erased(self):
+        """Return and clear the tile rects erased since the last call"""
+        erased = self.erased
+        self.erased = []
+        return erased
+    
+    def draw(self, screen):
+        """Blit walls and pellets, rebaking first if the cached layers are stale"""
+        if (self.level_revision != self.level.revision or
+                self.pellet_revision != self.pellet_manager.revision):
+            self.bake()
+        screen.blit(self.composite, (0, 0))
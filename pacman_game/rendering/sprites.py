@@ -0,0 +1,77 @@
+"""Sprite atlas of pre-rasterised entity surfaces"""
+import pygame
+
+
+class SpriteAtlas:
+    """
+    Pre-rendered entity sprites, one surface per distinct appearance.
+    
+    Sprites are keyed on Entity.sprite_key() and rasterised by running the
+    entity's own draw_at onto a transparent surface, so the atlas always
+    matches the vector drawing. Drawing an entity is then a single blit
+    instead of one draw call per shape.
+    """
+    
+    def __init__(self):
+        """Initialize an empty atlas"""
+        self._sprites = {}
+        self.builds = 0
+    
+    def preload(self, entities):
+        """
+        Rasterise sprites for entities up front (e.g. at startup).
+        
+        Args:
+            entities: Iterable of Entity instances
+        """
+        for entity in entities:
+            self.get(entity)
+    
+    def get(self, entity):
+        """
+        Get the sprite for an entity, rasterising it on first use.
+        
+        Args:
+            entity: Entity instance
+            
+        Returns:
+            tuple: (surface, offset) where offset is the sprite center
+        """
+        key = entity.sprite_key()
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self.build(entity)
+            self._sprites[key] = sprite
+        return sprite
+    
+    def build(self, entity):
+        """Rasterise an entity's vector drawing onto a transparent surface"""
+        offset = entity.radius + 1
+        size = offset * 2 + 1
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        surface.fill((0, 0, 0, 0))
+        entity.draw_at(surface, offset, offset)
+        self.builds += 1
+        return (surface, offset)
+    
+    def draw(self, screen, entity, position=None):
+        """
+        Blit an entity's sprite centered on its position.
+        
+        Args:
+            screen: Target pygame surface
+            entity: Entity instance
+            position: Optional (x, y) to draw at instead of the entity's own
+        """
+        x, y = position if position is not None else (entity.x, entity.y)
+        surface, offset = self.get(entity)
+        screen.blit(surface, (int(x) - offset, int(y) - offset))
+    
+    def clear(self):
+        """Drop every sprite (e.g. after a display mode change)"""
+        self._sprites.clear()
+    
+    def __len__(self):
+        return len(self._sprites)
@@ -0,0 +1,63 @@
+"""LRU cache of rendered text surfaces"""
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    Bounded LRU cache of font.render results keyed on (text, color, font).
+    
+    Rasterising text is one of the most expensive per-frame operations, and
+    HUD strings repeat constantly, so each distinct string is rendered once
+    and reused until it falls out of the cache.
+    """
+    
+    def __init__(self, max_size: int):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            max_size: Maximum number of cached surfaces
+        """
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def render(self, font, text: str, color):
+        """
+        Get the surface for a string, rendering it on a miss.
+        
+        Args:
+            font: pygame Font used for rendering
+            text: String to render
+            color: RGB color tuple
+            
+        Returns:
+            pygame.Surface with the antialiased text
+        """
+        key = (text, color, font)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, True, color)
+        if self.max_size > 0:
+            self._entries[key] = surface
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return surface
+    
+    def clear(self):
+        """Drop all entries and reset counters"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,279 @@
+"""Deterministic input recording and playback
+
+A replay holds the direction fed to every simulation step plus the
+control events the game acted on, so a session can be re-run exactly,
+headless at full CPU speed or in a window.
+"""
+import hashlib
+import struct
+
+from . import config
+from .ai.next_hop import DIRECTIONS
+
+# File layout: header, then run-length-encoded direction codes, then events
+MAGIC = b"PMRP"
+VERSION = 1
+# magic, version, seed, config hash, steps, runs, events
+HEADER = struct.Struct("<4sBQ8sIII")
+
+# Direction codes (same order as next-hop tables: none, left, right, up, down)
+DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+# Control events worth recording, by code
+EVENTS = ('restart', 'debug_toggle', 'turbo_toggle', 'profile_dump', 'quit')
+EVENT_CODES = {name: code for code, name in enumerate(EVENTS, start=1)}
+
+
+class ReplayError(ValueError):
+    """Raised for malformed replay files"""
+
+
+def config_hash():
+    """
+    Fingerprint of the game configuration.
+
+    Covers every upper-case setting in config, so a replay recorded under
+    different rules (speeds, durations, pathfinding strategy, ...) can be
+    detected before it silently diverges.
+
+    Returns:
+        bytes: 8-byte digest
+    """
+    settings = sorted((name, repr(value)) for name, value in vars(config).items() if name.isupper())
+    return hashlib.blake2b(repr(settings).encode(), digest_size=8).digest()
+
+
+def write_varint(out, value):
+    """Append an unsigned LEB128 integer to a bytearray"""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, offset):
+    """
+    Read an unsigned LEB128 integer.
+
+    Returns:
+        tuple: (value, offset after it)
+    """
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ReplayError("truncated replay")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class Replay:
+    """
+    Recorded inputs of one session.
+
+    directions holds one direction code per simulation step; events is a
+    list of (step, name) meaning the event was applied after that many
+    steps had run.
+    """
+
+    def __init__(self, seed=0, config_digest=None, directions=None, events=None):
+        """
+        Initialize a replay.
+
+        Args:
+            seed: Seed the session ran with
+            config_digest: config_hash() at recording time (defaults to the current one)
+            directions: bytearray of direction codes, one per step
+            events: List of (step, event name)
+        """
+        self.seed = seed
+        self.config_digest = config_digest if config_digest is not None else config_hash()
+        self.directions = directions if directions is not None else bytearray()
+        self.events = events if events is not None else []
+
+    @property
+    def steps(self):
+        """Number of recorded simulation steps"""
+        return len(self.directions)
+
+    def matches_config(self):
+        """True if the current configuration is the one the replay was recorded with"""
+        return self.config_digest == config_hash()
+
+    def runs(self):
+        """
+        Run-length encode the direction codes.
+
+        Returns:
+            list: (code, length) pairs
+        """
+        runs = []
+        for code in self.directions:
+            if runs and runs[-1][0] == code:
+                runs[-1][1] += 1
+            else:
+                runs.append([code, 1])
+        return [(code, length) for code, length in runs]
+
+    def to_bytes(self):
+        """Encode the replay in the compact file format"""
+        runs = self.runs()
+        body = bytearray()
+        for code, length in runs:
+            body.append(code)
+            write_varint(body, length)
+        previous = 0
+        for step, name in self.events:
+            # Steps are stored as deltas so long sessions stay small
+            write_varint(body, step - previous)
+            body.append(EVENT_CODES[name])
+            previous = step
+        header = HEADER.pack(MAGIC, VERSION, self.seed, self.config_digest,
+                             self.steps, len(runs), len(self.events))
+        return header + bytes(body)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Decode a replay.
+
+        Raises:
+            ReplayError: If the data is not a valid replay
+        """
+        if len(data) < HEADER.size:
+            raise ReplayError("truncated replay header")
+        magic, version, seed, digest, steps, run_count, event_count = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ReplayError("not a replay file")
+        if version != VERSION:
+            raise ReplayError(f"unsupported replay version {version}")
+
+        offset = HEADER.size
+        directions = bytearray()
+        for _ in range(run_count):
+            if offset >= len(data):
+                raise ReplayError("truncated replay")
+            code = data[offset]
+            if code >= len(DIRECTIONS):
+                raise ReplayError(f"bad direction code {code}")
+            length, offset = read_varint(data, offset + 1)
+            directions += bytes([code]) * length
+        if len(directions) != steps:
+            raise ReplayError("step count does not match direction runs")
+
+        events = []
+        step = 0
+        for _ in range(event_count):
+            delta, offset = read_varint(data, offset)
+            if offset >= len(data) or not 1 <= data[offset] <= len(EVENTS):
+                raise ReplayError("bad replay event")
+            step += delta
+            events.append((step, EVENTS[data[offset] - 1]))
+            offset += 1
+        return cls(seed, digest, directions, events)
+
+    def save(self, path):
+        """Write the replay to a file"""
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a replay file"""
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Collects the inputs of a running game into a Replay"""
+
+    def __init__(self, seed=0):
+        """
+        Start a recording.
+
+        Args:
+            seed: Seed the session runs with, stored in the replay header
+        """
+        self.replay = Replay(seed)
+
+    def record_step(self, direction):
+        """Log the direction fed to the next simulation step"""
+        self.replay.directions.append(DIRECTION_CODES.get(direction, 0))
+
+    def record_event(self, name):
+        """Log a control event applied before the next step"""
+        self.replay.events.append((self.replay.steps, name))
+
+    def save(self, path):
+        """Write the recording to a file"""
+        self.replay.save(path)
+
+
+class ReplayPlayer:
+    """Feeds a Replay back one step at a time"""
+
+    def __init__(self, replay):
+        """
+        Start playback from the first step.
+
+        Args:
+            replay: Replay to play
+        """
+        self.replay = replay
+        self.step = 0
+        self.next_event = 0
+
+    @property
+    def finished(self):
+        """True once every recorded step has been played"""
+        return self.step >= self.replay.steps
+
+    def pending_events(self):
+        """
+        Get the events to apply before the next step.
+
+        Returns:
+            list: Event names, in recorded order
+        """
+        events = self.replay.events
+        due = []
+        while self.next_event < len(events) and events[self.next_event][0] <= self.step:
+            due.append(events[self.next_event][1])
+            self.next_event += 1
+        return due
+
+    def next_direction(self):
+        """Get the direction for the next step and advance"""
+        code = self.replay.directions[self.step]
+        self.step += 1
+        return DIRECTIONS[code]
+
+
+def play_headless(replay, simulation=None, on_step=None):
+    """
+    Run a replay on a Simulation as fast as the CPU allows.
+
+    Args:
+        replay: Replay to play
+        simulation: Simulation to drive (defaults to a new one)
+        on_step: Optional callback(simulation) after every step
+
+    Returns:
+        Simulation in its final state
+    """
+    if simulation is None:
+        from .simulation import Simulation
+        simulation = Simulation()
+    player = ReplayPlayer(replay)
+    while not player.finished:
+        for event in player.pending_events():
+            if event == 'restart':
+                simulation.reset()
+        simulation.step(player.next_direction())
+        if on_step:
+            on_step(simulation)
+    return simulation
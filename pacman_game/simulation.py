@@ -0,0 +1,227 @@
+"""Headless simulation core - game rules without any display or clock"""
+from array import array
+
+from . import config
+
+from .level import Level, PelletManager
+from .player import Player
+from .ghosts import Ghost
+from .state_machine import GameStateMachine
+from .timers import TimerWheel
+from .ai.ghost_behaviors import GhostBehavior, ModeController
+from .ai.flow_field import flow_fields
+from .ai.pathfinding import prepare_level
+from .profiler import NULL_PROFILER, GHOST_PHASES
+from .digest import StateDigest
+from . import snapshot
+
+
+class Simulation:
+    """
+    Owns all gameplay state and advances it one frame per step.
+
+    Never touches pygame, so it can run without a window and as fast as the
+    CPU allows. Game wraps it with input, rendering and frame pacing.
+
+    Everything time-based (ghost release, the global scatter/chase
+    schedule and transition delays) is an event on a frame-based
+    TimerWheel advanced once per step, so fast-forwarded and headless runs
+    match real time.
+    """
+
+    def __init__(self, level=None):
+        """
+        Initialize level, pellets, state machine and entities.
+
+        Args:
+            level: Level to play on. Games never modify their level, so one
+                instance (and the tables cached on it) can be shared by
+                many simulations. Defaults to a new Level.
+        """
+        self.timers = TimerWheel()
+        self.level = level if level is not None else Level()
+        # Compile pathfinding tables now rather than on the first replan
+        prepare_level(self.level)
+        self.pellet_manager = PelletManager()
+        self.state_machine = GameStateMachine(self.timers)
+        self.modes = ModeController(self.timers)
+
+        self.score = 0
+        self.frame = 0
+
+        self.player = None
+        self.ghosts = []
+        # Pending release timer per ghost (cancelled on respawn)
+        self.ghost_timers = {}
+        self.respawn_entities()
+
+        # Callback invoked when the game ends (e.g. to persist the high score)
+        self.on_game_over = None
+        
+        # Phase timing (a FrameProfiler, or the no-op NULL_PROFILER)
+        self.profiler = NULL_PROFILER
+
+        # State digest per step, for checking that engine changes keep behaviour
+        self.digest = StateDigest() if config.STATE_DIGEST_ENABLED else None
+        self.digests = array('L')
+
+    def step(self, direction=(0, 0), input_handler=None):
+        """
+        Advance the simulation by one frame.
+
+        Args:
+            direction: Directional input for this frame as (dx, dy)
+            input_handler: Optional InputHandler for buffered input
+        """
+        self.frame += 1
+        self.timers.advance()
+
+        # Ghosts replanning this frame share flow fields per target
+        if config.PATHFINDING_STRATEGY == "flow_field":
+            flow_fields.begin_cycle()
+
+        # Check for state transitions
+        action = self.state_machine.update_transition()
+        if action == 'reload_level':
+            self.reload_level()
+        elif action == 'respawn':
+            self.respawn_entities()
+
+        # Start of this step is the interpolation origin for drawing; when
+        # paused it equals the current position so nothing drifts
+        self.player.store_previous_position()
+        for ghost in self.ghosts:
+            ghost.store_previous_position()
+
+        # Only update entities during active gameplay
+        if not self.state_machine.is_playing():
+            self.record_digest()
+            return
+
+        profiler = self.profiler
+        started = profiler.mark()
+        
+        self.player.set_next_direction(direction)
+        
+        # Update player with input handler for buffering
+        self.player.update(self.level, input_handler)
+        started = profiler.lap('player', started)
+        
+        # Collect pellets
+        points = self.pellet_manager.collect_pellet(self.player.x, self.player.y)
+        self.score += points
+        
+        # Check level completion
+        self.state_machine.check_level_complete(self.pellet_manager.pellets_remaining())
+        started = profiler.lap('pellets', started)
+        
+        # Update ghosts (pass player and blinky for AI targeting)
+        blinky = self.ghosts[0] if len(self.ghosts) > 0 else None
+        
+        for ghost in self.ghosts:
+            ai_phase, move_phase = GHOST_PHASES[ghost.ghost_type]
+            ai_time = ghost.ai_time_ns
+            started = profiler.mark()
+            ghost.update(self.level, self.player, blinky)
+            started = profiler.lap(move_phase, started)
+            
+            # Time spent replanning inside update moves from movement to AI
+            ai_time = ghost.ai_time_ns - ai_time
+            profiler.add(ai_phase, ai_time)
+            profiler.add(move_phase, -ai_time)
+            
+            # Check collision with player
+            if ghost.collides_with(self.player):
+                if self.state_machine.check_life_lost(True):
+                    if self.state_machine.is_game_over() and self.on_game_over:
+                        self.on_game_over(self.score)
+            profiler.lap('collisions', started)
+        self.record_digest()
+
+    def record_digest(self):
+        """Append the digest of the current state if digests are enabled"""
+        if self.digest is not None:
+            self.digests.append(self.digest(self))
+    
+    def schedule_ghost_timers(self):
+        """Restart the scatter/chase schedule and schedule release of idle ghosts"""
+        for timer in self.ghost_timers.values():
+            self.timers.cancel(timer)
+        self.ghost_timers = {}
+
+        # Note: In a real game release would use a dot counter
+        for ghost, release_frame in zip(self.ghosts, config.GHOST_RELEASE_FRAMES):
+            ghost.owns_mode_timer = False
+            if ghost.behavior == GhostBehavior.IDLE:
+                self.ghost_timers[ghost] = self.timers.schedule(release_frame, self.release_ghost, ghost)
+
+        self.modes.start(self.state_machine.level_number, self.ghosts)
+
+    def release_ghost(self, ghost):
+        """Timer callback: let an idle ghost out in the current global phase"""
+        del self.ghost_timers[ghost]
+        if ghost.behavior == GhostBehavior.IDLE:
+            self.modes.release(ghost)
+
+    def reload_level(self):
+        """Reload level (reset pellets and entities)"""
+        self.pellet_manager.reset()
+        self.respawn_entities()
+
+    @staticmethod
+    def ghost_speed_for_level(level_number):
+        """Ghost speed on a level (increases by 0.1 per level, capped below player speed)"""
+        level_modifier = (level_number - 1) * 0.1
+        return min(config.GHOST_SPEED + level_modifier, config.PLAYER_SPEED - 0.2)
+
+    def respawn_entities(self):
+        """Respawn player and ghosts at starting positions"""
+        ghost_speed = self.ghost_speed_for_level(self.state_machine.level_number)
+
+        self.player = Player(config.TILE_SIZE, config.TILE_SIZE)
+
+        # Initialize ghosts
+        # Blinky starts active
+        g1 = Ghost(config.TILE_SIZE * 9, config.TILE_SIZE * 9, config.RED, "BLINKY", ghost_speed)
+        g1.behavior = GhostBehavior.SCATTER
+
+        # Others start idle
+        g2 = Ghost(config.TILE_SIZE * 10, config.TILE_SIZE * 9, config.PINK, "PINKY", ghost_speed)
+        g2.behavior = GhostBehavior.IDLE
+
+        g3 = Ghost(config.TILE_SIZE * 9, config.TILE_SIZE * 10, config.CYAN, "INKY", ghost_speed)
+        g3.behavior = GhostBehavior.IDLE
+
+        g4 = Ghost(config.TILE_SIZE * 10, config.TILE_SIZE * 10, config.ORANGE, "CLYDE", ghost_speed)
+        g4.behavior = GhostBehavior.IDLE
+
+        self.ghosts = [g1, g2, g3, g4]
+        self.schedule_ghost_timers()
+
+    def snapshot(self):
+        """
+        Capture the full game state (see snapshot.capture).
+
+        Returns:
+            Snapshot: Immutable record for restore()
+        """
+        return snapshot.capture(self)
+
+    def restore(self, state):
+        """
+        Return to a captured state in place, keeping the existing entities.
+
+        Args:
+            state: Snapshot taken from this simulation
+        """
+        snapshot.restore(self, state)
+
+    def reset(self):
+        """Reset simulation to initial state"""
+        self.timers.clear()
+        self.ghost_timers = {}
+        self.state_machine.reset()
+        self.pellet_manager.reset()
+        self.respawn_entities()
+        self.score = 0
+        self.frame = 0
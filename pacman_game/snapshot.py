@@ -0,0 +1,198 @@
+"""Compact snapshots of a whole simulation, for rollback and look-ahead search
+
+A Snapshot holds every field that affects future gameplay: the player,
+the ghosts, the state machine, the scatter/chase controller, pending
+timer events, score and frame, packed with struct into one bytes blob,
+plus the pellet grid as an integer bitmask. Restoring writes the values
+back into the simulation's existing objects. Render interpolation state
+is not kept: restored entities are drawn at rest on their position.
+"""
+import struct
+
+from .ai.ghost_behaviors import GhostBehavior, mode_schedule
+from .state_machine import GameState
+from .digest import BEHAVIOR_CODES, STATE_CODES
+
+BEHAVIORS = tuple(GhostBehavior)
+STATES = tuple(GameState)
+ACTIONS = (None, 'reload_level', 'respawn')
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+# Frame, timer wheel frame, score, ghost count
+HEADER = "IIqB"
+# State, lives, level, transition timer, pending action, transition due frame
+STATE_MACHINE = "BiiiBI"
+# Schedule level, phase, phase index, phase changes, phase end due frame
+MODES = "iBIII"
+# x, y, direction, desired direction, next direction
+PLAYER = "dd" + "bb" * 3
+# x, y, speed, direction, behavior, behavior timer, flags,
+# target tile, replan counter, replans, release due frame
+GHOST = "ddd" + "bb" + "BIB" + "hh" + "III"
+# Ghost flags
+OWNS_MODE_TIMER = 1
+REPLAN_NEEDED = 2
+HAS_TARGET = 4
+
+HEADER_SIZE = struct.calcsize("<" + HEADER)
+# Values before the first ghost, and per ghost (one format character each)
+GLOBAL_FIELDS = len(HEADER + STATE_MACHINE + MODES + PLAYER)
+GHOST_FIELDS = len(GHOST)
+_structs = {}
+
+
+def layout(ghost_count):
+    """Struct for a simulation with ghost_count ghosts (cached)"""
+    packer = _structs.get(ghost_count)
+    if packer is None:
+        packer = _structs[ghost_count] = struct.Struct(
+            "<" + HEADER + STATE_MACHINE + MODES + PLAYER + GHOST * ghost_count)
+    return packer
+
+
+def due(timer):
+    """Frame a pending timer fires on, or 0 if there is none"""
+    return timer.due if timer is not None and timer.active else 0
+
+
+class Snapshot:
+    """Immutable record of a simulation's state: packed fields plus pellet bitmask"""
+
+    __slots__ = ('data', 'pellets')
+
+    def __init__(self, data, pellets):
+        object.__setattr__(self, 'data', data)
+        object.__setattr__(self, 'pellets', pellets)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("snapshots are immutable")
+
+    def __eq__(self, other):
+        return isinstance(other, Snapshot) and self.data == other.data and self.pellets == other.pellets
+
+    def __hash__(self):
+        return hash((self.data, self.pellets))
+
+    @property
+    def frame(self):
+        """Simulation frame the snapshot was taken on"""
+        return struct.unpack_from("<I", self.data)[0]
+
+    @property
+    def size(self):
+        """Approximate size in bytes"""
+        return len(self.data) + (self.pellets.bit_length() + 7) // 8
+
+
+def capture(sim):
+    """
+    Take a snapshot of a simulation.
+
+    Args:
+        sim: Simulation
+
+    Returns:
+        Snapshot
+    """
+    ghosts = sim.ghosts
+    state_machine = sim.state_machine
+    modes = sim.modes
+    player = sim.player
+    ghost_timers = sim.ghost_timers
+
+    values = [
+        sim.frame, sim.timers.frame, sim.score, len(ghosts),
+        STATE_CODES[state_machine.current_state], state_machine.lives, state_machine.level_number,
+        state_machine.transition_timer, ACTION_CODES[state_machine.pending_action],
+        due(state_machine.transition_event),
+        modes.level_number, BEHAVIOR_CODES[modes.phase], modes.phase_index, modes.phase_changes, due(modes.event),
+        player.x, player.y,
+        *player.direction, *player.desired_direction, *player.next_direction,
+    ]
+    for ghost in ghosts:
+        target = ghost.target_tile
+        flags = ((OWNS_MODE_TIMER if ghost.owns_mode_timer else 0) |
+                 (REPLAN_NEEDED if ghost.replan_needed else 0) |
+                 (HAS_TARGET if target is not None else 0))
+        values += (ghost.x, ghost.y, ghost.speed, *ghost.direction,
+                   BEHAVIOR_CODES[ghost.behavior], ghost.behavior_timer, flags,
+                   *(target if target is not None else (0, 0)),
+                   ghost.pathfinding_update_counter, ghost.replan_count, due(ghost_timers.get(ghost)))
+    return Snapshot(layout(len(ghosts)).pack(*values), sim.pellet_manager.pellet_mask())
+
+
+def restore(sim, snapshot):
+    """
+    Put a simulation back into a snapshotted state, in place.
+
+    The player, ghosts and pellet grid keep their identity; pending timer
+    events are rescheduled on the simulation's wheel.
+
+    Args:
+        sim: Simulation the snapshot was taken from (or one with the same
+            number of ghosts)
+        snapshot: Snapshot from capture()
+
+    Raises:
+        ValueError: If the ghost count differs
+    """
+    data = snapshot.data
+    ghost_count = data[HEADER_SIZE - 1]
+    ghosts = sim.ghosts
+    if ghost_count != len(ghosts):
+        raise ValueError(f"snapshot has {ghost_count} ghosts, simulation has {len(ghosts)}")
+    values = layout(ghost_count).unpack(data)
+
+    (sim.frame, timer_frame, sim.score, _,
+     state, lives, level_number, transition_timer, action, transition_due,
+     schedule_level, phase, phase_index, phase_changes, phase_due,
+     px, py, dx, dy, ddx, ddy, ndx, ndy) = values[:GLOBAL_FIELDS]
+
+    timers = sim.timers
+    timers.clear(timer_frame)
+
+    state_machine = sim.state_machine
+    state_machine.current_state = STATES[state]
+    state_machine.lives = lives
+    state_machine.level_number = level_number
+    state_machine.transition_timer = transition_timer
+    state_machine.pending_action = ACTIONS[action]
+
+    player = sim.player
+    player.x, player.y = px, py
+    player.store_previous_position()
+    player.direction = (dx, dy)
+    player.desired_direction = (ddx, ddy)
+    player.next_direction = (ndx, ndy)
+
+    # Reschedule pending events in the order the simulation schedules them
+    ghost_timers = {}
+    offset = GLOBAL_FIELDS
+    for ghost in ghosts:
+        (ghost.x, ghost.y, ghost.speed, gdx, gdy,
+         behavior, ghost.behavior_timer, flags, tx, ty,
+         ghost.pathfinding_update_counter, ghost.replan_count, release_due) = values[offset:offset + GHOST_FIELDS]
+        offset += GHOST_FIELDS
+        ghost.store_previous_position()
+        ghost.direction = (gdx, gdy)
+        ghost.behavior = BEHAVIORS[behavior]
+        ghost.owns_mode_timer = bool(flags & OWNS_MODE_TIMER)
+        ghost.replan_needed = bool(flags & REPLAN_NEEDED)
+        ghost.target_tile = (tx, ty) if flags & HAS_TARGET else None
+        if release_due:
+            ghost_timers[ghost] = timers.schedule(release_due - timer_frame, sim.release_ghost, ghost)
+    sim.ghost_timers = ghost_timers
+
+    modes = sim.modes
+    modes.ghosts = ghosts
+    modes.level_number = schedule_level
+    modes.schedule = mode_schedule(schedule_level, modes.schedules)
+    modes.phase = BEHAVIORS[phase]
+    modes.phase_index = phase_index
+    modes.phase_changes = phase_changes
+    modes.event = timers.schedule(phase_due - timer_frame, modes.on_phase_end) if phase_due else None
+
+    state_machine.transition_event = (timers.schedule(transition_due - timer_frame, state_machine.on_transition_event)
+                                      if transition_due else None)
+
+    sim.pellet_manager.restore_mask(snapshot.pellets)
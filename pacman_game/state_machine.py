@@ -1,5 +1,6 @@
 """Game state machine for managing game states and transitions"""
 from enum import Enum, auto
+from . import config
 
 
 class GameState(Enum):
@@ -14,12 +15,23 @@ class GameState(Enum):
 class GameStateMachine:
     """Manages game state transitions and state-specific logic"""
     
-    def __init__(self):
-        """Initialize state machine"""
+    def __init__(self, timers=None):
+        """
+        Initialize state machine.
+        
+        Args:
+            timers: Optional TimerWheel. With one, transition delays are
+                scheduled events; without, update_transition counts frames.
+        """
         self.current_state = GameState.PLAYING
         self.lives = 3
         self.level_number = 1
         self.transition_timer = 0
+        
+        self.timers = timers
+        self.transition_event = None
+        # Action produced by a fired transition event, returned once by update_transition
+        self.pending_action = None
     
     def get_state(self):
         """Get current game state"""
@@ -46,6 +58,7 @@ class GameStateMachine:
         if self.current_state == GameState.PLAYING and pellets_remaining == 0:
             self.current_state = GameState.LEVEL_COMPLETE
             self.transition_timer = 0
+            self.schedule_transition()
             return True
         return False
     
@@ -65,29 +78,60 @@ class GameStateMachine:
                 self.current_state = GameState.GAME_OVER
             else:
                 self.current_state = GameState.LIFE_LOST
+                self.schedule_transition()
             self.transition_timer = 0
             return True
         return False
     
+    def schedule_transition(self):
+        """Schedule the end of the current transition state on the timer wheel"""
+        if self.timers is None:
+            return
+        self.timers.cancel(self.transition_event)
+        self.transition_event = self.timers.schedule(config.LEVEL_COMPLETE_DELAY, self.on_transition_event)
+    
+    def on_transition_event(self):
+        """Timer callback: finish the transition and hold its action for update_transition"""
+        self.transition_event = None
+        self.pending_action = self.finish_transition()
+    
+    def finish_transition(self):
+        """
+        Leave a transition state and return to play.
+        
+        Returns:
+            str: Action to take ('reload_level', 'respawn', or None)
+        """
+        action = None
+        if self.current_state == GameState.LEVEL_COMPLETE:
+            self.level_number += 1
+            self.current_state = GameState.PLAYING
+            action = 'reload_level'
+        elif self.current_state == GameState.LIFE_LOST:
+            self.current_state = GameState.PLAYING
+            action = 'respawn'
+        return action
+    
     def update_transition(self):
         """
         Update transition timer and handle automatic state transitions.
         
+        With a timer wheel this only reports the action of a transition
+        event fired since the last call.
+        
         Returns:
             str: Action to take ('reload_level', 'respawn', or None)
         """
+        if self.timers is not None:
+            action, self.pending_action = self.pending_action, None
+            return action
+        
         if self.current_state in [GameState.LEVEL_COMPLETE, GameState.LIFE_LOST]:
             self.transition_timer += 1
             
-            # Auto-transition after 2 seconds (120 frames at 60 FPS)
-            if self.transition_timer >= 120:
-                if self.current_state == GameState.LEVEL_COMPLETE:
-                    self.level_number += 1
-                    self.current_state = GameState.PLAYING
-                    return 'reload_level'
-                elif self.current_state == GameState.LIFE_LOST:
-                    self.current_state = GameState.PLAYING
-                    return 'respawn'
+            # Auto-transition after config.LEVEL_COMPLETE_DELAY frames
+            if self.transition_timer >= config.LEVEL_COMPLETE_DELAY:
+                return self.finish_transition()
         
         return None
     
@@ -97,3 +141,7 @@ class GameStateMachine:
         self.lives = 3
         self.level_number = 1
         self.transition_timer = 0
+        if self.timers is not None:
+            self.timers.cancel(self.transition_event)
+        self.transition_event = None
+        self.pending_action = None
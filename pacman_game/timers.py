@@ -0,0 +1,116 @@
+"""Frame-based event scheduling for the simulation"""
+
+
+class Timer:
+    """A scheduled callback; returned by TimerWheel.schedule for cancelling"""
+
+    __slots__ = ('due', 'callback', 'args', 'cancelled')
+
+    def __init__(self, due, callback, args):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    @property
+    def active(self):
+        """True until the timer fires or is cancelled"""
+        return not self.cancelled and self.callback is not None
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel that fires callbacks after a number of frames.
+
+    Time only moves when advance() is called, once per simulation step, so
+    scheduled events land on the same frame whether the game runs in real
+    time, in turbo mode or headless. Each frame looks at a single slot;
+    timers further out than one revolution simply stay in their slot until
+    their frame comes round.
+    """
+
+    def __init__(self, slots=256):
+        """
+        Initialize an empty wheel at frame 0.
+
+        Args:
+            slots: Number of slots (rounded up to a power of two)
+        """
+        size = 1
+        while size < slots:
+            size *= 2
+        self.mask = size - 1
+        self.slots = [[] for _ in range(size)]
+        self.frame = 0
+        self.pending = 0
+
+    def schedule(self, delay, callback, *args):
+        """
+        Call callback(*args) delay frames from now.
+
+        Args:
+            delay: Frames to wait; anything under 1 fires on the next advance
+            callback: Function to call
+            *args: Arguments for the callback
+
+        Returns:
+            Timer: Handle for cancel()
+        """
+        due = self.frame + max(int(delay), 1)
+        timer = Timer(due, callback, args)
+        self.slots[due & self.mask].append(timer)
+        self.pending += 1
+        return timer
+
+    def cancel(self, timer):
+        """Stop a timer from firing (no-op if it already fired or was cancelled)"""
+        if timer is not None and timer.active:
+            timer.cancelled = True
+            self.pending -= 1
+
+    def advance(self):
+        """
+        Move to the next frame and fire the timers due on it.
+
+        Timers due on the same frame fire in the order they were scheduled.
+
+        Returns:
+            int: Number of callbacks fired
+        """
+        self.frame += 1
+        frame = self.frame
+        index = frame & self.mask
+        slot = self.slots[index]
+        if not slot:
+            return 0
+
+        # Detach due timers first so callbacks can schedule into this slot
+        self.slots[index] = [timer for timer in slot if timer.due != frame and not timer.cancelled]
+        fired = 0
+        for timer in slot:
+            if timer.due != frame or timer.cancelled:
+                continue
+            callback, args = timer.callback, timer.args
+            timer.callback = None
+            self.pending -= 1
+            callback(*args)
+            fired += 1
+        return fired
+
+    def clear(self, frame=0):
+        """
+        Drop every timer and move to a frame.
+
+        Args:
+            frame: Frame the wheel continues from (0 rewinds it)
+        """
+        # Only a handful of slots are ever occupied
+        for slot in filter(None, self.slots):
+            for timer in slot:
+                timer.cancelled = True
+            slot.clear()
+        self.frame = frame
+        self.pending = 0
+
+    def __len__(self):
+        return self.pending
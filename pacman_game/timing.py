@@ -0,0 +1,109 @@
+"""Frame timing: fixed-timestep accumulator and rate measurement"""
+import time
+from . import config
+
+
+class FixedTimestep:
+    """
+    Converts elapsed wall-clock time into a whole number of simulation steps.
+    
+    Time accumulates between rendered frames and is consumed in fixed steps
+    of 1 / step_rate seconds, so game speed does not depend on how long a
+    frame takes to draw. The leftover fraction of a step is exposed as
+    alpha for interpolating entity positions. After a long stall at most
+    max_steps are run and the backlog is dropped, so a slow machine runs
+    the game slower instead of spiralling further behind.
+    """
+    
+    def __init__(self, step_rate=None, max_steps=None):
+        """
+        Initialize the accumulator.
+        
+        Args:
+            step_rate: Simulation steps per second (defaults to config.FPS)
+            max_steps: Catch-up cap per rendered frame (defaults to
+                config.MAX_CATCH_UP_STEPS)
+        """
+        self.step_rate = step_rate if step_rate is not None else config.FPS
+        self.max_steps = max_steps if max_steps is not None else config.MAX_CATCH_UP_STEPS
+        self.step_time = 1.0 / self.step_rate
+        self.accumulator = 0.0
+        
+        # Steps skipped because the catch-up cap was hit
+        self.dropped_steps = 0
+    
+    def advance(self, elapsed):
+        """
+        Add elapsed time and get the number of steps to run this frame.
+        
+        Args:
+            elapsed: Seconds since the previous call
+            
+        Returns:
+            int: Simulation steps to run (0..max_steps)
+        """
+        self.accumulator += max(elapsed, 0.0)
+        steps = int(self.accumulator / self.step_time)
+        if steps > self.max_steps:
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+            # Keep only the fraction of a step so interpolation stays smooth
+            self.accumulator %= self.step_time
+        else:
+            self.accumulator -= steps * self.step_time
+        return steps
+    
+    @property
+    def alpha(self):
+        """Fraction (0..1) of a step elapsed since the last simulation step"""
+        return min(self.accumulator / self.step_time, 1.0)
+    
+    def reset(self):
+        """Discard accumulated time (e.g. after a pause)"""
+        self.accumulator = 0.0
+
+
+class RateMeter:
+    """Measures how many events (e.g. simulation steps) happen per second"""
+    
+    def __init__(self, window=0.5, clock=time.perf_counter):
+        """
+        Initialize the meter.
+        
+        Args:
+            window: Seconds between rate updates
+            clock: Function returning the current time in seconds
+        """
+        self.window = window
+        self.clock = clock
+        self.rate = 0.0
+        self.total = 0
+        self.started = clock()
+        self._window_start = self.started
+        self._window_count = 0
+    
+    def add(self, count=1):
+        """
+        Record events.
+        
+        Args:
+            count: Number of events that just happened
+            
+        Returns:
+            bool: True if the rate was recalculated by this call
+        """
+        self.total += count
+        self._window_count += count
+        now = self.clock()
+        elapsed = now - self._window_start
+        if elapsed < self.window:
+            return False
+        self.rate = self._window_count / elapsed
+        self._window_start = now
+        self._window_count = 0
+        return True
+    
+    def average(self):
+        """Events per second since the meter was created"""
+        elapsed = self.clock() - self.started
+        return self.total / elapsed if elapsed > 0 else 0.0
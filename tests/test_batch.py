@@ -0,0 +1,108 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pacman_game.batch import BatchSimulation, DIRECTION_CODES, direction_codes
+from pacman_game.simulation import Simulation
+from pacman_game import config
+
+DIRECTIONS = [(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+def assert_same_game(sim, batch, game, frame):
+    """Assert one batch game matches a scalar Simulation exactly"""
+    context = f"game {game} frame {frame}"
+    assert batch.state[game] == sim.state_machine.current_state.value, context
+    assert batch.lives[game] == sim.state_machine.lives, context
+    assert batch.level_number[game] == sim.state_machine.level_number, context
+    assert batch.score[game] == sim.score, context
+    assert batch.pellets_remaining[game] == sim.pellet_manager.pellets_remaining(), context
+    assert (batch.player_x[game], batch.player_y[game]) == (sim.player.x, sim.player.y), context
+    assert batch.player_dir[game] == DIRECTION_CODES[sim.player.direction], context
+    for index, ghost in enumerate(sim.ghosts):
+        assert (batch.ghost_x[game, index], batch.ghost_y[game, index]) == (ghost.x, ghost.y), context
+        assert batch.ghost_dir[game, index] == DIRECTION_CODES[ghost.direction], context
+        assert batch.ghost_behavior[game, index] == ghost.behavior.value, context
+
+
+def run_parity(games, frames, seed, prepare=None):
+    """Step scalar and batch games with the same random inputs, comparing every frame"""
+    rng = random.Random(seed)
+    sims = [Simulation() for _ in range(games)]
+    batch = BatchSimulation(games)
+    if prepare:
+        prepare(sims, batch)
+
+    # Hold each input for a while, like a player would
+    held = [(0, 0)] * games
+    for frame in range(1, frames + 1):
+        for game in range(games):
+            if rng.random() < 0.1:
+                held[game] = rng.choice(DIRECTIONS)
+            sims[game].step(held[game])
+        batch.step(direction_codes(held))
+
+        for game, sim in enumerate(sims):
+            assert_same_game(sim, batch, game, frame)
+    return sims, batch
+
+
+def test_batch_initial_state_matches_simulation():
+    """Verify every batch game starts like a fresh Simulation"""
+    batch = BatchSimulation(3)
+    sim = Simulation()
+    for game in range(3):
+        assert_same_game(sim, batch, game, 0)
+    assert batch.pellets.sum(axis=1).tolist() == [sim.pellet_manager.total_pellets] * 3
+
+
+def test_batch_parity_with_scalar_simulation():
+    """Verify movement, pellets, releases, mode changes, deaths and respawns match frame by frame"""
+    def scatter_entities(sims, batch):
+        # Start games 1+ from random open tiles so turns, cornering and chases all happen
+        rng = random.Random(11)
+        tile = config.TILE_SIZE
+        tiles = [(x, y) for y, row in enumerate(sims[0].level.grid) for x, cell in enumerate(row) if cell != 1]
+        for game, sim in enumerate(sims[1:], start=1):
+            for entity in [sim.player] + sim.ghosts:
+                x, y = rng.choice(tiles)
+                entity.x, entity.y = x * tile + tile / 2, y * tile + tile / 2
+            batch.player_x[game], batch.player_y[game] = sim.player.x, sim.player.y
+            batch.ghost_x[game] = [ghost.x for ghost in sim.ghosts]
+            batch.ghost_y[game] = [ghost.y for ghost in sim.ghosts]
+
+        # Game 0 loses a life on the first frame, then respawns mid-run
+        sim = sims[0]
+        sim.ghosts[0].x, sim.ghosts[0].y = sim.player.x, sim.player.y
+        batch.ghost_x[0, 0], batch.ghost_y[0, 0] = batch.player_x[0], batch.player_y[0]
+
+    sims, batch = run_parity(games=8, frames=config.SCATTER_DURATION + config.LEVEL_COMPLETE_DELAY,
+                             seed=7, prepare=scatter_entities)
+
+    # The run exercised releases, phase changes and a respawn
+    assert (batch.ghost_behavior[:, 1:] != batch.ghost_start_behavior[1:]).any()
+    assert (batch.phase_index > 0).any()
+    assert batch.lives[0] == batch.starting_lives - 1
+
+
+def test_batch_parity_level_complete():
+    """Verify clearing the last pellet advances the level like the scalar game"""
+    def leave_one_pellet(sims, batch):
+        for sim in sims:
+            sim.pellet_manager.collected_count = sim.pellet_manager.total_pellets - 1
+        batch.pellets_remaining[:] = 1
+
+    sims, batch = run_parity(games=3, frames=config.LEVEL_COMPLETE_DELAY + 60, seed=3, prepare=leave_one_pellet)
+
+    assert (batch.level_number == 2).all()
+    assert (batch.ghost_speed == Simulation.ghost_speed_for_level(2)).all()
+
+
+def test_batch_step_without_input():
+    """Edge Case: Stepping with no input keeps the player still"""
+    batch = BatchSimulation(2)
+    start = (batch.player_x.copy(), batch.player_y.copy())
+    batch.step()
+    assert (batch.player_x == start[0]).all() and (batch.player_y == start[1]).all()
+    assert batch.frame == 1
@@ -0,0 +1,50 @@
+import pytest
+from benchmarks.suite import compare, time_case, run_suite
+
+
+def make_results(**medians):
+    return {'results': {name: {'median_us': us} for name, us in medians.items()}}
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    """Verify a median slower than the threshold is flagged"""
+    baseline = make_results(a=10.0, b=10.0, c=10.0)
+    results = make_results(a=10.5, b=12.0, c=5.0)
+
+    rows = {row[0]: row for row in compare(results, baseline, threshold=0.1)}
+
+    assert rows['a'][4] == 'ok'
+    assert rows['b'][4] == 'regressed'
+    assert rows['b'][3] == pytest.approx(1.2)
+    assert rows['c'][4] == 'improved'
+
+
+def test_compare_new_and_skipped_cases():
+    """Verify cases missing from the baseline or skipped are not regressions"""
+    baseline = make_results(a=10.0)
+    results = make_results(a=10.0, b=3.0)
+    results['results']['c'] = {'skipped': "pygame is not installed"}
+
+    rows = {row[0]: row[4] for row in compare(results, baseline, threshold=0.1)}
+
+    assert rows == {'a': 'ok', 'b': 'new', 'c': 'skipped'}
+
+
+def test_time_case_reports_per_operation_times():
+    """Verify time_case warms up once and times each repeat"""
+    calls = []
+    result = time_case(lambda: calls.append(1), ops=10, repeat=3)
+
+    assert len(calls) == 4
+    assert result['ops'] == 10
+    assert result['repeat'] == 3
+    assert result['min_us'] <= result['median_us']
+
+
+def test_run_suite_filters_cases():
+    """Verify only cases matching the filter run, with machine metadata"""
+    output = run_suite(['level/is_wall'], scale=0.01, repeat=1)
+
+    assert list(output['results']) == ['level/is_wall']
+    assert 'python' in output['machine']
+    assert 'pathfinding_strategy' in output['machine']
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import MagicMock
 from pacman_game.debug.overlay import DebugOverlay
 from pacman_game import config
 
@@ -39,3 +40,62 @@ def test_debug_draw_call(mock_pygame):
     # We can skip complex drawing test and rely on toggle logic which is the "isolation" goal.
     # But let's verify it attempts to Draw if enabled
     pass
+
+def test_debug_fonts_loaded_lazily(mock_pygame):
+    """Verify fonts are not loaded until the overlay first draws"""
+    overlay = DebugOverlay()
+    assert overlay.font is None
+    overlay.enabled = True
+    overlay.load_fonts()
+    assert overlay.font is not None
+    assert overlay.small_font is not None
+
+def test_debug_grid_layer_baked_once(level, mock_pygame):
+    """Verify the grid is drawn once and then blitted"""
+    overlay = DebugOverlay()
+    screen = MagicMock()
+    overlay.draw_grid(screen, level)
+    mock_pygame.draw.reset_mock()
+
+    overlay.draw_grid(screen, level)
+    overlay.draw_grid(screen, level)
+    assert mock_pygame.draw.rect.call_count == 0
+    assert mock_pygame.draw.circle.call_count == 0
+    assert screen.blit.call_count == 3
+
+def test_debug_panel_refresh_rate(player, ghosts, state_machine, monkeypatch):
+    """Verify panel text is re-rendered at DEBUG_PANEL_REFRESH_HZ of clock time, not per frame"""
+    monkeypatch.setattr(config, "DEBUG_PANEL_REFRESH_HZ", 4)
+    now = [0.0]
+    overlay = DebugOverlay(clock=lambda: now[0])
+    overlay.load_fonts()
+    calls = []
+    monkeypatch.setattr(overlay, "render_panel_text", lambda *args: calls.append(args))
+
+    # One second at 60 frames per second
+    for frame in range(60):
+        now[0] = frame / 60
+        overlay.draw_info_panel(MagicMock(), player, ghosts, state_machine, 60)
+    assert len(calls) == 4
+
+    # At 4 frames per second every frame is due (counting frames would take seconds)
+    for frame in range(4):
+        now[0] = 1.0 + frame / 4
+        overlay.draw_info_panel(MagicMock(), player, ghosts, state_machine, 4)
+    assert len(calls) == 8
+
+    # Re-enabling the overlay refreshes immediately
+    overlay.toggle()
+    overlay.toggle()
+    overlay.draw_info_panel(MagicMock(), player, ghosts, state_machine, 60)
+    assert len(calls) == 9
+
+def test_debug_draw_enabled(player, ghosts, state_machine, level):
+    """Verify a full overlay draw runs with every panel enabled"""
+    overlay = DebugOverlay()
+    overlay.enabled = True
+    ghosts[0].target_tile = (1, 1)
+    overlay.draw(MagicMock(), level, player, ghosts, state_machine, 60)
+    background = overlay.panel_background
+    overlay.draw(MagicMock(), level, player, ghosts, state_machine, 60)
+    assert overlay.panel_background is background
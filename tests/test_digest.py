@@ -0,0 +1,95 @@
+import pytest
+from pacman_game import config
+from pacman_game.digest import (StateDigest, compare, config_overrides, first_divergence, main,
+                                parse_override, record_policy_replay, run_digests)
+from pacman_game.simulation import Simulation
+
+
+def test_digest_tracks_state():
+    """Verify the digest is stable for equal states and changes with each component"""
+    sim = Simulation()
+    digest = StateDigest()
+    initial = digest(sim)
+    assert digest(Simulation()) == initial
+
+    sim.score += 10
+    scored = digest(sim)
+    assert scored != initial
+    sim.ghosts[1].x += 1
+    moved = digest(sim)
+    assert moved != scored
+    sim.state_machine.lives -= 1
+    assert digest(sim) != moved
+
+def test_pellet_changes_invalidate_cache():
+    """Edge Case: Collecting a pellet changes the digest even with everything else equal"""
+    sim = Simulation()
+    digest = StateDigest()
+    before = digest(sim)
+    points = sim.pellet_manager.collect_pellet(sim.player.x, sim.player.y)
+    assert points > 0
+    assert digest(sim) != before
+    sim.pellet_manager.reset()
+    assert digest(sim) == before
+
+def test_simulation_logs_digests(monkeypatch):
+    """Verify enabled digests are logged once per step, including transition frames"""
+    monkeypatch.setattr(config, 'STATE_DIGEST_ENABLED', True)
+    sim = Simulation()
+    for _ in range(5):
+        sim.step((1, 0))
+    sim.state_machine.check_life_lost(True)
+    sim.step((1, 0))
+    assert len(sim.digests) == 6
+    assert sim.digests[-1] == sim.digest(sim)
+
+def test_digests_off_by_default():
+    """Verify nothing is logged unless enabled"""
+    sim = Simulation()
+    sim.step((1, 0))
+    assert sim.digest is None
+    assert len(sim.digests) == 0
+
+def test_first_divergence():
+    """Verify the first differing frame is reported 1-based"""
+    assert first_divergence([1, 2, 3], [1, 2, 3]) is None
+    assert first_divergence([1, 2, 3], [1, 5, 3]) == 2
+    assert first_divergence([1, 2], [1, 2, 3]) == 3
+
+def test_parse_override():
+    """Verify overrides parse literals and reject unknown settings"""
+    assert parse_override("player_speed=3") == ('PLAYER_SPEED', 3)
+    assert parse_override("PATHFINDING_STRATEGY=a_star") == ('PATHFINDING_STRATEGY', 'a_star')
+    with pytest.raises(ValueError):
+        parse_override("NOT_A_SETTING=1")
+    with pytest.raises(ValueError):
+        parse_override("PLAYER_SPEED")
+
+def test_config_overrides_restore():
+    """Verify overrides are undone even if the run fails"""
+    speed = config.PLAYER_SPEED
+    with pytest.raises(RuntimeError):
+        with config_overrides({'PLAYER_SPEED': speed + 1}):
+            assert config.PLAYER_SPEED == speed + 1
+            raise RuntimeError
+    assert config.PLAYER_SPEED == speed
+
+def test_same_configuration_is_identical():
+    """Verify a replay digests identically on repeated runs"""
+    replay = record_policy_replay('random', 2, 600)
+    assert run_digests(replay) == run_digests(replay)
+    assert compare(replay, {}, {})['divergence'] is None
+
+def test_compare_finds_first_divergent_frame():
+    """Verify a behaviour change is located at the first frame it shows"""
+    replay = record_policy_replay('scripted', 2, 300)
+    result = compare(replay, {}, {'PLAYER_SPEED': config.PLAYER_SPEED + 1})
+    assert result['divergence'] == 1
+    assert 'player' in result['differences']
+    assert 'blinky' not in result['differences']
+
+def test_cli_exit_status(capsys):
+    """Verify the compare tool reports through its exit status"""
+    assert main(['--frames', '60']) == 0
+    assert main(['--policy', 'scripted', '--frames', '60', '--b', f'PLAYER_SPEED={config.PLAYER_SPEED + 1}']) == 1
+    assert "First divergence at frame 1" in capsys.readouterr().out
@@ -0,0 +1,60 @@
+import random
+import pytest
+from pacman_game import farm
+from pacman_game.farm import (ScriptedPolicy, BotPolicy, make_policy, parse_script, run_game,
+                              run_farm, summarize)
+from pacman_game.simulation import Simulation
+
+
+def test_parse_script():
+    """Verify scripts parse into (direction, frames) steps"""
+    assert parse_script("R:3, d:2,.:1") == [((1, 0), 3), ((0, 1), 2), ((0, 0), 1)]
+
+@pytest.mark.parametrize("script", ["", "X:3", "R:0", "R"])
+def test_parse_script_rejects_bad_steps(script):
+    """Edge Case: Unknown letters, missing or zero frame counts are errors"""
+    with pytest.raises(ValueError):
+        parse_script(script)
+
+def test_scripted_policy_cycles():
+    """Verify the scripted policy repeats its script"""
+    policy = ScriptedPolicy("R:2,U:1")
+    assert [policy(None) for _ in range(6)] == [(1, 0), (1, 0), (0, -1)] * 2
+
+def test_unknown_policy():
+    """Edge Case: Unknown policy names are rejected"""
+    with pytest.raises(ValueError):
+        make_policy("telepathy", 0)
+
+def test_bot_heads_for_nearest_pellet():
+    """Verify the bot routes to a pellet from a tile center"""
+    sim = Simulation()
+    bot = BotPolicy(random.Random(0))
+    # The player starts at (1, 1) with pellets to its right
+    assert bot(sim) == (1, 0)
+
+def test_run_game_is_deterministic():
+    """Verify the same seed and policy give the same game"""
+    first = run_game(5, 'random', max_frames=300)
+    second = run_game(5, 'random', max_frames=300)
+    for key in ('score', 'frames', 'level', 'lives', 'game_over'):
+        assert first[key] == second[key]
+    assert first['frames'] == 300
+
+def test_worker_level_is_reused():
+    """Verify games in one process share the worker's level"""
+    run_game(1, 'scripted', max_frames=10)
+    level = farm._level
+    run_game(2, 'scripted', max_frames=10)
+    assert farm._level is level
+
+def test_run_farm_in_process_and_summarize():
+    """Verify serial farming yields one result per seed and aggregates them"""
+    results = list(run_farm(range(3), 'bot', max_frames=120, workers=1))
+    assert sorted(r['seed'] for r in results) == [0, 1, 2]
+
+    summary = summarize(results)
+    assert summary['games'] == 3
+    assert summary['total_frames'] == 360
+    assert summary['frames']['mean'] == 120
+    assert summary['score']['min'] <= summary['score']['median'] <= summary['score']['max']
@@ -0,0 +1,74 @@
+import pytest
+from pacman_game import config
+from pacman_game.ai.pathfinding import a_star, get_next_direction
+from pacman_game.ai.flow_field import FlowField, FlowFieldCache
+
+def test_flow_field_distances(simple_grid_level):
+    """Verify BFS distances match shortest path lengths"""
+    field = FlowField(simple_grid_level, (1, 1))
+    assert field.distance((1, 1)) == 0
+    assert field.distance((4, 1)) == 3
+    assert field.distance((8, 8)) == len(a_star((8, 8), (1, 1), simple_grid_level)) - 1
+    assert field.distance((0, 0)) == -1  # Wall
+    assert field.distance((-3, 20)) == -1  # Out of bounds
+
+def test_flow_field_downhill_direction(simple_grid_level):
+    """Verify the downhill step reduces distance to the target"""
+    field = FlowField(simple_grid_level, (5, 5))
+    assert field.get_direction((5, 5)) == (0, 0)
+    assert field.get_direction((1, 5)) == (1, 0)
+    assert field.get_direction((5, 8)) == (0, -1)
+
+def test_flow_field_unreachable(simple_grid_level):
+    """Edge Case: Enclosed targets give no direction"""
+    simple_grid_level.grid[4][5] = 1
+    simple_grid_level.grid[6][5] = 1
+    simple_grid_level.grid[5][4] = 1
+    simple_grid_level.grid[5][6] = 1
+    field = FlowField(simple_grid_level, (5, 5))
+    assert field.get_direction((1, 1)) == (0, 0)
+
+def test_cache_shares_field_per_target(simple_grid_level):
+    """Verify ghosts heading to the same target share one BFS"""
+    cache = FlowFieldCache()
+    cache.begin_cycle()
+    for ghost_pos in [(1, 1), (8, 8), (1, 8), (8, 1)]:
+        cache.get_direction(ghost_pos, (4, 4), simple_grid_level)
+    cache.get_direction((1, 1), (2, 2), simple_grid_level)
+    
+    assert cache.lookups == 5
+    assert cache.builds == 2
+
+def test_cache_evicts_unused_targets(simple_grid_level):
+    """Verify fields unused for a whole cycle are dropped"""
+    cache = FlowFieldCache()
+    cache.begin_cycle()
+    cache.get_field(simple_grid_level, (4, 4))
+    cache.begin_cycle()
+    # Still cached: used during the previous cycle
+    cache.get_field(simple_grid_level, (4, 4))
+    assert cache.builds == 1
+    
+    cache.begin_cycle()
+    cache.begin_cycle()
+    cache.get_field(simple_grid_level, (4, 4))
+    assert cache.builds == 2
+
+def test_cache_rebuilds_on_invalidate(simple_grid_level):
+    """Verify grid changes rebuild cached fields"""
+    cache = FlowFieldCache()
+    field = cache.get_field(simple_grid_level, (4, 4))
+    simple_grid_level.invalidate()
+    assert cache.get_field(simple_grid_level, (4, 4)) is not field
+
+def test_cache_wall_target(simple_grid_level):
+    """Edge Case: Wall targets have no field"""
+    cache = FlowFieldCache()
+    assert cache.get_field(simple_grid_level, (0, 0)) is None
+    assert cache.get_direction((1, 1), (0, 0), simple_grid_level) == (0, 0)
+
+def test_get_next_direction_flow_field_strategy(simple_grid_level, monkeypatch):
+    """Verify get_next_direction dispatches to flow fields"""
+    monkeypatch.setattr(config, "PATHFINDING_STRATEGY", "flow_field")
+    assert get_next_direction((1, 1), (3, 1), simple_grid_level) == (1, 0)
+    assert get_next_direction((3, 1), (3, 1), simple_grid_level) == (0, 0)
@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import MagicMock
+from pacman_game.game import Game
+from pacman_game.main import parse_args
+
+@pytest.fixture
+def game(tmp_path, monkeypatch):
+    """Provide a Game on the mocked display, keeping high scores out of the repo"""
+    monkeypatch.chdir(tmp_path)
+    return Game(turbo=True, turbo_steps=10, turbo_draw_every=4)
+
+def test_turbo_frame_runs_k_steps(game):
+    """Verify a turbo frame runs turbo_steps steps and draws every N steps"""
+    game.draw = MagicMock()
+    game.run_turbo_frame()
+    assert game.simulation.frame == 10
+    assert game.draw.call_count == 2
+    assert game.steps_since_draw == 2
+    assert game.sim_rate.total == 10
+
+def test_turbo_without_drawing(game):
+    """Edge Case: turbo_draw_every of 0 never draws"""
+    game.turbo_draw_every = 0
+    game.draw = MagicMock()
+    game.run_turbo_frame()
+    game.run_turbo_frame()
+    assert game.simulation.frame == 20
+    game.draw.assert_not_called()
+
+def test_toggle_turbo(game):
+    """Verify toggling turbo off discards accumulated time"""
+    game.timestep.accumulator = 1.0
+    game.toggle_turbo()
+    assert game.turbo is False
+    assert game.timestep.accumulator == 0.0
+    assert game.turbo_used is True
+
+def test_turbo_cli_flags():
+    """Verify the command line turbo options"""
+    args = parse_args(["--turbo", "--turbo-steps", "64", "--draw-every", "16"])
+    assert args.turbo is True
+    assert args.turbo_steps == 64
+    assert args.draw_every == 16
+    assert parse_args([]).turbo is False
@@ -1,6 +1,8 @@
 import pytest
 from hypothesis import given, strategies as st
-from pacman_game.ai.ghost_behaviors import get_target_tile, GhostBehavior
+from pacman_game.ai.ghost_behaviors import get_target_tile, GhostBehavior, ModeController
+from pacman_game.ghosts import Ghost
+from pacman_game.timers import TimerWheel
 from pacman_game import config
 
 def test_ghost_targeting_basic():
@@ -54,3 +56,70 @@ def test_ghost_targeting_fuzz(ghost_type, behavior, gx, gy, px, py, pdx, pdy):
     # So generally, coordinates should be reasonable (e.g. not billions)
     assert -100 < target[0] < 100
     assert -100 < target[1] < 100
+
+
+def make_controller(schedules):
+    timers = TimerWheel()
+    ghosts = [Ghost(30, 30, (255, 0, 0), "BLINKY"), Ghost(60, 30, (255, 182, 255), "PINKY")]
+    ghosts[1].behavior = GhostBehavior.IDLE
+    return timers, ModeController(timers, schedules), ghosts
+
+def test_mode_controller_broadcasts_phase_changes():
+    """Verify all active ghosts switch together and are flagged to replan"""
+    timers, modes, ghosts = make_controller({1: (3, 5)})
+    modes.start(1, ghosts)
+    blinky, pinky = ghosts
+
+    timers.advance()
+    modes.release(pinky)
+    assert pinky.behavior == GhostBehavior.SCATTER
+    blinky.replan_needed = pinky.replan_needed = False
+
+    timers.advance()
+    timers.advance()
+    assert modes.phase == GhostBehavior.CHASE
+    assert blinky.behavior == pinky.behavior == GhostBehavior.CHASE
+    assert blinky.replan_needed and pinky.replan_needed
+
+    # Schedule repeats: chase lasts 5 frames, then scatter again
+    for _ in range(5):
+        timers.advance()
+    assert modes.phase == GhostBehavior.SCATTER
+    assert modes.phase_changes == 2
+
+def test_mode_controller_ignores_idle_ghosts():
+    """Edge Case: Ghosts still in the house keep their behavior"""
+    timers, modes, ghosts = make_controller({1: (1, 1)})
+    modes.start(1, ghosts)
+    timers.advance()
+    assert ghosts[1].behavior == GhostBehavior.IDLE
+    assert not ghosts[1].replan_needed
+
+def test_mode_controller_per_level_schedule():
+    """Verify the schedule with the highest starting level not above the current one is used"""
+    timers, modes, ghosts = make_controller({1: (10, 20), 3: (2, None)})
+    assert modes.schedule_for_level(1) == (10, 20)
+    assert modes.schedule_for_level(2) == (10, 20)
+    assert modes.schedule_for_level(7) == (2, None)
+
+    # A trailing None holds the last phase forever
+    modes.start(3, ghosts)
+    for _ in range(100):
+        timers.advance()
+    assert modes.phase == GhostBehavior.CHASE
+    assert modes.phase_changes == 1
+    assert len(timers) == 0
+
+def test_mode_change_forces_immediate_replan(simple_grid_level, player):
+    """Verify a flagged ghost replans on its next update instead of waiting for the interval"""
+    level = simple_grid_level
+    ghost = Ghost(config.TILE_SIZE * 4, config.TILE_SIZE * 4, (255, 0, 0), "BLINKY")
+    ghost.owns_mode_timer = False
+    ghost.update(level, player)
+    replans = ghost.replan_count
+
+    ghost.enter_mode(GhostBehavior.CHASE)
+    ghost.update(level, player)
+
+    assert ghost.replan_count == replans + 1
+    assert not ghost.replan_needed
@@ -0,0 +1,139 @@
+import pytest
+from hypothesis import given, strategies as st
+from pacman_game.grid import Grid, EXIT_BITS
+from pacman_game.level import Level
+from pacman_game.maze import Maze, level_map
+from pacman_game.player import Player
+from pacman_game import config
+
+def reference_is_wall(rows, grid_x, grid_y):
+    """List-of-lists is_wall the grid replaces"""
+    if grid_y < 0 or grid_y >= len(rows):
+        return True
+    if grid_x < 0 or grid_x >= len(rows[0]):
+        return True
+    return rows[grid_y][grid_x] == 1
+
+def reference_can_move_to(rows, x, y, radius, tile_size):
+    """List-of-lists can_move_to the grid replaces"""
+    grid_left = int((x - radius) / tile_size)
+    grid_right = int((x + radius) / tile_size)
+    grid_top = int((y - radius) / tile_size)
+    grid_bottom = int((y + radius) / tile_size)
+    return not (reference_is_wall(rows, grid_left, grid_top) or
+                reference_is_wall(rows, grid_right, grid_top) or
+                reference_is_wall(rows, grid_left, grid_bottom) or
+                reference_is_wall(rows, grid_right, grid_bottom))
+
+def test_grid_sentinel_border():
+    """Edge Case: The border and anything beyond it are walls"""
+    grid = Grid([[0, 0], [0, 0]], 10)
+    assert not grid.is_wall(0, 0)
+    assert not grid.is_wall(1, 1)
+    for x, y in [(-1, 0), (2, 0), (0, -1), (0, 2), (-1, -1), (2, 2), (-50, 0), (0, 99)]:
+        assert grid.is_wall(x, y)
+
+def test_grid_row_views():
+    """Verify grid[y][x] reads, writes and iterates like nested lists"""
+    rows = [[1, 0, 2], [0, 1, 0]]
+    grid = Grid(rows, 10)
+    assert len(grid) == 2
+    assert len(grid[0]) == 3
+    assert grid[0][2] == 2
+    assert grid[-1][-1] == 0
+    assert [list(row) for row in grid] == rows
+    assert grid[0].count(2) == 1
+
+    grid[1][2] = 1
+    assert grid.get(2, 1) == 1
+    assert grid.to_lists() == [[1, 0, 2], [0, 1, 1]]
+
+    with pytest.raises(IndexError):
+        grid[2]
+    with pytest.raises(IndexError):
+        grid[0][3]
+
+def test_grid_write_invalidates_level():
+    """Verify writing a cell through the grid bumps the level revision"""
+    lvl = Level()
+    revision = lvl.revision
+    lvl.grid[1][1] = 1
+    assert lvl.revision != revision
+    assert lvl.is_wall(1, 1)
+
+def test_grid_assignment_rebinds_level_checks():
+    """Verify assigning a new grid replaces the walls used for collision"""
+    lvl = Level()
+    lvl.grid = [[0] * 3 for _ in range(3)]
+    assert not lvl.is_wall(2, 2)
+    assert lvl.is_wall(3, 2)
+    assert lvl.can_move_to(lvl.tile_size * 1.5, lvl.tile_size * 1.5, 10)
+
+def test_maze_collect_dot():
+    """Verify the maze grid keeps dots and removes them once collected"""
+    maze = Maze()
+    assert maze.total_dots == sum(row.count(2) for row in level_map)
+    x = maze.tile_size * 1.5
+    y = maze.tile_size * 1.5
+    assert maze.collect_dot(x, y) == 10
+    assert maze.collect_dot(x, y) == 0
+    assert maze.dots_collected == 1
+    # The module-level map is left untouched
+    assert level_map[1][1] == 2
+
+@given(
+    grid_rows=st.lists(
+        st.lists(st.integers(min_value=0, max_value=1), min_size=6, max_size=6),
+        min_size=6, max_size=6
+    ),
+    x=st.floats(min_value=-40, max_value=220, allow_nan=False),
+    y=st.floats(min_value=-40, max_value=220, allow_nan=False),
+    radius=st.integers(min_value=0, max_value=25)
+)
+def test_grid_matches_list_reference_fuzz(grid_rows, x, y, radius):
+    """Property check: Grid collision agrees with the list-of-lists version"""
+    grid = Grid(grid_rows, 30)
+    assert grid.can_move_to(x, y, radius) == reference_can_move_to(grid_rows, x, y, radius, 30)
+    gx, gy = int(x / 30), int(y / 30)
+    assert grid.is_wall(gx, gy) == reference_is_wall(grid_rows, gx, gy)
+
+def reference_exit_mask(grid, grid_x, grid_y):
+    """Exit mask rebuilt from four is_wall checks"""
+    return sum(bit for (dx, dy), bit in EXIT_BITS.items() if not grid.is_wall(grid_x + dx, grid_y + dy))
+
+@given(
+    grid_rows=st.lists(
+        st.lists(st.integers(min_value=0, max_value=1), min_size=5, max_size=5),
+        min_size=4, max_size=4
+    ),
+    writes=st.lists(
+        st.tuples(st.integers(min_value=0, max_value=4), st.integers(min_value=0, max_value=3),
+                  st.integers(min_value=0, max_value=2)),
+        max_size=6
+    )
+)
+def test_exit_masks_match_is_wall_fuzz(grid_rows, writes):
+    """Property check: Exit masks agree with is_wall, including after cell writes"""
+    grid = Grid(grid_rows, 30)
+    for x, y, value in writes:
+        grid[y][x] = value
+    for y in range(-2, grid.rows + 2):
+        for x in range(-2, grid.cols + 2):
+            assert grid.exit_mask(x, y) == reference_exit_mask(grid, x, y)
+
+def test_level_has_exit(simple_grid_level):
+    """Verify has_exit reads the mask for each direction"""
+    assert simple_grid_level.has_exit(1, 1, (1, 0))
+    assert simple_grid_level.has_exit(1, 1, (0, 1))
+    assert not simple_grid_level.has_exit(1, 1, (-1, 0))
+    assert not simple_grid_level.has_exit(1, 1, (0, -1))
+    assert not simple_grid_level.has_exit(1, 1, (0, 0))
+
+def test_player_does_not_turn_into_wall(simple_grid_level):
+    """Verify a turn towards a wall at a tile center keeps the current direction"""
+    p = Player(config.TILE_SIZE, config.TILE_SIZE)
+    p.direction = (1, 0)
+    p.desired_direction = (0, -1)  # Wall above tile (1, 1)
+    p.update(simple_grid_level)
+    assert p.direction == (1, 0)
+    assert p.x == config.TILE_SIZE * 1.5 + p.speed
@@ -0,0 +1,75 @@
+import pytest
+from unittest.mock import MagicMock
+from pacman_game import config
+from pacman_game.rendering import TextCache, HUD
+from pacman_game.simulation import Simulation
+from pacman_game.state_machine import GameState
+
+def test_text_cache_hit_and_miss():
+    """Verify each (text, color, font) is rendered once"""
+    font = MagicMock()
+    cache = TextCache(8)
+    first = cache.render(font, "Score: 0", config.WHITE)
+    second = cache.render(font, "Score: 0", config.WHITE)
+    assert first is second
+    assert font.render.call_count == 1
+
+    cache.render(font, "Score: 0", config.YELLOW)
+    cache.render(MagicMock(), "Score: 0", config.WHITE)
+    assert cache.misses == 3
+    assert cache.hits == 1
+
+def test_text_cache_eviction():
+    """Verify least recently used strings are evicted past max_size"""
+    font = MagicMock()
+    cache = TextCache(2)
+    cache.render(font, "a", config.WHITE)
+    cache.render(font, "b", config.WHITE)
+    cache.render(font, "a", config.WHITE)  # "b" is now least recent
+    cache.render(font, "c", config.WHITE)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+    font.render.reset_mock()
+    cache.render(font, "a", config.WHITE)
+    assert font.render.call_count == 0
+    cache.render(font, "b", config.WHITE)
+    assert font.render.call_count == 1
+
+def test_text_cache_disabled():
+    """Edge Case: A zero-size cache renders every time"""
+    font = MagicMock()
+    cache = TextCache(0)
+    cache.render(font, "a", config.WHITE)
+    cache.render(font, "a", config.WHITE)
+    assert font.render.call_count == 2
+    assert len(cache) == 0
+
+def test_hud_renders_only_changed_fields():
+    """Verify a HUD redraw with unchanged values does not touch the text cache"""
+    sim = Simulation()
+    hud = HUD(MagicMock())
+    screen = MagicMock()
+
+    hud.draw(screen, sim, 0)
+    misses = hud.text_cache.misses
+    assert misses == 5
+
+    hud.draw(screen, sim, 0)
+    assert hud.text_cache.misses == misses
+    assert hud.text_cache.hits == 0
+
+    sim.score = 10
+    hud.draw(screen, sim, 0)
+    assert hud.text_cache.misses == misses + 1
+    assert hud.fields['score'][0] == "Score: 10"
+
+def test_hud_state_banner():
+    """Verify state banners are drawn for the matching state"""
+    sim = Simulation()
+    hud = HUD(MagicMock())
+    sim.state_machine.current_state = GameState.GAME_OVER
+    hud.draw(MagicMock(), sim, 100, new_high_score=True)
+    assert hud.fields['banner'][0] == "GAME OVER!"
+    assert 'new_high_score' in hud.fields
+    assert 'restart' in hud.fields
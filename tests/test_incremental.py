@@ -0,0 +1,102 @@
+import pytest
+from hypothesis import given, settings, strategies as st
+from pacman_game import config
+from pacman_game.ai.incremental import IncrementalPlanner
+from pacman_game.ai.pathfinding import a_star, get_next_direction
+from pacman_game.ghosts import Ghost
+from pacman_game.level import Level
+
+def test_planner_basic_direction(simple_grid_level):
+    """Verify the planner steps along a shortest path"""
+    planner = IncrementalPlanner()
+    assert planner.get_next_direction((1, 1), (4, 1), simple_grid_level) == (1, 0)
+    assert planner.get_next_direction((1, 4), (1, 1), simple_grid_level) == (0, -1)
+
+def test_planner_start_is_goal(simple_grid_level):
+    """Edge Case: Start equals Goal should not move"""
+    planner = IncrementalPlanner()
+    assert planner.get_next_direction((3, 3), (3, 3), simple_grid_level) == (0, 0)
+
+def test_planner_walls_and_unreachable(simple_grid_level):
+    """Edge Case: Wall endpoints and enclosed goals give no direction"""
+    planner = IncrementalPlanner()
+    assert planner.get_next_direction((1, 1), (0, 0), simple_grid_level) == (0, 0)
+    
+    simple_grid_level.grid[4][5] = 1
+    simple_grid_level.grid[6][5] = 1
+    simple_grid_level.grid[5][4] = 1
+    simple_grid_level.grid[5][6] = 1
+    simple_grid_level.invalidate()
+    assert planner.get_next_direction((1, 1), (5, 5), simple_grid_level) == (0, 0)
+
+def test_planner_repairs_when_start_moves(simple_grid_level):
+    """Verify moving the start reuses the previous search"""
+    planner = IncrementalPlanner()
+    planner.get_next_direction((1, 1), (8, 8), simple_grid_level)
+    first = planner.expansions
+    
+    planner.get_next_direction((2, 1), (8, 8), simple_grid_level)
+    assert planner.resets == 1
+    assert planner.expansions < first
+
+def test_planner_repairs_small_goal_moves(simple_grid_level):
+    """Verify small goal moves are repaired and large jumps restart"""
+    planner = IncrementalPlanner(max_goal_shift=2)
+    planner.get_next_direction((1, 1), (8, 8), simple_grid_level)
+    
+    assert planner.get_next_direction((1, 1), (8, 7), simple_grid_level) in [(1, 0), (0, 1)]
+    assert planner.resets == 1
+    
+    assert planner.get_next_direction((1, 1), (1, 5), simple_grid_level) == (0, 1)
+    assert planner.resets == 2
+
+def test_planner_resets_on_level_change(simple_grid_level):
+    """Verify invalidating the level restarts the search"""
+    planner = IncrementalPlanner()
+    planner.get_next_direction((1, 1), (8, 8), simple_grid_level)
+    simple_grid_level.invalidate()
+    planner.get_next_direction((1, 1), (8, 8), simple_grid_level)
+    assert planner.resets == 2
+
+def test_get_next_direction_uses_planner(simple_grid_level):
+    """Verify a caller-owned planner takes precedence over the strategy"""
+    planner = IncrementalPlanner()
+    assert get_next_direction((1, 1), (4, 1), simple_grid_level, planner=planner) == (1, 0)
+    assert planner.replans == 1
+
+def test_ghost_owns_planner_for_incremental_strategy(monkeypatch):
+    """Verify ghosts only get a planner when the strategy asks for one"""
+    assert Ghost(30, 30, config.RED, "BLINKY").planner is None
+    
+    monkeypatch.setattr(config, "PATHFINDING_STRATEGY", "incremental")
+    assert isinstance(Ghost(30, 30, config.RED, "BLINKY").planner, IncrementalPlanner)
+
+@given(
+    grid_rows=st.lists(
+        st.lists(st.integers(min_value=0, max_value=1), min_size=8, max_size=8),
+        min_size=8, max_size=8
+    ),
+    moves=st.lists(
+        st.tuples(st.integers(min_value=0, max_value=7), st.integers(min_value=0, max_value=7),
+                  st.integers(min_value=0, max_value=7), st.integers(min_value=0, max_value=7)),
+        min_size=1, max_size=8
+    )
+)
+@settings(max_examples=50)
+def test_planner_matches_a_star_fuzz(grid_rows, moves):
+    """Property check: Every repaired step is the first step of a shortest path"""
+    lvl = Level()
+    lvl.grid = grid_rows
+    planner = IncrementalPlanner(max_goal_shift=3)
+    
+    for sx, sy, gx, gy in moves:
+        start, goal = (sx, sy), (gx, gy)
+        direction = planner.get_next_direction(start, goal, lvl)
+        path = a_star(start, goal, lvl, max_expansions=1000)
+        
+        if path is None or len(path) == 1:
+            assert direction == (0, 0)
+        else:
+            rest = a_star((sx + direction[0], sy + direction[1]), goal, lvl, max_expansions=1000)
+            assert rest is not None
+            assert len(rest) == len(path) - 1
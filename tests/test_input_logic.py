@@ -87,3 +87,29 @@ def test_process_events_direction():
     
     handler.get_direction_input()
     assert handler.get_buffered_direction() == (0, -1)
+
+def test_process_events_turbo_toggle():
+    """Verify turbo toggle on F4"""
+    handler = InputHandler()
+    
+    mock_event = MagicMock()
+    mock_event.type = pygame.KEYDOWN
+    mock_event.key = pygame.K_F4
+    pygame.event.get.return_value = [mock_event]
+    
+    events = handler.process_events()
+    assert events['turbo_toggle'] is True
+    assert events['debug_toggle'] is False
+
+def test_process_events_profile_dump():
+    """Verify profile dump on F5"""
+    handler = InputHandler()
+    
+    mock_event = MagicMock()
+    mock_event.type = pygame.KEYDOWN
+    mock_event.key = pygame.K_F5
+    pygame.event.get.return_value = [mock_event]
+    
+    events = handler.process_events()
+    assert events['profile_dump'] is True
+    assert events['turbo_toggle'] is False
@@ -0,0 +1,111 @@
+import pytest
+from hypothesis import given, strategies as st
+from unittest.mock import MagicMock
+from pacman_game import config
+from pacman_game.ai.junction_graph import JunctionGraph, get_junction_graph
+from pacman_game.ai.pathfinding import a_star, get_next_direction
+from pacman_game.ghosts import Ghost
+from pacman_game.level import Level
+
+# 7x5 ring corridor with a dead-end spur going down from (3, 3)
+RING = [
+    [1, 1, 1, 1, 1, 1, 1],
+    [1, 0, 0, 0, 0, 0, 1],
+    [1, 0, 1, 1, 1, 0, 1],
+    [1, 0, 0, 0, 0, 0, 1],
+    [1, 1, 1, 0, 1, 1, 1],
+    [1, 1, 1, 1, 1, 1, 1],
+]
+
+@pytest.fixture
+def ring_level():
+    lvl = Level()
+    lvl.grid = [row[:] for row in RING]
+    return lvl
+
+def test_junctions_are_decision_points(ring_level):
+    """Verify only tiles without exactly two exits become junctions"""
+    graph = JunctionGraph(ring_level)
+    assert graph.junctions == {(3, 3), (3, 4)}
+    assert graph.is_junction((3, 3))
+    assert not graph.is_junction((1, 1))  # Corner of the ring
+
+def test_corridor_segments(ring_level):
+    """Verify corridors collapse into weighted edges"""
+    graph = JunctionGraph(ring_level)
+    costs = sorted(cost for _, cost, _ in graph.edges[(3, 3)])
+    # Spur to the dead end, plus the ring leaving left and right
+    assert costs == [1, 12, 12]
+
+def test_pure_loop_gets_a_junction():
+    """Edge Case: A loop of two-exit tiles still compiles"""
+    lvl = Level()
+    lvl.grid = [[1, 1, 1, 1], [1, 0, 0, 1], [1, 0, 0, 1], [1, 1, 1, 1]]
+    graph = JunctionGraph(lvl)
+    assert len(graph.junctions) == 1
+    assert graph.get_next_direction((1, 1), (2, 2)) in [(1, 0), (0, 1)]
+
+def test_next_direction_in_corridor(ring_level):
+    """Verify the shortest way round the ring is chosen"""
+    graph = JunctionGraph(ring_level)
+    assert graph.get_next_direction((2, 1), (4, 1)) == (1, 0)
+    assert graph.get_next_direction((1, 2), (3, 4)) == (0, 1)
+    assert graph.get_next_direction((3, 3), (2, 3)) == (-1, 0)
+    assert graph.get_next_direction((3, 3), (3, 3)) == (0, 0)
+    assert graph.get_next_direction((3, 3), (0, 0)) == (0, 0)
+
+def test_graph_rebuilt_on_invalidate(ring_level):
+    """Verify the cached graph follows level revisions"""
+    graph = get_junction_graph(ring_level)
+    assert get_junction_graph(ring_level) is graph
+    ring_level.invalidate()
+    assert get_junction_graph(ring_level) is not graph
+
+def test_get_next_direction_junction_strategy(ring_level, monkeypatch):
+    """Verify get_next_direction dispatches to the junction graph"""
+    monkeypatch.setattr(config, "PATHFINDING_STRATEGY", "junction")
+    assert get_next_direction((2, 1), (4, 1), ring_level) == (1, 0)
+
+def test_ghost_follows_corridors_without_replanning(ring_level, monkeypatch):
+    """Verify ghosts only consult the AI at junctions"""
+    monkeypatch.setattr(config, "GHOST_JUNCTION_DECISIONS", True)
+    mock_get_dir = MagicMock(return_value=(1, 0))
+    monkeypatch.setattr("pacman_game.ghosts.get_next_direction", mock_get_dir)
+    player = MagicMock(x=45, y=45, direction=(0, 0))
+    
+    # Start at the junction (3, 3) heading right into the ring
+    g = Ghost(config.TILE_SIZE * 3, config.TILE_SIZE * 3, config.RED, "BLINKY", speed=2)
+    for _ in range(60):
+        g.update(ring_level, player, None)
+    
+    # Ran right then turned up the corner at (5, 3) without new decisions
+    assert mock_get_dir.call_count == 1
+    assert g.direction == (0, -1) or g.direction == (-1, 0)
+    # Always centered on the axis it is not moving along
+    assert (g.x - config.TILE_SIZE / 2) % config.TILE_SIZE == 0 or (g.y - config.TILE_SIZE / 2) % config.TILE_SIZE == 0
+
+@given(
+    sx=st.integers(min_value=0, max_value=9),
+    sy=st.integers(min_value=0, max_value=9),
+    gx=st.integers(min_value=0, max_value=9),
+    gy=st.integers(min_value=0, max_value=9),
+    grid_rows=st.lists(
+        st.lists(st.integers(min_value=0, max_value=1), min_size=10, max_size=10),
+        min_size=10, max_size=10
+    )
+)
+def test_junction_graph_matches_a_star_fuzz(sx, sy, gx, gy, grid_rows):
+    """Property check: The graph's first step lies on a shortest path"""
+    lvl = Level()
+    lvl.grid = grid_rows
+    start, goal = (sx, sy), (gx, gy)
+    
+    direction = JunctionGraph(lvl).get_next_direction(start, goal)
+    path = a_star(start, goal, lvl, max_expansions=1000)
+    
+    if path is None or len(path) == 1:
+        assert direction == (0, 0)
+    else:
+        rest = a_star((sx + direction[0], sy + direction[1]), goal, lvl, max_expansions=1000)
+        assert rest is not None
+        assert len(rest) == len(path) - 1
@@ -0,0 +1,88 @@
+import pytest
+from hypothesis import given, strategies as st
+from pacman_game import config
+from pacman_game.ai.pathfinding import a_star, get_next_direction
+from pacman_game.ai.next_hop import get_next_hop_table, _tables
+from pacman_game.level import Level
+from pacman_game.simulation import Simulation
+
+def test_next_hop_basic(simple_grid_level):
+    """Test the table steps straight along an open row"""
+    table = get_next_hop_table(simple_grid_level)
+    assert table.get_direction((1, 1), (3, 1)) == (1, 0)
+    assert table.get_direction((3, 1), (1, 1)) == (-1, 0)
+    assert table.get_direction((1, 1), (1, 4)) == (0, 1)
+
+def test_next_hop_start_is_goal(simple_grid_level):
+    """Edge Case: Start equals Goal should not move"""
+    table = get_next_hop_table(simple_grid_level)
+    assert table.get_direction((2, 2), (2, 2)) == (0, 0)
+
+def test_next_hop_walls_and_out_of_bounds(simple_grid_level):
+    """Edge Case: Walls and out of bounds tiles have no next hop"""
+    table = get_next_hop_table(simple_grid_level)
+    assert table.get_direction((1, 1), (0, 0)) == (0, 0)
+    assert table.get_direction((1, 1), (-5, -5)) == (0, 0)
+    assert table.get_direction((50, 50), (1, 1)) == (0, 0)
+
+def test_next_hop_table_is_cached(level):
+    """Verify the table is compiled once per level revision"""
+    assert get_next_hop_table(level) is get_next_hop_table(level)
+
+def test_next_hop_table_built_with_simulation(level, monkeypatch):
+    """Verify the table is compiled before play, not on the first replan"""
+    monkeypatch.setattr(config, "PATHFINDING_STRATEGY", "next_hop")
+    assert level not in _tables
+    Simulation(level)
+    assert _tables[level][0] == level.revision
+
+def test_next_hop_invalidation(simple_grid_level):
+    """Verify editing the grid and invalidating rebuilds the table"""
+    table = get_next_hop_table(simple_grid_level)
+    assert table.get_direction((1, 1), (5, 5)) != (0, 0)
+
+    # Enclose (5, 5) with walls
+    simple_grid_level.grid[4][5] = 1
+    simple_grid_level.grid[6][5] = 1
+    simple_grid_level.grid[5][4] = 1
+    simple_grid_level.grid[5][6] = 1
+    simple_grid_level.invalidate()
+
+    rebuilt = get_next_hop_table(simple_grid_level)
+    assert rebuilt is not table
+    assert rebuilt.get_direction((1, 1), (5, 5)) == (0, 0)
+
+def test_next_hop_size_limit(simple_grid_level, monkeypatch):
+    """Edge Case: Levels above the tile limit fall back to A*"""
+    monkeypatch.setattr(config, "NEXT_HOP_MAX_TILES", 10)
+    simple_grid_level.invalidate()
+    assert get_next_hop_table(simple_grid_level) is None
+    assert get_next_direction((1, 1), (3, 1), simple_grid_level) == (1, 0)
+
+@given(
+    sx=st.integers(min_value=0, max_value=9),
+    sy=st.integers(min_value=0, max_value=9),
+    gx=st.integers(min_value=0, max_value=9),
+    gy=st.integers(min_value=0, max_value=9),
+    grid_rows=st.lists(
+        st.lists(st.integers(min_value=0, max_value=1), min_size=10, max_size=10),
+        min_size=10, max_size=10
+    )
+)
+def test_next_hop_matches_a_star_fuzz(sx, sy, gx, gy, grid_rows):
+    """Property check: The next hop is the first step of some shortest path"""
+    lvl = Level()
+    lvl.grid = grid_rows
+    start = (sx, sy)
+    goal = (gx, gy)
+
+    direction = get_next_hop_table(lvl).get_direction(start, goal)
+    path = a_star(start, goal, lvl)
+
+    if path is None or len(path) == 1:
+        assert direction == (0, 0)
+    else:
+        next_pos = (start[0] + direction[0], start[1] + direction[1])
+        rest = a_star(next_pos, goal, lvl)
+        assert rest is not None
+        assert len(rest) == len(path) - 1
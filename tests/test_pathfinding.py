@@ -1,7 +1,8 @@
 import pytest
 from hypothesis import given, strategies as st
 from pacman_game import config
-from pacman_game.ai.pathfinding import a_star, get_next_direction, get_neighbors
+from pacman_game.ai import pathfinding
+from pacman_game.ai.pathfinding import a_star, get_next_direction, get_neighbors, PathCache
 from pacman_game.level import Level
 
 def test_a_star_path_found_basic(simple_grid_level):
@@ -89,3 +90,77 @@ def test_get_neighbors_validity(simple_grid_level):
         assert simple_grid_level.is_wall(n[0], n[1]) is False
         # Manhatten dist is 1
         assert abs(n[0] - 1) + abs(n[1] - 1) == 1
+
+def test_a_star_path_is_shortest(simple_grid_level):
+    """Verify A* returns a Manhattan-length path in an open room"""
+    path = a_star((1, 1), (8, 8), simple_grid_level)
+    assert path[0] == (1, 1)
+    assert path[-1] == (8, 8)
+    assert len(path) == 15
+
+def test_a_star_expansion_budget(simple_grid_level):
+    """Edge Case: Running out of expansions returns None unless partial"""
+    start = (1, 1)
+    goal = (8, 8)
+    assert a_star(start, goal, simple_grid_level, max_expansions=3) is None
+    
+    path = a_star(start, goal, simple_grid_level, max_expansions=3, partial=True)
+    assert path[0] == start
+    assert len(path) > 1
+    # Partial path still heads towards the goal
+    assert abs(path[-1][0] - 8) + abs(path[-1][1] - 8) < 14
+
+def test_get_next_direction_with_budget(simple_grid_level, monkeypatch):
+    """Verify a tight budget still yields a useful first step"""
+    monkeypatch.setattr(config, "PATHFINDING_STRATEGY", "a_star")
+    monkeypatch.setattr(config, "PATHFINDING_MAX_EXPANSIONS", 2)
+    assert get_next_direction((1, 1), (8, 1), simple_grid_level) == (1, 0)
+
+def test_path_cache_lru_eviction():
+    """Verify the cache evicts the least recently used path"""
+    cache = PathCache(2)
+    cache.put((1, 1), (2, 2), 1, [(1, 1), (2, 1), (2, 2)])
+    cache.put((1, 1), (3, 3), 1, None)
+    
+    # Touch the first entry so the second becomes least recently used
+    assert cache.get((1, 1), (2, 2), 1) == ((1, 1), (2, 1), (2, 2))
+    cache.put((4, 4), (5, 5), 1, [(4, 4)])
+    
+    assert cache.get((1, 1), (3, 3), 1) is PathCache.MISS
+    assert cache.get((4, 4), (5, 5), 1) == ((4, 4),)
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 1, 1)
+
+def test_path_cache_follows_config_size(monkeypatch):
+    """Edge Case: A cache without a fixed size tracks PATH_CACHE_SIZE at runtime"""
+    monkeypatch.setattr(config, "PATH_CACHE_SIZE", 3)
+    cache = PathCache()
+    for goal in range(5):
+        cache.put((1, 1), (goal, 0), 1, None)
+    assert len(cache) == 3
+    monkeypatch.setattr(config, "PATH_CACHE_SIZE", 1)
+    cache.put((1, 1), (9, 9), 1, None)
+    assert len(cache) == 1 and cache.evictions == 5
+
+def test_path_cache_caches_no_path():
+    """Edge Case: A cached 'no path' result is a hit, not a miss"""
+    cache = PathCache(4)
+    cache.put((1, 1), (5, 5), 1, None)
+    assert cache.get((1, 1), (5, 5), 1) is None
+    assert cache.hits == 1
+
+def test_get_next_direction_uses_path_cache(simple_grid_level, monkeypatch):
+    """Verify repeated queries are served from the cache until the level changes"""
+    cache = PathCache(8)
+    monkeypatch.setattr(config, "PATHFINDING_STRATEGY", "a_star")
+    monkeypatch.setattr(pathfinding, "path_cache", cache)
+    
+    assert get_next_direction((1, 1), (8, 1), simple_grid_level) == (1, 0)
+    assert get_next_direction((1, 1), (8, 1), simple_grid_level) == (1, 0)
+    assert (cache.hits, cache.misses) == (1, 1)
+    
+    # Wall off the row; the revision changes so the old path is not reused
+    simple_grid_level.grid[1][2] = 1
+    simple_grid_level.invalidate()
+    assert get_next_direction((1, 1), (8, 1), simple_grid_level) == (0, 1)
+    assert cache.misses == 2
@@ -8,6 +8,7 @@ def mock_level():
     level = MagicMock()
     # Default to allowing movement
     level.can_move_to.return_value = True
+    level.has_exit.return_value = True
     return level
 
 @pytest.fixture
@@ -81,8 +82,9 @@ def test_update_blocks_turn_if_wall(mock_level, mock_input_handler):
     p.desired_direction = (0, 1)
     p.direction = (1, 0)
     
-    mock_level.can_move_to.side_effect = [False, True] 
-    # First call is for turning (new_x/y with desired). Return False (Wall).
+    mock_level.has_exit.side_effect = [False, True]
+    # At the tile center both checks read the exit mask.
+    # First call is for turning (desired direction). Return False (Wall).
     # Second call is for continuing current direction. Return True (Continue).
     
     p.update(mock_level, mock_input_handler)
@@ -103,6 +105,7 @@ def test_wall_slide_alignment(mock_level, mock_input_handler):
     
     # Wall ahead
     mock_level.can_move_to.return_value = False
+    mock_level.has_exit.return_value = False
     
     # Update
     p.update(mock_level, mock_input_handler)
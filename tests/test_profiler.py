@@ -0,0 +1,88 @@
+import csv
+import pytest
+from pacman_game.profiler import FrameProfiler, NULL_PROFILER, PHASES, GROUPS
+from pacman_game.simulation import Simulation
+
+def test_lap_charges_phase():
+    """Verify lap adds elapsed time to its phase and returns the new start"""
+    profiler = FrameProfiler(capacity=4)
+    start = profiler.mark()
+    now = profiler.lap('player', start)
+    assert now >= start
+    profiler.add('player', 1000)
+    profiler.end_frame()
+
+    (frame,) = profiler.frames()
+    assert frame[PHASES.index('player')] == now - start + 1000
+    assert sum(frame) == frame[PHASES.index('player')]
+
+def test_ring_buffer_keeps_last_frames():
+    """Verify only the last capacity frames are kept, oldest first"""
+    profiler = FrameProfiler(capacity=3)
+    for value in range(1, 6):
+        profiler.add('events', value)
+        profiler.end_frame()
+
+    frames = profiler.frames()
+    assert [frame[0] for frame in frames] == [3, 4, 5]
+    # The frame in progress does not overwrite a stored one
+    profiler.add('events', 100)
+    assert [frame[0] for frame in profiler.frames()] == [3, 4, 5]
+
+def test_percentiles():
+    """Verify nearest-rank frame time percentiles in milliseconds"""
+    profiler = FrameProfiler(capacity=100)
+    assert profiler.percentile(50) == 0.0
+    for ms in range(1, 101):
+        profiler.add('draw_playfield', ms * 1_000_000)
+        profiler.end_frame()
+    assert profiler.percentile(50) == 50.0
+    assert profiler.percentile(99) == 99.0
+    assert profiler.percentile(100) == 100.0
+
+def test_group_totals():
+    """Verify phases are summed into events/update/draw groups"""
+    profiler = FrameProfiler(capacity=2)
+    profiler.add('events', 1)
+    profiler.add('player', 2)
+    profiler.add('blinky_ai', 3)
+    profiler.add('present', 4)
+    profiler.end_frame()
+    totals = profiler.group_totals(profiler.frames()[0])
+    assert totals == {'events': 1, 'update': 5, 'draw': 4}
+    assert tuple(totals) == GROUPS
+
+def test_dump_csv(tmp_path):
+    """Verify the dump has a header and one row per stored frame"""
+    profiler = FrameProfiler(capacity=2)
+    for _ in range(3):
+        profiler.add('draw_hud', 7)
+        profiler.end_frame()
+    path = profiler.dump(str(tmp_path / "profile.csv"))
+
+    with open(path, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['frame', *PHASES]
+    assert [row[0] for row in rows[1:]] == ['1', '2']
+    assert rows[1][1 + PHASES.index('draw_hud')] == '7'
+
+def test_simulation_phases_recorded():
+    """Verify a simulation step charges player, pellet and ghost phases"""
+    sim = Simulation()
+    sim.profiler = FrameProfiler(capacity=8)
+    for _ in range(20):
+        sim.step((1, 0))
+        sim.profiler.end_frame()
+
+    frames = sim.profiler.frames()
+    total = [sum(column) for column in zip(*frames)]
+    for phase in ('player', 'pellets', 'blinky_move', 'collisions'):
+        assert total[PHASES.index(phase)] > 0
+    assert all(value >= 0 for value in total)
+
+def test_null_profiler_records_nothing():
+    """Edge Case: The default profiler is a no-op"""
+    sim = Simulation()
+    assert sim.profiler is NULL_PROFILER
+    sim.step((1, 0))
+    assert NULL_PROFILER.lap('player', NULL_PROFILER.mark()) == 0
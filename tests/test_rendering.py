@@ -0,0 +1,145 @@
+import pytest
+from unittest.mock import MagicMock
+from pacman_game import config
+from pacman_game.level import Level, PelletManager
+from pacman_game.rendering import PlayfieldRenderer, DirtyRectTracker, SpriteAtlas, entity_rect
+from pacman_game.ghosts import Ghost
+from pacman_game.player import Player
+
+@pytest.fixture
+def playfield():
+    return PlayfieldRenderer(Level(), PelletManager())
+
+def test_layers_baked_once(playfield, mock_pygame):
+    """Verify walls and pellets are drawn once, then only blitted"""
+    screen = MagicMock()
+    playfield.draw(screen)
+    assert playfield.bakes == 1
+
+    mock_pygame.draw.reset_mock()
+    for _ in range(5):
+        playfield.draw(screen)
+    assert playfield.bakes == 1
+    assert mock_pygame.draw.rect.call_count == 0
+    assert mock_pygame.draw.circle.call_count == 0
+    assert screen.blit.call_count == 6
+
+def test_collect_erases_single_tile(playfield):
+    """Verify collecting a pellet erases its tile without a rebake"""
+    playfield.draw(MagicMock())
+    playfield.pellets.fill.reset_mock()
+
+    points = playfield.pellet_manager.collect_pellet(45, 45)
+    assert points == config.POINTS_PER_PELLET
+
+    tile = config.TILE_SIZE
+    # Layers are mocks here, so only check that the tile (and nothing else) was cleared
+    for call in playfield.pellets.fill.call_args_list:
+        assert call.args == (config.BLACK, (tile, tile, tile, tile))
+    assert playfield.pellets.fill.called
+    playfield.draw(MagicMock())
+    assert playfield.bakes == 1
+
+def test_reset_and_level_change_rebake(playfield):
+    """Verify pellet resets and level edits rebuild the layers"""
+    playfield.draw(MagicMock())
+
+    playfield.pellet_manager.reset()
+    playfield.draw(MagicMock())
+    assert playfield.bakes == 2
+
+    playfield.level.invalidate()
+    playfield.draw(MagicMock())
+    assert playfield.bakes == 3
+
+def test_collect_before_first_draw(playfield):
+    """Edge Case: Collecting before any layer exists defers to the first bake"""
+    playfield.pellet_manager.collect_pellet(45, 45)
+    playfield.draw(MagicMock())
+    assert playfield.bakes == 1
+
+def test_pop_erased_reports_collected_tiles(playfield):
+    """Verify erased pellet tiles are reported once for dirty-rect updates"""
+    playfield.draw(MagicMock())
+    playfield.pellet_manager.collect_pellet(45, 45)
+    tile = config.TILE_SIZE
+    assert playfield.pop_erased() == [(tile, tile, tile, tile)]
+    assert playfield.pop_erased() == []
+
+def test_dirty_tracker_full_then_partial(mock_pygame):
+    """Verify the first frame flips and later frames push only changed rects"""
+    tracker = DirtyRectTracker()
+    mock_pygame.display.reset_mock()
+    tracker.track('score', (10, 10, 80, 20), "Score: 0")
+    tracker.present()
+    mock_pygame.display.flip.assert_called_once()
+
+    # Unchanged field: nothing to push
+    tracker.track('score', (10, 10, 80, 20), "Score: 0")
+    tracker.present()
+    mock_pygame.display.update.assert_not_called()
+
+    # Changed text in the same place
+    tracker.track('score', (10, 10, 80, 20), "Score: 10")
+    tracker.present()
+    mock_pygame.display.update.assert_called_once_with([(10, 10, 80, 20), (10, 10, 80, 20)])
+
+def test_dirty_tracker_moving_entity(mock_pygame):
+    """Verify a moving entity dirties both its old and new bounding boxes"""
+    tracker = DirtyRectTracker()
+    player = Player(config.TILE_SIZE, config.TILE_SIZE)
+    tracker.track('player', entity_rect(player))
+    tracker.present()
+
+    old = entity_rect(player)
+    player.x += 2
+    tracker.track('player', entity_rect(player))
+    assert tracker.rects == [old, entity_rect(player)]
+
+    tracker.request_full()
+    mock_pygame.display.reset_mock()
+    tracker.present()
+    mock_pygame.display.flip.assert_called_once()
+    mock_pygame.display.update.assert_not_called()
+
+def test_entity_rect_covers_circle():
+    """Verify the entity rect contains the whole drawn circle"""
+    player = Player(config.TILE_SIZE, config.TILE_SIZE)
+    x, y, w, h = entity_rect(player)
+    assert x <= int(player.x) - player.radius
+    assert y <= int(player.y) - player.radius
+    assert x + w > int(player.x) + player.radius
+    assert y + h > int(player.y) + player.radius
+
+def test_sprite_atlas_one_build_per_appearance(ghosts, player):
+    """Verify sprites are rasterised once per distinct appearance"""
+    atlas = SpriteAtlas()
+    atlas.preload([player, *ghosts])
+    assert atlas.builds == 5
+
+    # Same color and type share a sprite
+    twin = Ghost(config.TILE_SIZE, config.TILE_SIZE, ghosts[0].color, "BLINKY")
+    atlas.get(twin)
+    assert atlas.builds == 5
+    assert len(atlas) == 5
+
+def test_sprite_atlas_draw_is_single_blit(ghosts, mock_pygame):
+    """Verify drawing from the atlas is one blit and no shape drawing"""
+    atlas = SpriteAtlas()
+    ghost = ghosts[1]
+    atlas.preload([ghost])
+
+    screen = MagicMock()
+    mock_pygame.draw.reset_mock()
+    atlas.draw(screen, ghost)
+    assert screen.blit.call_count == 1
+    assert mock_pygame.draw.circle.call_count == 0
+
+    surface, offset = atlas.get(ghost)
+    screen.blit.assert_called_once_with(surface, (int(ghost.x) - offset, int(ghost.y) - offset))
+
+def test_vector_draw_path(ghosts, mock_pygame):
+    """Verify the vector path still draws the ghost body and eyes in place"""
+    mock_pygame.draw.reset_mock()
+    ghosts[1].draw(MagicMock())
+    assert mock_pygame.draw.circle.call_count == 5
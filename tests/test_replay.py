@@ -0,0 +1,123 @@
+import random
+import pytest
+from hypothesis import given, strategies as st
+from pacman_game import config
+from pacman_game.farm import make_policy
+from pacman_game.game import Game
+from pacman_game.main import load_replay, parse_args
+from pacman_game.replay import (Replay, ReplayError, ReplayPlayer, ReplayRecorder, HEADER,
+                                config_hash, play_headless)
+from pacman_game.simulation import Simulation
+
+events = st.lists(st.tuples(st.integers(0, 5000), st.sampled_from(['restart', 'debug_toggle', 'quit'])))
+
+
+def record_run(frames, seed=3):
+    """Drive a Simulation with the random policy, recording its inputs"""
+    sim = Simulation()
+    recorder = ReplayRecorder(seed)
+    choose = make_policy('random', seed)
+    for _ in range(frames):
+        direction = choose(sim)
+        recorder.record_step(direction)
+        sim.step(direction)
+    return sim, recorder.replay
+
+@given(st.binary(max_size=300).map(lambda b: bytearray(c % 5 for c in b)), events,
+       st.integers(0, 2**64 - 1))
+def test_round_trip(directions, event_list, seed):
+    """Verify replays survive encoding unchanged"""
+    event_list = sorted(event_list)
+    replay = Replay(seed, directions=directions, events=event_list)
+    decoded = Replay.from_bytes(replay.to_bytes())
+    assert decoded.seed == seed
+    assert decoded.config_digest == config_hash()
+    assert decoded.directions == directions
+    assert decoded.events == event_list
+
+def test_held_directions_are_compact():
+    """Verify run-length encoding stores a long held direction in a few bytes"""
+    replay = Replay(directions=bytearray([2] * 100000 + [4] * 5))
+    assert replay.runs() == [(2, 100000), (4, 5)]
+    assert len(replay.to_bytes()) <= HEADER.size + 6
+
+@pytest.mark.parametrize("data", [b"", b"NOPE" + bytes(HEADER.size), Replay(directions=bytearray(3)).to_bytes()[:-1]])
+def test_rejects_malformed_data(data):
+    """Edge Case: Short, foreign or truncated data is an error"""
+    with pytest.raises(ReplayError):
+        Replay.from_bytes(data)
+
+def test_player_orders_events_before_steps():
+    """Verify events recorded before a step are delivered before it"""
+    replay = Replay(directions=bytearray([1, 2, 3]), events=[(0, 'debug_toggle'), (2, 'restart')])
+    player = ReplayPlayer(replay)
+    assert player.pending_events() == ['debug_toggle']
+    assert player.next_direction() == (-1, 0)
+    assert player.pending_events() == []
+    player.next_direction()
+    assert player.pending_events() == ['restart']
+    assert player.next_direction() == (0, -1)
+    assert player.finished
+
+def test_recording_leaves_global_random_alone():
+    """Edge Case: Recording and playback only store the seed, never reseed random"""
+    state = random.getstate()
+    recorder = ReplayRecorder(seed=42)
+    ReplayPlayer(recorder.replay)
+    assert random.getstate() == state
+    assert recorder.replay.seed == 42
+
+def test_headless_playback_reproduces_run(tmp_path):
+    """Verify playing a saved recording ends in the recorded state"""
+    recorded, replay = record_run(1500)
+    path = tmp_path / "run.pmr"
+    replay.save(path)
+    played = play_headless(Replay.load(path))
+    assert played.frame == recorded.frame
+    assert played.score == recorded.score
+    assert (played.player.x, played.player.y) == (recorded.player.x, recorded.player.y)
+    assert [(g.x, g.y, g.behavior) for g in played.ghosts] == [(g.x, g.y, g.behavior) for g in recorded.ghosts]
+    assert played.pellet_manager.pellet_grid == recorded.pellet_manager.pellet_grid
+
+def test_playback_applies_restart():
+    """Verify a recorded restart resets the simulation mid-replay"""
+    replay = Replay(directions=bytearray([2] * 20), events=[(10, 'restart')])
+    sim = play_headless(replay)
+    assert sim.frame == 10
+
+def test_config_mismatch_warns(tmp_path, monkeypatch):
+    """Edge Case: A replay recorded under other settings is flagged on load"""
+    path = tmp_path / "run.pmr"
+    Replay(directions=bytearray([1])).save(path)
+    monkeypatch.setattr(config, 'PLAYER_SPEED', config.PLAYER_SPEED + 1)
+    with pytest.warns(UserWarning):
+        load_replay(path)
+
+def test_game_records_and_replays(tmp_path, monkeypatch):
+    """Verify a windowed Game records its inputs and plays them back"""
+    monkeypatch.chdir(tmp_path)
+    game = Game(record_path=tmp_path / "game.pmr", seed=7)
+    for direction in [(1, 0)] * 30 + [(0, 1)] * 30:
+        game.direction_input = direction
+        game.update()
+    game.recorder.record_event('quit')
+    game.recorder.save(game.record_path)
+
+    replay = Replay.load(tmp_path / "game.pmr")
+    assert replay.seed == 7
+    assert replay.runs() == [(2, 30), (4, 30)]
+    assert replay.events == [(60, 'quit')]
+
+    playback = Game(replay=replay)
+    while playback.running:
+        playback.update()
+    assert playback.simulation.frame == 60
+    assert (playback.simulation.player.x, playback.simulation.player.y) == \
+        (game.simulation.player.x, game.simulation.player.y)
+
+def test_replay_cli_flags():
+    """Verify the command line record/replay options"""
+    args = parse_args(["--record", "a.pmr", "--seed", "4"])
+    assert (args.record, args.seed, args.replay, args.headless) == ("a.pmr", 4, None, False)
+    args = parse_args(["--replay", "a.pmr", "--headless"])
+    assert (args.replay, args.headless) == ("a.pmr", True)
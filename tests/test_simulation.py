@@ -0,0 +1,146 @@
+import subprocess
+import sys
+import pytest
+from pacman_game.simulation import Simulation
+from pacman_game.state_machine import GameState
+from pacman_game.ai.ghost_behaviors import GhostBehavior
+from pacman_game import config
+
+def test_simulation_init():
+    """Verify simulation owns a fresh game with staggered ghosts"""
+    sim = Simulation()
+    assert sim.score == 0
+    assert sim.frame == 0
+    assert sim.state_machine.get_state() == GameState.PLAYING
+    assert len(sim.ghosts) == 4
+    assert sim.ghosts[0].behavior == GhostBehavior.SCATTER
+    assert all(g.behavior == GhostBehavior.IDLE for g in sim.ghosts[1:])
+
+def test_step_moves_player_and_collects_pellets():
+    """Verify a step applies input, moves the player and scores pellets"""
+    sim = Simulation()
+    start_x = sim.player.x
+
+    for _ in range(30):
+        sim.step((1, 0))
+
+    assert sim.frame == 30
+    assert sim.player.x > start_x
+    assert sim.score > 0
+    assert sim.score == (sim.pellet_manager.total_pellets - sim.pellet_manager.pellets_remaining()) * config.POINTS_PER_PELLET
+
+def test_ghost_release_is_frame_based():
+    """Verify idle ghosts are released on the configured frame schedule"""
+    sim = Simulation()
+    pinky = sim.ghosts[1]
+
+    for _ in range(config.GHOST_RELEASE_FRAMES[1] - 1):
+        sim.step()
+    assert pinky.behavior == GhostBehavior.IDLE
+
+    sim.step()
+    assert pinky.behavior != GhostBehavior.IDLE
+
+def test_game_over_callback():
+    """Edge Case: Losing the last life reports the final score once"""
+    sim = Simulation()
+    reported = []
+    sim.on_game_over = reported.append
+    sim.state_machine.lives = 1
+
+    # Put BLINKY on top of the player
+    sim.ghosts[0].x = sim.player.x
+    sim.ghosts[0].y = sim.player.y
+    sim.step()
+    sim.step()
+
+    assert sim.state_machine.is_game_over()
+    assert reported == [sim.score]
+
+def test_reset_restores_initial_state():
+    """Verify reset clears score, frame count and state"""
+    sim = Simulation()
+    for _ in range(10):
+        sim.step((1, 0))
+    sim.state_machine.current_state = GameState.GAME_OVER
+
+    sim.reset()
+
+    assert sim.score == 0
+    assert sim.frame == 0
+    assert sim.state_machine.is_playing()
+    assert sim.pellet_manager.pellets_remaining() == sim.pellet_manager.total_pellets
+
+def test_ghost_mode_switch_is_scheduled():
+    """Verify scatter/chase switches come from the timer wheel, not per-ghost counters"""
+    sim = Simulation()
+    blinky = sim.ghosts[0]
+    assert not blinky.owns_mode_timer
+
+    for _ in range(config.SCATTER_DURATION - 1):
+        sim.step()
+    assert blinky.behavior == GhostBehavior.SCATTER
+
+    sim.step()
+    assert blinky.behavior == GhostBehavior.CHASE
+    assert blinky.behavior_timer == 0
+
+def test_mode_durations_read_at_start(monkeypatch):
+    """Edge Case: Changing SCATTER_DURATION after import changes the schedule"""
+    monkeypatch.setattr(config, "SCATTER_DURATION", 10)
+    sim = Simulation()
+    for _ in range(10):
+        sim.step()
+    assert sim.ghosts[0].behavior == GhostBehavior.CHASE
+
+def test_released_ghosts_share_the_global_phase():
+    """Verify ghosts released mid-phase switch on the same frame as BLINKY"""
+    sim = Simulation()
+    for _ in range(config.SCATTER_DURATION):
+        sim.step()
+
+    active = [g for g in sim.ghosts if g.behavior != GhostBehavior.IDLE]
+    assert len(active) == 2
+    assert all(g.behavior == GhostBehavior.CHASE for g in active)
+    assert sim.modes.phase == GhostBehavior.CHASE
+
+def test_life_lost_transition_is_scheduled():
+    """Verify the respawn delay is a timer event counted in simulation steps"""
+    sim = Simulation()
+    sim.ghosts[0].x = sim.player.x
+    sim.ghosts[0].y = sim.player.y
+    sim.step()
+    assert sim.state_machine.get_state() == GameState.LIFE_LOST
+
+    for _ in range(config.LEVEL_COMPLETE_DELAY - 1):
+        sim.step()
+    assert sim.state_machine.get_state() == GameState.LIFE_LOST
+
+    sim.step()
+    assert sim.state_machine.is_playing()
+    # Respawned, with the idle ghosts' release rescheduled
+    assert sim.ghosts[0].x != sim.player.x
+    assert sim.ghosts[1].behavior == GhostBehavior.IDLE
+    assert len(sim.timers) == 4
+
+def test_reset_cancels_pending_timers():
+    """Edge Case: Reset drops a pending transition and reschedules the ghosts"""
+    sim = Simulation()
+    sim.ghosts[0].x = sim.player.x
+    sim.ghosts[0].y = sim.player.y
+    sim.step()
+
+    sim.reset()
+
+    assert sim.state_machine.pending_action is None
+    assert sim.timers.frame == 0
+    assert len(sim.timers) == 4
+
+def test_simulation_runs_without_pygame():
+    """Edge Case: The headless core imports and steps with pygame unavailable"""
+    code = ("import sys; sys.modules['pygame'] = None\n"
+            "from pacman_game.simulation import Simulation\n"
+            "sim = Simulation()\n"
+            "for _ in range(60): sim.step((1, 0))\n"
+            "assert 'pygame' not in sys.modules or sys.modules['pygame'] is None")
+    subprocess.run([sys.executable, "-c", code], check=True)
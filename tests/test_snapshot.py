@@ -0,0 +1,135 @@
+import random
+import pytest
+from pacman_game import config
+from pacman_game.ai.ghost_behaviors import GhostBehavior
+from pacman_game.digest import StateDigest
+from pacman_game.level import PelletManager
+from pacman_game.simulation import Simulation
+from pacman_game.state_machine import GameState
+from pacman_game.timers import TimerWheel
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+
+def random_inputs(seed, frames):
+    rng = random.Random(seed)
+    return [rng.choice(DIRECTIONS) for _ in range(frames)]
+
+def run_digests(sim, inputs):
+    digest = StateDigest()
+    digests = []
+    for direction in inputs:
+        sim.step(direction)
+        digests.append(digest(sim))
+    return digests
+
+def test_restore_replays_identically():
+    """Verify play continues identically from a restored snapshot"""
+    sim = Simulation()
+    run_digests(sim, random_inputs(1, 200))
+    snapshot = sim.snapshot()
+    inputs = random_inputs(2, 1200)
+    expected = run_digests(sim, inputs)
+
+    sim.restore(snapshot)
+    assert sim.snapshot() == snapshot
+    assert run_digests(sim, inputs) == expected
+
+def test_restore_keeps_entities_in_place():
+    """Verify restoring writes into the existing player, ghosts and pellet grid"""
+    sim = Simulation()
+    snapshot = sim.snapshot()
+    player, ghosts, grid = sim.player, list(sim.ghosts), sim.pellet_manager.pellet_grid
+    for _ in range(100):
+        sim.step((1, 0))
+    assert sim.pellet_manager.pellets_remaining() < sim.pellet_manager.total_pellets
+
+    sim.restore(snapshot)
+    assert sim.player is player
+    assert sim.ghosts == ghosts and all(a is b for a, b in zip(sim.ghosts, ghosts))
+    assert sim.pellet_manager.pellet_grid is grid
+    assert grid == PelletManager().pellet_grid
+    assert sim.pellet_manager.pellets_remaining() == sim.pellet_manager.total_pellets
+    assert (sim.frame, sim.score) == (0, 0)
+
+def test_restore_reschedules_pending_events():
+    """Verify ghost releases and phase changes still fire on their frames after a restore"""
+    sim = Simulation()
+    snapshot = sim.snapshot()
+    pending = len(sim.timers)
+    for _ in range(config.GHOST_RELEASE_FRAMES[1] + 5):
+        sim.step((0, 0))
+    assert sim.ghosts[1].behavior != GhostBehavior.IDLE
+
+    sim.restore(snapshot)
+    assert len(sim.timers) == pending
+    assert sim.ghosts[1].behavior == GhostBehavior.IDLE
+    for _ in range(config.GHOST_RELEASE_FRAMES[1]):
+        sim.step((0, 0))
+    assert sim.ghosts[1].behavior == sim.modes.phase
+
+def test_restore_across_life_lost():
+    """Edge Case: Restoring mid-transition brings back the pending respawn"""
+    sim = Simulation()
+    sim.step((1, 0))
+    sim.state_machine.check_life_lost(True)
+    snapshot = sim.snapshot()
+    inputs = [(1, 0)] * (config.LEVEL_COMPLETE_DELAY + 60)
+    expected = run_digests(sim, inputs)
+    assert sim.state_machine.is_playing()
+
+    sim.restore(snapshot)
+    assert sim.state_machine.get_state() == GameState.LIFE_LOST
+    assert sim.state_machine.lives == 2
+    assert run_digests(sim, inputs) == expected
+
+def test_snapshot_is_immutable():
+    """Edge Case: Snapshots cannot be modified"""
+    snapshot = Simulation().snapshot()
+    with pytest.raises(AttributeError):
+        snapshot.pellets = 0
+    assert snapshot.frame == 0
+    assert snapshot.size < 512
+
+def test_restore_rejects_other_ghost_count():
+    """Edge Case: A snapshot only fits a simulation with the same number of ghosts"""
+    sim = Simulation()
+    snapshot = sim.snapshot()
+    sim.ghosts = sim.ghosts[:2]
+    with pytest.raises(ValueError):
+        sim.restore(snapshot)
+
+def test_pellet_mask_round_trip():
+    """Verify the pellet bitmask restores the grid in place"""
+    pellets = PelletManager()
+    full = pellets.pellet_mask()
+    assert full.bit_count() == pellets.total_pellets
+
+    size = config.TILE_SIZE
+    pellets.collect_pellet(size * 1.5, size * 1.5)
+    pellets.collect_pellet(size * 2.5, size * 1.5)
+    partial = pellets.pellet_mask()
+    assert partial.bit_count() == pellets.total_pellets - 2
+    grid = pellets.pellet_grid
+
+    revision = pellets.revision
+    pellets.restore_mask(full)
+    assert pellets.pellet_grid is grid
+    assert grid == PelletManager().pellet_grid
+    assert pellets.collected_count == 0
+    assert pellets.revision > revision
+    pellets.restore_mask(partial)
+    assert pellets.pellets_remaining() == pellets.total_pellets - 2
+    assert grid[1][1] == grid[1][2] == 0
+
+def test_timer_wheel_clear_to_frame():
+    """Verify clearing to a frame keeps delays relative to it"""
+    wheel = TimerWheel(slots=8)
+    old = wheel.schedule(3, lambda: None)
+    fired = []
+    wheel.clear(100)
+    assert not old.active and len(wheel) == 0
+    wheel.schedule(2, fired.append, 'x')
+    wheel.advance()
+    wheel.advance()
+    assert fired == ['x'] and wheel.frame == 102
@@ -78,3 +78,22 @@ def test_transition_timer_robustness(timer_val):
         assert action == 'reload_level'
     else:
         assert action is None
+
+def test_transition_scheduled_on_timer_wheel():
+    """Verify a state machine with a timer wheel finishes transitions via events"""
+    from pacman_game.timers import TimerWheel
+    from pacman_game import config
+    timers = TimerWheel()
+    sm = GameStateMachine(timers)
+    sm.check_level_complete(0)
+
+    for _ in range(config.LEVEL_COMPLETE_DELAY - 1):
+        timers.advance()
+        assert sm.update_transition() is None
+    assert sm.current_state == GameState.LEVEL_COMPLETE
+
+    timers.advance()
+    assert sm.update_transition() == 'reload_level'
+    assert sm.update_transition() is None
+    assert sm.current_state == GameState.PLAYING
+    assert sm.level_number == 2
@@ -0,0 +1,89 @@
+import pytest
+from hypothesis import given, strategies as st
+from pacman_game.timers import TimerWheel
+
+
+def test_timer_fires_after_delay():
+    """Verify a timer fires on exactly the frame it was scheduled for"""
+    wheel = TimerWheel(slots=8)
+    fired = []
+    wheel.schedule(3, fired.append, 'a')
+
+    wheel.advance()
+    wheel.advance()
+    assert fired == []
+    assert len(wheel) == 1
+
+    assert wheel.advance() == 1
+    assert fired == ['a']
+    assert len(wheel) == 0
+
+def test_same_frame_fires_in_schedule_order():
+    """Verify timers due on one frame fire in the order they were scheduled"""
+    wheel = TimerWheel()
+    fired = []
+    for name in 'abc':
+        wheel.schedule(2, fired.append, name)
+
+    wheel.advance()
+    wheel.advance()
+    assert fired == ['a', 'b', 'c']
+
+def test_cancel():
+    """Verify a cancelled timer never fires and cancelling twice is harmless"""
+    wheel = TimerWheel()
+    fired = []
+    timer = wheel.schedule(1, fired.append, 'a')
+
+    wheel.cancel(timer)
+    wheel.cancel(timer)
+    wheel.cancel(None)
+    wheel.advance()
+
+    assert fired == []
+    assert len(wheel) == 0
+    assert not timer.active
+
+def test_callback_can_reschedule():
+    """Verify a callback can schedule its own follow-up (repeating timers)"""
+    wheel = TimerWheel(slots=4)
+    fired = []
+
+    def tick():
+        fired.append(wheel.frame)
+        wheel.schedule(4, tick)
+
+    wheel.schedule(4, tick)
+    for _ in range(12):
+        wheel.advance()
+
+    assert fired == [4, 8, 12]
+
+def test_clear_drops_timers_and_rewinds():
+    """Verify clear cancels everything and resets the frame"""
+    wheel = TimerWheel()
+    fired = []
+    timer = wheel.schedule(2, fired.append, 'a')
+    wheel.advance()
+
+    wheel.clear()
+    for _ in range(5):
+        wheel.advance()
+
+    assert fired == []
+    assert wheel.frame == 5
+    assert not timer.active
+
+@given(st.lists(st.integers(min_value=0, max_value=1000), max_size=30))
+def test_delays_longer_than_the_wheel(delays):
+    """Property: every timer fires once, on frame max(delay, 1), however many revolutions away"""
+    wheel = TimerWheel(slots=16)
+    fired = {}
+    for index, delay in enumerate(delays):
+        wheel.schedule(delay, lambda index=index: fired.setdefault(index, wheel.frame))
+
+    for _ in range(1001):
+        wheel.advance()
+
+    assert fired == {index: max(delay, 1) for index, delay in enumerate(delays)}
+    assert len(wheel) == 0
@@ -0,0 +1,86 @@
+import pytest
+from pacman_game.timing import FixedTimestep, RateMeter
+from pacman_game.simulation import Simulation
+
+def test_steps_follow_elapsed_time():
+    """Verify steps are whole multiples of the step time"""
+    timestep = FixedTimestep(step_rate=60, max_steps=5)
+    assert timestep.advance(0.0) == 0
+    assert timestep.advance(1 / 60) == 1
+    assert timestep.advance(0.5 / 60) == 0
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(0.5 / 60) == 1
+
+def test_slow_frames_run_extra_steps():
+    """Verify a slow render frame is caught up with several steps"""
+    timestep = FixedTimestep(step_rate=60, max_steps=5)
+    assert timestep.advance(3.2 / 60) == 3
+    assert timestep.alpha == pytest.approx(0.2)
+
+def test_catch_up_is_capped():
+    """Edge Case: A long stall runs at most max_steps and drops the rest"""
+    timestep = FixedTimestep(step_rate=60, max_steps=5)
+    assert timestep.advance(2.0) == 5
+    assert timestep.dropped_steps == 115
+    assert 0.0 <= timestep.alpha < 1.0
+    # The backlog is gone, so the next frame is back to normal
+    assert timestep.advance(1 / 60) <= 2
+
+def test_negative_elapsed_ignored():
+    """Edge Case: A clock going backwards does not rewind the accumulator"""
+    timestep = FixedTimestep(step_rate=60, max_steps=5)
+    timestep.advance(0.5 / 60)
+    assert timestep.advance(-1.0) == 0
+    assert timestep.alpha == pytest.approx(0.5)
+
+def test_total_steps_match_wall_clock():
+    """Property check: Uneven frame times add up to the same number of steps"""
+    timestep = FixedTimestep(step_rate=60, max_steps=5)
+    frame_times = [0.007, 0.021, 0.016, 0.040, 0.003, 0.013] * 50
+    steps = sum(timestep.advance(dt) for dt in frame_times)
+    assert steps == int(sum(frame_times) * 60)
+
+def test_interpolated_position():
+    """Verify entities are drawn between their last two simulation positions"""
+    sim = Simulation()
+    for _ in range(10):
+        before = (sim.player.x, sim.player.y)
+        ghosts_before = [(ghost.x, ghost.y) for ghost in sim.ghosts]
+        sim.step((1, 0))
+    player = sim.player
+    assert player.x > before[0]
+    assert (player.prev_x, player.prev_y) == before
+    assert player.interpolated_position(0.0) == before
+    assert player.interpolated_position(1.0) == (player.x, player.y)
+    mid_x, _ = player.interpolated_position(0.5)
+    assert mid_x == pytest.approx((before[0] + player.x) / 2)
+    assert [ghost.interpolated_position(0.0) for ghost in sim.ghosts] == ghosts_before
+
+def test_interpolation_resets_on_respawn_and_restore():
+    """Edge Case: Respawned and restored entities are drawn where they are"""
+    sim = Simulation()
+    snapshot = sim.snapshot()
+    for _ in range(10):
+        sim.step((1, 0))
+    sim.restore(snapshot)
+    for entity in [sim.player] + sim.ghosts:
+        assert entity.interpolated_position(0.0) == (entity.x, entity.y)
+    for _ in range(10):
+        sim.step((1, 0))
+    sim.respawn_entities()
+    for entity in [sim.player] + sim.ghosts:
+        assert entity.interpolated_position(0.0) == (entity.x, entity.y)
+
+def test_rate_meter():
+    """Verify the meter reports events per second once per window"""
+    now = [0.0]
+    meter = RateMeter(window=0.5, clock=lambda: now[0])
+    for _ in range(99):
+        now[0] += 0.001
+        assert meter.add() is False
+    now[0] = 0.5
+    assert meter.add() is True
+    assert meter.rate == pytest.approx(200)
+    assert meter.total == 100
+    now[0] = 1.0
+    assert meter.average() == pytest.approx(100)